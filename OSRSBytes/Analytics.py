@@ -0,0 +1,290 @@
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that features Item Information Lookup, Hiscores, and Market information.
+
+EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
+
+Analytics Module is responsible for market wide calculations: flip margins, Grand Exchange tax, ROI and
+alchemy profit for every item at once.  Each figure is computed a whole column at a time from an
+ItemTable (with NumPy when it is installed), instead of one getter call per item.
+"""
+
+# Generic/Built-in Imports
+import heapq
+import math
+from array import array
+
+from OSRSBytes.ItemTable import ItemTable
+
+# META Data
+__copyright__  = 'Copyright 2023, CFDeadlines'
+__credits__    = ['CFDeadlines (Lead Programmer, Creator)', 'Riley Fitzgibbons (Contributor)']
+__license__    = 'EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)'
+__version__    = '1.3.2'
+__maintainer__ = {
+        'CFDeadlines': 'cookm0803@gmail.com',
+        'Riley Fitz': "rileyfitzgibbons@gmail.com"
+    }
+__email__      = 'cookm0803@gmail.com'
+__status__     = 'Open'
+
+################
+#  Exceptions  #
+################
+class DoNotRunDirectly(Exception):
+    pass
+
+############################
+#  Do not run if __main__  #
+############################
+if __name__ == "__main__":
+    raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
+
+# Grand Exchange tax on the seller: GE_TAX_RATE of the sale price rounded down, at most GE_TAX_CAP per
+# item, and nothing on items sold for less than GE_TAX_FREE_BELOW coins each
+GE_TAX_RATE = 0.02
+GE_TAX_CAP = 5000000
+GE_TAX_FREE_BELOW = 50
+
+# Every High Alchemy cast uses up one nature rune
+NATURE_RUNE_ID = 561
+
+# Item record fields every metric is derived from, read from the ItemTable column of the same name
+# except 'volume' (buy_quantity/sell_quantity on item records)
+INPUT_FIELDS = ('buy_average', 'sell_average', 'volume', 'buy_limit', 'highalch')
+
+# Per item metrics, all floats with nan where an input is missing:
+#   margin        buy_average - sell_average, buying at the low price and selling at the high one
+#   tax           Grand Exchange tax on selling one at buy_average
+#   profit        margin - tax
+#   roi           profit / sell_average
+#   alch_profit   high alchemy value - buy_average - the nature rune's buy_average
+#   limit_profit  profit * buy_limit, the most one buy limit window (4 hours) can make
+METRICS = ('margin', 'tax', 'profit', 'roi', 'alch_profit', 'limit_profit')
+
+NAN = float('nan')
+
+def ge_tax(price):
+    """ge_tax() function
+
+    Returns the Grand Exchange tax paid on selling one item at price.
+    """
+    if price < GE_TAX_FREE_BELOW:
+        return 0
+    return min(math.floor(price * GE_TAX_RATE), GE_TAX_CAP)
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+###################################
+#  START: MarketAnalytics Object  #
+###################################
+class MarketAnalytics(object):
+    """MarketAnalytics Object
+
+    Margins, tax, ROI and alchemy profit for every item of one market snapshot, computed once when
+    the object is created.  Use Items.analytics() rather than creating it yourself; Items keeps one
+    per snapshot.
+
+    Args:
+        table ItemTable: The snapshot to analyse
+    """
+
+    def __init__(self, table: ItemTable):
+        self.table = table
+        self.columns = {}
+        self.nature_rune = None
+        numpy = _numpy()
+        inputs = {}
+        for field in INPUT_FIELDS:
+            values = table.columns[field]
+            # ABSENT and NULL sentinels are both negative
+            if numpy is not None:
+                values = numpy.frombuffer(values, dtype=numpy.int64).astype(float)
+                values[values < 0] = numpy.nan
+            else:
+                values = [value if value >= 0 else NAN for value in values]
+            inputs[field] = values
+
+        row = table.rowForID(NATURE_RUNE_ID)
+        nature_rune = NAN if row is None else float(inputs['buy_average'][row])
+        if nature_rune == nature_rune:
+            self.nature_rune = nature_rune
+
+        if numpy is not None:
+            self.__computeArrays(numpy, inputs, nature_rune)
+        else:
+            self.__computeLists(inputs, nature_rune)
+        self.columns.update(inputs)
+
+    def __computeArrays(self, numpy, inputs, nature_rune):
+        high, low = inputs['buy_average'], inputs['sell_average']
+        margin = high - low
+        tax = numpy.where(high < GE_TAX_FREE_BELOW, 0.0, numpy.minimum(numpy.floor(high * GE_TAX_RATE), GE_TAX_CAP))
+        profit = margin - tax
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            roi = numpy.where(low > 0, profit / low, numpy.nan)
+        # nan propagates through every operation, so missing inputs give nan metrics
+        self.columns.update({
+            'margin': margin,
+            'tax': tax,
+            'profit': profit,
+            'roi': roi,
+            'alch_profit': inputs['highalch'] - high - nature_rune,
+            'limit_profit': profit * inputs['buy_limit'],
+        })
+
+    def __computeLists(self, inputs, nature_rune):
+        high, low = inputs['buy_average'], inputs['sell_average']
+        margin = [h - l for h, l in zip(high, low)]
+        tax = [NAN if h != h else float(ge_tax(h)) for h in high]
+        profit = [m - t for m, t in zip(margin, tax)]
+        self.columns.update({
+            'margin': margin,
+            'tax': tax,
+            'profit': profit,
+            'roi': [p / l if l > 0 else NAN for p, l in zip(profit, low)],
+            'alch_profit': [a - h - nature_rune for a, h in zip(inputs['highalch'], high)],
+            'limit_profit': [p * b for p, b in zip(profit, inputs['buy_limit'])],
+        })
+
+    def column(self, metric: str, asArray: bool = False):
+        """column method
+
+        Returns a whole metric (or input field) column, one float per ItemTable row with nan where it
+        can't be computed.  Row numbers are those of table, e.g. table.names[row].
+
+        Args:
+            metric str: One of METRICS or INPUT_FIELDS
+            asArray bool: Return a NumPy float array instead of an array('d')
+        """
+        values = self.columns[metric]
+        if asArray:
+            numpy = _numpy()
+            if numpy is None:
+                raise ImportError("column(asArray=True) requires NumPy, install it with 'pip install numpy'")
+            return numpy.asarray(values, dtype=float)
+        if isinstance(values, list):
+            return array('d', values)
+        return array('d', values.tolist())
+
+    def item(self, row: int):
+        """item method
+
+        Returns every input field and metric of one row as a dictionary, with None for missing values.
+        """
+        record = {'name': self.table.names[row], 'id': self.table.columns['id'][row], 'members': bool(self.table.members[row])}
+        for field in INPUT_FIELDS + METRICS:
+            value = float(self.columns[field][row])
+            record[field] = None if value != value else value
+        return record
+
+    def alchTable(self, members: bool = None, min_volume: int = 0, asArray: bool = False):
+        """alchTable method
+
+        Returns the High Alchemy profit of every item that can be bought and alched, best first, as
+        columns: {'name', 'id', 'buy_average', 'highalch', 'volume', 'buy_limit', 'alch_profit'}.
+        alch_profit already pays for the nature rune (see nature_rune).  Unknown volumes and buy limits
+        are nan.
+
+        Args:
+            members bool: Only members items (True), only free-to-play items (False) or both (None)
+            min_volume int: Skip items with a lower daily trade volume
+            asArray bool: Return the numeric columns as NumPy float arrays instead of lists
+        """
+        rows, values = self.__rows('alch_profit', members, min_volume, 0)
+        if not isinstance(rows, list):
+            rows = rows[_numpy().lexsort((rows, -values))].tolist()
+        else:
+            rows = [row for value, row in sorted(zip(values, rows), key=lambda pair: (-pair[0], pair[1]))]
+        table = {
+            'name': [self.table.names[row] for row in rows],
+            'id': [self.table.columns['id'][row] for row in rows],
+        }
+        for field in ('buy_average', 'highalch', 'volume', 'buy_limit', 'alch_profit'):
+            values = self.columns[field]
+            table[field] = [float(values[row]) for row in rows]
+        if asArray:
+            numpy = _numpy()
+            if numpy is None:
+                raise ImportError("alchTable(asArray=True) requires NumPy, install it with 'pip install numpy'")
+            for field in ('buy_average', 'highalch', 'volume', 'buy_limit', 'alch_profit'):
+                table[field] = numpy.array(table[field], dtype=float)
+        return table
+
+    def __rows(self, metric, members, min_volume, min_price):
+        """Returns the rows passing the filters with a known value for metric, and those values"""
+        values = self.columns[metric]
+        if not isinstance(values, list):
+            numpy = _numpy()
+            keep = ~numpy.isnan(values)
+            if members is not None:
+                keep &= numpy.frombuffer(self.table.members, dtype=numpy.int8).astype(bool) == bool(members)
+            if min_volume:
+                keep &= self.columns['volume'] >= min_volume
+            if min_price:
+                keep &= self.columns['buy_average'] >= min_price
+            rows = numpy.flatnonzero(keep)
+            return rows, values[rows]
+
+        volume, price, flags = self.columns['volume'], self.columns['buy_average'], self.table.members
+        rows = [
+            row for row, value in enumerate(values)
+            if value == value
+            and (members is None or bool(flags[row]) == bool(members))
+            and (not min_volume or volume[row] >= min_volume)
+            and (not min_price or price[row] >= min_price)
+        ]
+        return rows, [values[row] for row in rows]
+
+    def top(self, metric: str = 'profit', limit: int = 10, members: bool = None, min_volume: int = 0,
+            min_price: int = 0, ascending: bool = False):
+        """top method
+
+        Ranks the items by metric and returns the best limit of them.
+
+        Args:
+            metric str: One of METRICS (or INPUT_FIELDS) to rank by
+            limit int: How many items to return
+            members bool: Only members items (True), only free-to-play items (False) or both (None)
+            min_volume int: Skip items with a lower daily trade volume
+            min_price int: Skip items with a lower buy_average
+            ascending bool: Return the lowest values instead of the highest
+
+        Returns:
+            list: item() dictionaries, best first
+        """
+        if metric not in self.columns:
+            raise ValueError("metric must be one of {}".format(METRICS + INPUT_FIELDS))
+        if limit <= 0:
+            return []
+        rows, values = self.__rows(metric, members, min_volume, min_price)
+        if not isinstance(rows, list):
+            numpy = _numpy()
+            keys = values if ascending else -values
+            if limit < len(rows):
+                best = numpy.argpartition(keys, limit - 1)[:limit]
+            else:
+                best = numpy.arange(len(rows))
+            # Ties are broken by row, like the stdlib path
+            best = best[numpy.lexsort((rows[best], keys[best]))]
+            return [self.item(int(rows[index])) for index in best]
+
+        pairs = zip(values, rows)
+        if ascending:
+            best = heapq.nsmallest(limit, pairs)
+        else:
+            best = heapq.nsmallest(limit, ((-value, row) for value, row in pairs))
+        return [self.item(row) for value, row in best]
+
+    def __len__(self):
+        return len(self.table)
+    #################################
+    #  END: MarketAnalytics Object  #
+    #################################
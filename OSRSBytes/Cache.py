@@ -0,0 +1,436 @@
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that features Item Information Lookup, Hiscores, and Market information.
+
+EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
+
+Cache Module holds the caching layers used by the other modules.  Anything that stores API responses
+so they don't have to be fetched again should go in the Cache Module.
+"""
+
+# Generic/Built-in Imports
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+# META Data
+__copyright__  = 'Copyright 2023, CFDeadlines'
+__credits__    = ['CFDeadlines (Lead Programmer, Creator)', 'Riley Fitzgibbons (Contributor)']
+__license__    = 'EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)'
+__version__    = '1.3.2'
+__maintainer__ = {
+        'CFDeadlines': 'cookm0803@gmail.com',
+        'Riley Fitz': "rileyfitzgibbons@gmail.com"
+    }
+__email__      = 'cookm0803@gmail.com'
+__status__     = 'Open'
+
+################
+#  Exceptions  #
+################
+class DoNotRunDirectly(Exception):
+    pass
+
+############################
+#  Do not run if __main__  #
+############################
+if __name__ == "__main__":
+    raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
+
+#############################
+#  START: DiskCache Object  #
+#############################
+class CacheEntry(object):
+    """CacheEntry Object
+
+    A single cached response: the raw body plus the validators needed to revalidate it.
+    """
+    __slots__ = ('body', 'etag', 'last_modified', 'fetched')
+
+    def __init__(self, body: bytes, etag = None, last_modified = None, fetched = None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched = fetched if fetched is not None else time.time()
+
+    def isFresh(self, ttl):
+        """isFresh method
+
+        Returns True while the entry is younger than ttl seconds.  A ttl of None never expires.
+        """
+        return ttl is None or (time.time() - self.fetched) < ttl
+
+    def validators(self):
+        """validators method
+
+        Returns the conditional request headers (If-None-Match / If-Modified-Since) for this entry.
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class DiskCache(object):
+    """DiskCache Object
+
+    The DiskCache object stores raw API response bodies on disk, one file per key, next to a small
+    JSON file holding the ETag/Last-Modified validators and the time the body was fetched.  Writes
+    go through a temporary file and os.replace(), so a reader never sees a half written body even
+    with several processes sharing the same directory.
+
+    Args:
+        directory str: Directory to keep the cache files in, created if missing
+
+    Example Invocation:
+        cache = DiskCache('~/.cache/osrsbytes')
+        cache.put('mapping', body, etag='"abc"')
+        entry = cache.get('mapping')
+    """
+
+    def __init__(self, directory: str):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __paths(self, key):
+        return (os.path.join(self.directory, "{}.body".format(key)),
+                os.path.join(self.directory, "{}.meta.json".format(key)))
+
+    def __write(self, path, data: bytes):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def get(self, key):
+        """get method
+
+        Returns the CacheEntry stored under key, or None if there is none (or it is unreadable).
+        """
+        body_path, meta_path = self.__paths(key)
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(body, meta.get('etag'), meta.get('last_modified'), meta.get('fetched'))
+
+    def put(self, key, body: bytes, etag = None, last_modified = None):
+        """put method
+
+        Stores body under key along with its validators and returns the new CacheEntry.
+        """
+        entry = CacheEntry(body, etag, last_modified)
+        body_path, meta_path = self.__paths(key)
+        self.__write(body_path, body)
+        self.__writeMeta(meta_path, entry)
+        return entry
+
+    def touch(self, key, entry):
+        """touch method
+
+        Marks an entry as freshly fetched, used after the server answered 304 Not Modified.
+        Only the metadata file is rewritten, the body on disk is still current.
+        """
+        entry.fetched = time.time()
+        self.__writeMeta(self.__paths(key)[1], entry)
+        return entry
+
+    def __writeMeta(self, meta_path, entry):
+        self.__write(meta_path, json.dumps({
+            'etag': entry.etag,
+            'last_modified': entry.last_modified,
+            'fetched': entry.fetched,
+        }).encode())
+    ###########################
+    #  END: DiskCache Object  #
+    ###########################
+
+###############################
+#  START: CachedValue Object  #
+###############################
+class CachedValue(object):
+    """CachedValue Object
+
+    The CachedValue object holds a single JSON serialisable value for ttl seconds, shared by
+    everything in the process that uses it, and optionally persisted to a file so it survives
+    restarts.  getOrFetch() holds a lock while fetching, so many threads asking at once still only
+    cause one fetch.
+
+    Args:
+        ttl float: Seconds the value stays fresh
+        path str: JSON file to persist the value in, None to keep it in memory only
+        retry float: Seconds a stale or default value is used after a failed fetch before
+                     fetching is tried again
+
+    Example Invocation:
+        bosses = CachedValue(86400, '~/.cache/osrsbytes/bosses.json')
+        names = bosses.getOrFetch(scrape_bosses, default=FALLBACK_BOSSES)
+    """
+
+    def __init__(self, ttl: float, path: str = None, retry: float = 300):
+        self.ttl = ttl
+        self.path = path
+        self.retry = retry
+        self.__value = None
+        self.__expires = 0
+        self.__lock = threading.RLock()
+
+    @property
+    def path(self):
+        """path property
+
+        The JSON file the value is persisted in, or None.  Can be changed at any time (e.g.
+        BOSS_LIST_CACHE.path = '~/.cache/osrsbytes/bosses.json'), '~' is expanded and relative
+        paths are made absolute when it is set.
+        """
+        return self.__path
+
+    @path.setter
+    def path(self, path):
+        self.__path = os.path.abspath(os.path.expanduser(path)) if path else None
+
+    def get(self):
+        """get method
+
+        Returns the value while it is fresh, otherwise None.  A fresh copy persisted on disk (for
+        example by another process) is picked up when the in-memory one is missing or stale.
+        """
+        if self.__value is not None and time.time() < self.__expires:
+            return self.__value
+        if self.path:
+            try:
+                with open(self.path, 'r') as f:
+                    stored = json.load(f)
+                if time.time() < stored['fetched'] + self.ttl:
+                    self.__value = stored['value']
+                    self.__expires = stored['fetched'] + self.ttl
+                    return self.__value
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        return None
+
+    def set(self, value):
+        """set method
+
+        Stores a freshly fetched value, writing it to disk as well when a path is configured.
+        """
+        fetched = time.time()
+        with self.__lock:
+            self.__value = value
+            self.__expires = fetched + self.ttl
+        if self.path:
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'fetched': fetched, 'value': value}, f)
+            os.replace(tmp, self.path)
+        return value
+
+    def stale(self, default):
+        """stale method
+
+        Called after a failed fetch.  Returns the last known value (or default if there never was
+        one) and keeps using it for retry seconds before the next fetch attempt.
+        """
+        with self.__lock:
+            if self.__value is None:
+                self.__value = default
+            self.__expires = time.time() + self.retry
+            return self.__value
+
+    def getOrFetch(self, fetch, default = None):
+        """getOrFetch method
+
+        Returns the fresh value, calling fetch() to refresh it when needed.  If fetch() raises,
+        the stale value (or default) is returned instead.
+        """
+        value = self.get()
+        if value is not None:
+            return value
+        with self.__lock:
+            value = self.get()
+            if value is not None:
+                return value
+            try:
+                return self.set(fetch())
+            except Exception:
+                return self.stale(default)
+    #############################
+    #  END: CachedValue Object  #
+    #############################
+
+#################################
+#  START: ResponseCache Objects #
+#################################
+class ResponseCache(object):
+    """ResponseCache Object
+
+    Base of the keyed response caches.  Entries expire ttl seconds after they were stored and the
+    least recently used entries are evicted once there are more than max_entries.  Every get()
+    counts as a hit or a miss, see stats().
+
+    Args:
+        ttl float: Seconds an entry stays valid, defaults to 3600 (1 hour)
+        max_entries int: Maximum number of entries kept
+    """
+
+    def __init__(self, ttl: float = 3600, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def stats(self):
+        """stats method
+
+        Returns a dictionary with the hits, misses and current number of entries.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self)}
+
+    def _count(self, value):
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+
+class MemoryCache(ResponseCache):
+    """MemoryCache Object
+
+    In-memory ResponseCache, lives as long as the process.
+
+    Example Invocation:
+        cache = MemoryCache(ttl=600, max_entries=5000)
+        account = Hiscores('Zezima', cache=cache)
+    """
+
+    def __init__(self, ttl: float = 3600, max_entries: int = 10000):
+        super().__init__(ttl, max_entries)
+        self.__entries = OrderedDict()
+
+    def get(self, key):
+        """get method
+
+        Returns the value stored under key, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[1] <= time.time():
+                del self.__entries[key]
+                entry = None
+            if entry is not None:
+                self.__entries.move_to_end(key)
+            return self._count(entry[0] if entry else None)
+
+    def set(self, key, value):
+        """set method
+
+        Stores value under key, evicting the least recently used entries if the cache is full.
+        """
+        with self._lock:
+            self.__entries[key] = (value, time.time() + self.ttl)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self.__entries.clear()
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+class SQLiteCache(ResponseCache):
+    """SQLiteCache Object
+
+    Persistent ResponseCache stored in a SQLite database, so entries survive process restarts and
+    can be shared by processes on the same machine.  Keys are stored as strings, values as blobs.
+
+    Args:
+        path str: The database file, created if missing
+        ttl float: Seconds an entry stays valid, defaults to 3600 (1 hour)
+        max_entries int: Maximum number of entries kept
+
+    Example Invocation:
+        cache = SQLiteCache('~/.cache/osrsbytes/hiscores.sqlite')
+        account = Hiscores('Zezima', cache=cache)
+    """
+
+    def __init__(self, path: str, ttl: float = 3600, max_entries: int = 100000):
+        super().__init__(ttl, max_entries)
+        self.path = os.path.abspath(os.path.expanduser(path))
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.__db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.__db.execute("PRAGMA journal_mode=WAL")
+        self.__db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL, used REAL NOT NULL)"
+        )
+        self.__db.execute("CREATE INDEX IF NOT EXISTS responses_used ON responses (used)")
+
+    def get(self, key):
+        """get method
+
+        Returns the value stored under key, or None if it is missing or expired.
+        """
+        key = str(key)
+        now = time.time()
+        with self._lock:
+            row = self.__db.execute("SELECT value, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and row[1] <= now:
+                self.__db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+            if row is not None:
+                self.__db.execute("UPDATE responses SET used = ? WHERE key = ?", (now, key))
+            return self._count(row[0] if row else None)
+
+    def set(self, key, value):
+        """set method
+
+        Stores value under key, evicting the least recently used entries if the cache is full.
+        """
+        now = time.time()
+        with self._lock:
+            self.__db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires, used) VALUES (?, ?, ?, ?)",
+                (str(key), value, now + self.ttl, now),
+            )
+            overflow = len(self) - self.max_entries
+            if overflow > 0:
+                self.__db.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY used LIMIT ?)",
+                    (overflow,),
+                )
+
+    def clear(self):
+        with self._lock:
+            self.__db.execute("DELETE FROM responses")
+
+    def close(self):
+        self.__db.close()
+
+    def __len__(self):
+        return self.__db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+    ###############################
+    #  END: ResponseCache Objects #
+    ###############################
@@ -0,0 +1,98 @@
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that features Item Information Lookup, Hiscores, and Market information.
+
+EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
+
+Experience Module holds the level <-> experience math.  The table is computed once at import and
+every lookup is a table read or a binary search, so it is cheap enough to call in bulk.
+
+Usable with:
+    from OSRSBytes import level_for_xp, xp_for_level, xp_to_level
+    print(level_for_xp(13034431)) # 99
+"""
+
+# Generic/Built-in Imports
+import math
+from bisect import bisect_right
+
+# META Data
+__copyright__  = 'Copyright 2023, CFDeadlines'
+__credits__    = ['CFDeadlines (Lead Programmer, Creator)', 'Riley Fitzgibbons (Contributor)']
+__license__    = 'EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)'
+__version__    = '1.3.2'
+__maintainer__ = {
+        'CFDeadlines': 'cookm0803@gmail.com',
+        'Riley Fitz': "rileyfitzgibbons@gmail.com"
+    }
+__email__      = 'cookm0803@gmail.com'
+__status__     = 'Open'
+
+################
+#  Exceptions  #
+################
+class DoNotRunDirectly(Exception):
+    pass
+
+class LevelError(Exception):
+    pass
+
+############################
+#  Do not run if __main__  #
+############################
+if __name__ == "__main__":
+    raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
+
+MAX_LEVEL = 99
+MAX_VIRTUAL_LEVEL = 126
+MAX_EXPERIENCE = 200000000
+
+def _buildTable():
+    table = [0, 0]
+    points = 0
+    for level in range(1, MAX_VIRTUAL_LEVEL):
+        points += math.floor(level + 300 * (2 ** (level / 7.0)))
+        table.append(math.floor(points / 4))
+    return tuple(table)
+
+# XP_TABLE[level] is the experience needed for level, for levels 1 to 126 (virtual levels
+# included).  XP_TABLE[0] is a placeholder so the table can be indexed by level directly.
+XP_TABLE = _buildTable()
+
+def xp_for_level(level: int):
+    """xp_for_level() function
+
+    Returns the experience needed to reach level (1-126).
+
+    Raises:
+        LevelError: level is outside 1-126
+    """
+    if not 1 <= level <= MAX_VIRTUAL_LEVEL:
+        raise LevelError("level must be between 1 and {}, got {}".format(MAX_VIRTUAL_LEVEL, level))
+    return XP_TABLE[level]
+
+def level_for_xp(xp: int, virtual: bool = False):
+    """level_for_xp() function
+
+    Returns the level reached with xp experience.  Levels stop at 99 like they do in-game unless
+    virtual is True, in which case they go up to 126.
+    """
+    level = max(bisect_right(XP_TABLE, xp, 1) - 1, 1)
+    return level if virtual else min(level, MAX_LEVEL)
+
+def xp_to_level(xp: int, target: int):
+    """xp_to_level() function
+
+    Returns the experience still needed to get from xp to the target level, 0 if already there.
+    """
+    return max(xp_for_level(target) - xp, 0)
+
+def levels_for_xp(xps, virtual: bool = False):
+    """levels_for_xp() function
+
+    Bulk form of level_for_xp(), returns a list with the level for every experience value.
+    """
+    cap = MAX_VIRTUAL_LEVEL if virtual else MAX_LEVEL
+    return [min(max(bisect_right(XP_TABLE, xp, 1) - 1, 1), cap) for xp in xps]
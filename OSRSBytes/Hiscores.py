@@ -11,12 +11,12 @@ Changes that involve modifications to player based information should go in the
 """
 
 # Generic/Built-in Imports
-import http.client
-import math
-import os
-import time
+import asyncio
+import concurrent.futures
 
-from OSRSBytes.Utilities import Utilities
+from OSRSBytes.Cache import CachedValue, MemoryCache
+from OSRSBytes.Snapshot import BOUNTY_HUNTER, CLUE_TIERS, LMS_ARENA_SW, SKILLS, PlayerSnapshot
+from OSRSBytes.Transport import DEFAULT_ASYNC_TRANSPORT, DEFAULT_TRANSPORT, RateLimiter, Response
 
 # META Data
 __copyright__  = 'Copyright 2023, CFDeadlines'
@@ -61,6 +61,156 @@ class BountyError(Exception):
 if __name__ == "__main__":
     raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
 
+# Hiscores table for each account type
+ACCOUNT_TYPES = {
+    'N': 'hiscore_oldschool',
+    'IM': 'hiscore_oldschool_ironman',
+    'UIM': 'hiscore_oldschool_ultimate',
+    'HIM': 'hiscore_oldschool_hardcore_ironman',
+}
+
+BOSS_LIST_URL = "https://secure.runescape.com/m=hiscore_oldschool/overall?category_type=1&table=16&user=hanannie"
+
+# Boss list (in hiscores order) used whenever the boss list can't be scraped.  Bosses are only
+# added with game updates, so this only has to be refreshed when new ones appear.
+FALLBACK_BOSSES = (
+    "rifts_closed",
+    "abyssal_sire",
+    "alchemical_hydra",
+    "artio",
+    "barrows_chests",
+    "bryophyta",
+    "callisto",
+    "calvarion",
+    "cerberus",
+    "chambers_of_xeric",
+    "chambers_of_xeric_challenge_mode",
+    "chaos_elemental",
+    "chaos_fanatic",
+    "commander_zilyana",
+    "corporeal_beast",
+    "crazy_archaeologist",
+    "dagannoth_prime",
+    "dagannoth_rex",
+    "dagannoth_supreme",
+    "deranged_archaeologist",
+    "duke_sucellus",
+    "general_graardor",
+    "giant_mole",
+    "grotesque_guardians",
+    "hespori",
+    "kalphite_queen",
+    "king_black_dragon",
+    "kraken",
+    "kreearra",
+    "kril_tsutsaroth",
+    "mimic",
+    "nex",
+    "nightmare",
+    "phosanis_nightmare",
+    "obor",
+    "phantom_muspah",
+    "sarachnis",
+    "scorpia",
+    "skotizo",
+    "spindel",
+    "tempoross",
+    "the_gauntlet",
+    "the_corrupted_gauntlet",
+    "the_leviathan",
+    "the_whisperer",
+    "theatre_of_blood",
+    "theatre_of_blood_hard_mode",
+    "thermonuclear_smoke_devil",
+    "tombs_of_amascut",
+    "tombs_of_amascut_expert",
+    "tzkal_zuk",
+    "tztok_jad",
+    "vardorvis",
+    "venenatis",
+    "vetion",
+    "vorkath",
+    "wintertodt",
+    "zalcano",
+    "zulrah",
+)
+
+# Process wide boss list cache shared by every Hiscores lookup.  Set BOSS_LIST_CACHE.ttl to change
+# how long a scraped list is trusted, or BOSS_LIST_CACHE.path to persist it across restarts.
+BOSS_LIST_CACHE = CachedValue(ttl=86400)
+
+# Response cache used by Hiscores(..., cache=True)
+HISCORES_CACHE = MemoryCache(ttl=3600)
+
+def hiscoresURL(username: str, actype: str = 'N'):
+    """hiscoresURL() function
+
+    Returns the index_lite.ws url for a player, or None if actype is not a known account type.
+    """
+    table = ACCOUNT_TYPES.get(actype.upper())
+    if table is None:
+        return None
+    return "https://secure.runescape.com/m={}/index_lite.ws?player={}".format(table, username.lower().replace(' ','%20'))
+
+def parse_index_lite(text: str, bosses = ()):
+    """parse_index_lite() function
+
+    Parses an index_lite.ws response in a single forward pass over its lines, driven by
+    INDEX_LITE_LAYOUT.  This needs no Hiscores object, so bulk and async lookups (and benchmarks)
+    can call it directly.  Use PlayerSnapshot.fromIndexLite() for the compact form.
+
+    Args:
+        text str: The decoded response body
+        bosses list: Boss names in hiscores order, see parse_boss_list()
+
+    Returns:
+        dict: {'stats': {...}, 'bounties': {...}, 'clues': {...}, 'lms_arenas_sw': {...},
+               'bosses': {...}}, each keyed by entry name exactly like the matching Hiscores
+               attribute is for a single user.  Sections stop early if the response is shorter
+               than the layout.
+    """
+    return PlayerSnapshot.fromIndexLite(text, bosses).asDicts()
+
+def parse_boss_list(html: bytes):
+    """parse_boss_list() function
+
+    Scrapes the boss names, in hiscores order, out of the HTML of the activity hiscores page
+    at BOSS_LIST_URL.
+
+    Args:
+        html bytes: The raw page body
+
+    Returns:
+        list: The boss names, e.g. ['abyssal_sire', 'alchemical_hydra', ...]
+    """
+    response = str(html)
+    split_response = response.split('<span style="color: #d9c27e;display: block;text-align: center;">----</span>')[1]
+    split_response = split_response.split("</div>")[0]
+    boss_list_unsanitized = split_response.split("\\n")
+    boss_list_unsanitized = boss_list_unsanitized[15:]
+    bosses = []
+    for boss in boss_list_unsanitized:
+        if boss:
+            bosses.append(boss.split("activity-link ",1)[1].split("\">",1)[0])
+    return bosses
+
+def fetch_boss_list(transport = None):
+    """fetch_boss_list() function
+
+    Scrapes a fresh boss list from BOSS_LIST_URL, over transport (DEFAULT_TRANSPORT if None).
+
+    Raises:
+        HiscoresError: The page no longer has the expected layout
+    """
+    page = (transport if transport is not None else DEFAULT_TRANSPORT).request(BOSS_LIST_URL)
+    try:
+        bosses = parse_boss_list(page.body)
+    except IndexError:
+        bosses = None
+    if page.status != 200 or not bosses:
+        raise HiscoresError("Could not scrape the boss list from {} (HTTP {})".format(BOSS_LIST_URL, page.status))
+    return bosses
+
 ############################
 #  START: Hiscores Object  #
 ############################
@@ -84,6 +234,14 @@ class Hiscores(object):
         actype   str: The account type of the account that
                       you want to lookup.  If not supplied
                   this argument defaults to 'N' Normal.
+        cache        : Caches responses keyed by (username, actype).
+                       True uses the shared in-memory HISCORES_CACHE
+                       (TTL 3600 seconds), or pass your own MemoryCache
+                       or SQLiteCache.  Disabled by default.
+        transport    : The transport requests go through, defaults to
+                       the shared pooled DEFAULT_TRANSPORT.  Pass a
+                       ReplayTransport to look players up from recorded
+                       responses (see the Transport module).
 
     Returns:
         This object returns nothing.  Instead it sets the
@@ -95,11 +253,63 @@ class Hiscores(object):
         account = Hiscores('Zezima', 'N')
         print(account.stats['attack']['level']) # displays attack level
     """
-    def __init__(self, username: str, actype='N'):
+    def __init__(self, username: str, actype='N', cache = None, transport = None):
         self.username = username.lower()
         self.accountType = actype.upper()
+        self.cache = HISCORES_CACHE if cache is True else (None if cache is False else cache)
+        self.__transport = transport if transport is not None else DEFAULT_TRANSPORT
         self.__getHTTPResponse()
 
+    @classmethod
+    def fetch_many(cls, usernames, actype='N', max_workers: int = 8, rate_limit: float = None, cache = None,
+                   transport = None):
+        """fetch_many() method
+
+        The fetch_many() method looks up many players at once.  Lookups run concurrently on up to
+        max_workers threads that share the pooled keep-alive connections of the transport, and
+        results are yielded as soon as each one completes, so one slow or missing player never
+        holds up the rest of the batch.
+
+        Args:
+            usernames list: The usernames to look up
+            actype str: The account type shared by every username, defaults to 'N' Normal
+            max_workers int: Maximum number of lookups in flight at once
+            rate_limit float: Maximum number of lookups started per second, None for no limit
+            cache: Response cache shared by every lookup, see Hiscores
+            transport: Transport shared by every lookup, see Hiscores
+
+        Returns:
+            A generator of (username, result) tuples in completion order.  result is the Hiscores
+            object for that player, or the exception that stopped the lookup (a HiscoresError for
+            players that were not found).
+
+        Example Invocation:
+            from OSRSBytes import Hiscores
+            results = dict(Hiscores.fetch_many(['Zezima', 'Lynx Titan'], max_workers=4, rate_limit=10))
+        """
+        limiter = RateLimiter(rate_limit) if rate_limit else None
+
+        def lookup(username):
+            if limiter:
+                limiter.wait()
+            player = cls(username, actype, cache, transport)
+            if player.status != 200:
+                raise HiscoresError("Error occurred: {}".format(player.errorMsg))
+            return player
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        futures = {executor.submit(lookup, username): username for username in usernames}
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    yield futures[future], future.result()
+                except Exception as err:
+                    yield futures[future], err
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def __getHTTPResponse(self):
         """getHTTPResponse() method
 
@@ -118,23 +328,49 @@ class Hiscores(object):
                                     of whether or not the query to the API returned
                         successfully or not.
         """
-        conn = http.client.HTTPSConnection('secure.runescape.com')
-        if self.accountType == 'N':
-            conn.request("GET", "/m=hiscore_oldschool/index_lite.ws?player={}".format(self.username.replace(' ','%20')))
-            self.response = conn.getresponse()
-            self.status = self.response.status
-        elif self.accountType == 'IM':
-            conn.request("GET", "/m=hiscore_oldschool_ironman/index_lite.ws?player={}".format(self.username.replace(' ','%20')))
-            self.response = conn.getresponse()
-            self.status = self.response.status
-        elif self.accountType == "UIM":
-            conn.request("GET", "/m=hiscore_oldschool_ultimate/index_lite.ws?player={}".format(self.username.replace(' ','%20')))
-            self.response = conn.getresponse()
-            self.status = self.response.status
-        elif self.accountType == "HIM":
-            conn.request("GET", "/m=hiscore_oldschool_hardcore_ironman/index_lite.ws?player={}".format(self.username.replace(' ','%20')))
-            self.response = conn.getresponse()
-            self.status = self.response.status
+        url = hiscoresURL(self.username, self.accountType)
+        response = self._cachedResponse()
+        if response is None and url:
+            response = self.__transport.request(url)
+            self._storeResponse(response)
+        self._loadResponse(response)
+
+    def _cachedResponse(self):
+        """_cachedResponse() method
+
+        Returns the cached index_lite response for this player as a Response, or None when
+        caching is disabled or nothing valid is cached.
+        """
+        if self.cache is None:
+            return None
+        body = self.cache.get((self.username, self.accountType))
+        return Response(200, {}, body) if body is not None else None
+
+    def _storeResponse(self, response):
+        """_storeResponse() method
+
+        Caches a successful index_lite response for this player.
+        """
+        if self.cache is not None and response.status == 200:
+            self.cache.set((self.username, self.accountType), response.body)
+
+    def _loadResponse(self, response, bosses = None):
+        """_loadResponse() method
+
+        Stores an index_lite response that has already been fetched and processes it.  This is
+        the point where fetching ends and parsing starts, so clients that fetch some other way
+        (see AsyncHiscores) go through the exact same parsing.
+
+        Args:
+            response Response: The transport response, None for an unknown account type
+            bosses list: The boss list to parse against, fetched when not supplied
+
+        Returns:
+            None
+        """
+        self.response = response
+        self.status = response.status if response else None
+        self.__bosses = bosses
         self.__processResponse()
 
     def __processResponse(self):
@@ -161,211 +397,59 @@ class Hiscores(object):
             self.errorMsg = "Player name given not found in account type provided.  Valid account types are, 'N' (Normal), 'IM' (Iron Man), 'UIM' (Ultimate Iron Man), 'HIM' (Hardcore Iron Man)"
             self.error()
         else:
-            self.data = self.response.read().decode('ascii')
+            self.data = self.response.body.decode('ascii')
             self.__parseData()
 
-    def __parseSkills(self):
-        subset = {}
-        # Totals
-        info = {}
-        
-        # Split data into lists
-        for value in self.data.split(" "):
-            total_info = value.split(",")
-            
-            # assign into dictionary
-            info['rank'] = total_info[0]
-            info['level'] = total_info[1]
-            info['experience'] = total_info[2]
-            break
-            
-        subset['total'] = info
-            
-        self.__skills = [
-                'attack',
-                'defense',
-                'strength',
-                'hitpoints',
-                'ranged',
-                'prayer',
-                'magic',
-                'cooking',
-                'woodcutting',
-                'fletching',
-                'fishing',
-                'firemaking',
-                'crafting',
-                'smithing',
-                'mining',
-                'herblore',
-                'agility',
-                'thieving',
-                'slayer',
-                'farming',
-                'runecrafting',
-                'hunter',
-                'construction'
-        ]
-
-        for skill in self.__skills:
-            for item in self.__parsed_data:
-                info_list = item.split(",")
-                info = {}
-                info['rank'] = int(info_list[0])
-                info['level'] = int(info_list[1])
-                info['experience'] = int(info_list[2])
-
-                # calculate xp to next level
-                level = info['level'] + 1
-                
-                # If 200M XP, set next level and exp to next to 0
-                if (int(info['experience']) == 200000000):
-                    info['next_level_exp'] = 0
-                    info['exp_to_next_level'] = 0
-                else:
-                    info['next_level_exp'] = math.floor(sum((math.floor(level + 300 * (2 ** (level / 7.0))) for level in range(1, level)))/4)
-                    info['exp_to_next_level'] = int(info['next_level_exp'] - info['experience'])
-                    
-                subset[skill] = info
-                self.__parsed_data.remove(item)
-                break
-
-        self.stats[self.username] = subset
-
-    def __parseBountyHunter(self):
-        subset = {}
-        self.__bounty_ranks = [
-            "hunter",
-            "rogue",
-            "hunter_legacy",
-            "rogue_legacy"
-        ]
-
-        for bounty in self.__bounty_ranks:
-            for item in self.__parsed_data:
-                info_list = item.split(",")
-                info = {}
-                info["rank"] = int(info_list[0])
-                info["score"] = int(info_list[1])
-                subset[bounty] = info
-                self.__parsed_data.remove(item)
-                break
-
-        self.bounties[self.username] = subset
-
-
-    def __parseClues(self):
-        subset = {}
-        self.__clue_tiers = [
-            "all",
-            "beginner",
-            "easy",
-            "medium",
-            "hard",
-            "elite",
-            "master"
-        ]
-        for clue in self.__clue_tiers:
-            for item in self.__parsed_data:
-                info_list = item.split(",")
-                info = {}
-                info["rank"] = int(info_list[0])
-                info["score"] = int(info_list[1])
-                subset[clue] = info
-                self.__parsed_data.remove(item)
-                break
-
-        self.clues[self.username] = subset
-
-    def __parseLMS(self):
-        subset = {}
-
-        # I partake in none of this so if someone wants to clear this up
-        # please feel free to
-        self.__lms_arena_stuff = [
-            "lms_rank",
-            "pvp_arena_rank",
-            "soul_wars_zeal"
-        ]
-
-        for activity in self.__lms_arena_stuff:
-            for item in self.__parsed_data:
-                info_list = item.split(",")
-                info = {}
-                info["rank"] = int(info_list[0])
-                info["score"] = int(info_list[1])
-                subset[activity] = info
-                self.__parsed_data.remove(item)
-                break
-
-        self.lms_arenas_sw[self.username] = subset
-
     def __getBossList(self):
         """__getBossList() method
     
         This method functions by getting the HTML of the actual OSRS stat page for a
         specific user and under a specific category and table type that'll show all
         bosses as they are added.  This, in itself, should eliminate the need to 
-        manually update bosses.  
+        manually update bosses.  The scraped list is kept in BOSS_LIST_CACHE, so the page
+        is only fetched once per TTL for the whole process, and FALLBACK_BOSSES is used
+        when it can't be scraped.
         """
-        uri = "secure.runescape.com"
-        endpoint = "/m=hiscore_oldschool/overall?category_type=1&table=16&user=hanannie"
-        conn = http.client.HTTPSConnection(uri)
-        conn.request("GET", endpoint)
-        response = conn.getresponse()
-        response = str(response.read())
-        split_response = response.split('<span style="color: #d9c27e;display: block;text-align: center;">----</span>')[1]
-        split_response = split_response.split("</div>")[0]
-        boss_list_unsanitized = split_response.split("\\n")
-        boss_list_unsanitized = boss_list_unsanitized[15:]
-        bosses = []
-        for boss in boss_list_unsanitized:
-            if boss:
-                bosses.append(boss.split("activity-link ",1)[1].split("\">",1)[0])
-        return bosses
-
-
-    def __parseBosses(self):
-        subset = {}
-
-        self.__bosses = self.__getBossList()
-
-        for boss in self.__bosses:
-            for item in self.__parsed_data:
-                info_list = item.split(",")
-                info = {}
-                info["rank"] = int(info_list[0])
-                info["score"] = int(info_list[1])
-                subset[boss] = info
-                self.__parsed_data.remove(item)
-                break
-
-        self.bosses[self.username] = subset
-
+        return BOSS_LIST_CACHE.getOrFetch(lambda: fetch_boss_list(self.__transport), FALLBACK_BOSSES)
 
     def __parseData(self):
-        self.stats = {}
-        self.bounties = {}
-        self.clues = {}
-        self.lms_arenas_sw = {}
+        if self.__bosses is None:
+            self.__bosses = self.__getBossList()
+        self.__skills = SKILLS
+        self.__bounty_ranks = BOUNTY_HUNTER
+        self.__clue_tiers = CLUE_TIERS
+        self.__lms_arena_stuff = LMS_ARENA_SW
         self.raids = {}
-        self.bosses = {}
+        self.snapshot = PlayerSnapshot.fromIndexLite(self.data, self.__bosses, self.username, self.accountType)
+        self.__sections = {}
+
+    def __section(self, section):
+        """Returns the dictionary of one section, built from self.snapshot on first use and then kept"""
+        if section not in self.__sections:
+            self.__sections[section] = {self.username: self.snapshot.section(section)}
+        return self.__sections[section]
 
-        # Prep data for parsing
-        self.__parsed_data = self.data.split("\n")
-        self.__parsed_data.pop(0) # remove totals section
+    # The per-section dictionaries are only built from self.snapshot when they are first read, so
+    # players that are only queried through skill()/boss()/... keep just the compact snapshot.
+    @property
+    def stats(self):
+        return self.__section('stats')
 
-        self.__parseSkills()
+    @property
+    def bounties(self):
+        return self.__section('bounties')
 
-        # Skip over unused values for most people
-        self.__parsed_data.pop(0) # Skip over "unknown" (open issue if you know it)
-        self.__parsed_data.pop(0) # Needed to add another of these for some reason?
+    @property
+    def clues(self):
+        return self.__section('clues')
 
-        self.__parseBountyHunter()
-        self.__parseClues()
-        self.__parseLMS()
-        self.__parseBosses()
+    @property
+    def lms_arenas_sw(self):
+        return self.__section('lms_arenas_sw')
 
+    @property
+    def bosses(self):
+        return self.__section('bosses')
 
     def skill(self, skill, stype: str = 'level'):
         """skill() method
@@ -386,13 +470,14 @@ class Hiscores(object):
             self.stats[skill][stype] (int): The info you requested
 
         """
-        try:
-            if stype.lower() not in ['rank','level','experience','exp_to_next_level']:
-                raise SkillError("stype must be 'rank','level', or experience'")
-            else:
-                return self.stats[self.username][skill.lower()][stype.lower()]
-        except KeyError as KE:
-            raise SkillError("ERROR: skill {} does not exist".format(KE))
+        if stype.lower() not in ['rank','level','experience','exp_to_next_level']:
+            raise SkillError("stype must be 'rank','level', or experience'")
+        entry = self.snapshot.skill(skill.lower())
+        if entry is None or (skill.lower() == 'total' and stype.lower() == 'exp_to_next_level'):
+            raise SkillError("ERROR: skill {} does not exist".format(repr(skill.lower())))
+        if skill.lower() == 'total':
+            return str(getattr(entry, stype.lower()))
+        return getattr(entry, stype.lower())
 
     def clue(self, clue_tier, clue_type: str = 'score'):
         """clue() method
@@ -409,13 +494,12 @@ class Hiscores(object):
         Returns:
             self.clues[username][clue_tier][clue_type] (int)
         """
-        try:
-            if clue_type.lower() not in ["rank","score"]:
-                raise ClueError("clue_type must be 'rank' or 'score'")
-            else:
-                return self.clues[self.username][clue_tier.lower()][clue_type.lower()]
-        except KeyError as KE:
-            raise ClueError("ERROR: clue {} does not exist".format(KE))
+        if clue_type.lower() not in ["rank","score"]:
+            raise ClueError("clue_type must be 'rank' or 'score'")
+        entry = self.snapshot.activity('clues', clue_tier.lower())
+        if entry is None:
+            raise ClueError("ERROR: clue {} does not exist".format(repr(clue_tier.lower())))
+        return getattr(entry, clue_type.lower())
 
     def bounty(self, bounty, bounty_type: str = 'score'):
         """bounty() method
@@ -433,31 +517,28 @@ class Hiscores(object):
         Returns:
             self.bounties[username][bounty_tier][bounty_type] (int)
         """
-        try:
-            if bounty_type.lower() not in ["rank","score"]:
-                raise BountyError("bounty_type must be 'rank' or 'score'")
-            else:
-                return self.bounties[self.username][bounty.lower()][bounty_type.lower()]
-        except KeyError as KE:
-            raise BountyError("ERROR: bounty {} does not exist".format(KE))
+        if bounty_type.lower() not in ["rank","score"]:
+            raise BountyError("bounty_type must be 'rank' or 'score'")
+        entry = self.snapshot.activity('bounties', bounty.lower())
+        if entry is None:
+            raise BountyError("ERROR: bounty {} does not exist".format(repr(bounty.lower())))
+        return getattr(entry, bounty_type.lower())
 
     def lms_arena_sw(self, activity_type, info_type: str = 'score'):
-        try:
-            if info_type.lower() not in ["rank","score"]:
-                raise LMSArenaError("info_type must be 'rank' or 'score'")
-            else:
-                return self.lms_arenas_sw[self.username][activity_type.lower()][info_type.lower()]
-        except KeyError as KE:
-            raise LMSArenaError("ERROR: activity_type does not exist".format(KE))
+        if info_type.lower() not in ["rank","score"]:
+            raise LMSArenaError("info_type must be 'rank' or 'score'")
+        entry = self.snapshot.activity('lms_arenas_sw', activity_type.lower())
+        if entry is None:
+            raise LMSArenaError("ERROR: activity_type does not exist")
+        return getattr(entry, info_type.lower())
 
     def boss(self, boss_name, info_type: str = 'score'):
-        try:
-            if info_type.lower() not in ["rank","score"]:
-                raise BossError("info_type must be 'rank' or 'score'")
-            else:
-                return self.bosses[self.username][boss_name.lower()][info_type.lower()]
-        except KeyError as KE:
+        if info_type.lower() not in ["rank","score"]:
+            raise BossError("info_type must be 'rank' or 'score'")
+        entry = self.snapshot.activity('bosses', boss_name.lower())
+        if entry is None:
             raise BossError("ERROR: boss_name does not exist")
+        return getattr(entry, info_type.lower())
 
     def error(self):
         HiscoresError("Error occurred: {}".format(self.errorMsg))
@@ -487,3 +568,70 @@ class Hiscores(object):
     def getBossGenerator(self):
         for boss in self.__bosses:
             yield boss
+
+#################################
+#  START: AsyncHiscores Object  #
+#################################
+class AsyncHiscores(Hiscores):
+    """AsyncHiscores class
+
+    The asyncio counterpart of Hiscores.  Construction doesn't fetch anything, awaiting the object
+    (or its update() method) fetches the player, and the boss list when BOSS_LIST_CACHE has none,
+    concurrently over a non-blocking transport and parses them exactly like Hiscores does.  Every
+    accessor is inherited unchanged.
+
+    Args:
+        username str: The username of the account to look up
+        actype str: The account type, defaults to 'N' Normal
+        cache: Response cache, see Hiscores
+        transport AsyncHTTPTransport: The transport to use, defaults to the shared one whose
+                                      semaphore bounds concurrency across all async clients.
+
+    Example Invocation:
+        from OSRSBytes import AsyncHiscores
+        account = await AsyncHiscores('Zezima')
+        print(account.skill('attack', 'level'))
+    """
+    def __init__(self, username: str, actype='N', cache = None, transport = None):
+        self.username = username.lower()
+        self.accountType = actype.upper()
+        self.cache = HISCORES_CACHE if cache is True else (None if cache is False else cache)
+        self.__transport = transport if transport else DEFAULT_ASYNC_TRANSPORT
+
+    def __await__(self):
+        return self.update().__await__()
+
+    async def update(self):
+        """update() method
+
+        Fetches the player's hiscores again without blocking the event loop.  Returns the object
+        itself so that construction can be awaited.
+        """
+        url = hiscoresURL(self.username, self.accountType)
+        if url is None:
+            self._loadResponse(None)
+            return self
+        response = self._cachedResponse()
+        bosses = BOSS_LIST_CACHE.get()
+        if response is None and bosses is None:
+            response, bosses = await asyncio.gather(self.__transport.request(url), self.__fetchBossList())
+        elif response is None:
+            response = await self.__transport.request(url)
+        elif bosses is None:
+            bosses = await self.__fetchBossList()
+        self._storeResponse(response)
+        self._loadResponse(response, bosses)
+        return self
+
+    async def __fetchBossList(self):
+        try:
+            page = await self.__transport.request(BOSS_LIST_URL)
+            bosses = parse_boss_list(page.body) if page.status == 200 else None
+        except Exception:
+            bosses = None
+        if not bosses:
+            return BOSS_LIST_CACHE.stale(FALLBACK_BOSSES)
+        return BOSS_LIST_CACHE.set(bosses)
+    ###############################
+    #  END: AsyncHiscores Object  #
+    ###############################
@@ -0,0 +1,442 @@
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that features Item Information Lookup, Hiscores, and Market information.
+
+EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
+
+History Module is responsible for keeping item prices over time.  Anything that stores or aggregates
+prices across more than one market snapshot (trends, averages, VWAP) should go in the History Module.
+"""
+
+# Generic/Built-in Imports
+import json
+import math
+import operator
+import os
+import sys
+import threading
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, compress
+
+from OSRSBytes.Transport import DEFAULT_TRANSPORT, TransportError
+
+# META Data
+__copyright__  = 'Copyright 2023, CFDeadlines'
+__credits__    = ['CFDeadlines (Lead Programmer, Creator)', 'Riley Fitzgibbons (Contributor)']
+__license__    = 'EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)'
+__version__    = '1.3.2'
+__maintainer__ = {
+        'CFDeadlines': 'cookm0803@gmail.com',
+        'Riley Fitz': "rileyfitzgibbons@gmail.com"
+    }
+__email__      = 'cookm0803@gmail.com'
+__status__     = 'Open'
+
+################
+#  Exceptions  #
+################
+class DoNotRunDirectly(Exception):
+    pass
+
+class HistoryError(Exception):
+    """HistoryError Exception
+
+    This exception is raised when price history could not be fetched from the wiki or a saved
+    history file could not be read.
+    """
+    pass
+
+############################
+#  Do not run if __main__  #
+############################
+if __name__ == "__main__":
+    raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
+
+WIKI_HISTORY_URL = 'https://prices.runescape.wiki/api/v1/osrs/'
+
+# Averaged endpoints of the wiki, see fetch()
+TIMESTEPS = ('5m', '1h', '6h', '24h')
+
+# (column, typecode) of every PriceSeries.  Missing prices are nan, missing volumes 0.
+SERIES_COLUMNS = (
+    ('timestamp', 'q'),
+    ('avg_high', 'd'),
+    ('avg_low', 'd'),
+    ('high_volume', 'q'),
+    ('low_volume', 'q'),
+)
+
+PRICE_FIELDS = ('avg_high', 'avg_low')
+
+NAN = float('nan')
+
+def _price(value):
+    return NAN if value is None else float(value)
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+###############################
+#  START: PriceSeries Object  #
+###############################
+class PriceSeries(object):
+    """PriceSeries Object
+
+    The price points of a single item, one typed array per column (see SERIES_COLUMNS), kept sorted
+    by timestamp.  Points are normally appended; an older point is inserted in place and a point at
+    an existing timestamp replaces it.
+    """
+    __slots__ = tuple(column for column, typecode in SERIES_COLUMNS)
+
+    def __init__(self):
+        for column, typecode in SERIES_COLUMNS:
+            setattr(self, column, array(typecode))
+
+    def add(self, timestamp, avg_high, avg_low, high_volume = 0, low_volume = 0):
+        values = (int(timestamp), _price(avg_high), _price(avg_low), high_volume or 0, low_volume or 0)
+        timestamps = self.timestamp
+        if not timestamps or values[0] > timestamps[-1]:
+            for (column, typecode), value in zip(SERIES_COLUMNS, values):
+                getattr(self, column).append(value)
+            return
+        position = bisect_left(timestamps, values[0])
+        replace = position < len(timestamps) and timestamps[position] == values[0]
+        for (column, typecode), value in zip(SERIES_COLUMNS, values):
+            if replace:
+                getattr(self, column)[position] = value
+            else:
+                getattr(self, column).insert(position, value)
+
+    def window(self, start = None, end = None):
+        """window method
+
+        Returns the (first, stop) row range of the points between start and end (inclusive).
+        """
+        first = 0 if start is None else bisect_left(self.timestamp, start)
+        stop = len(self.timestamp) if end is None else bisect_right(self.timestamp, end)
+        return first, stop
+
+    def __len__(self):
+        return len(self.timestamp)
+    #############################
+    #  END: PriceSeries Object  #
+    #############################
+
+################################
+#  START: PriceHistory Object  #
+################################
+class PriceHistory(object):
+    """PriceHistory Object
+
+    The PriceHistory object keeps a PriceSeries per item ID and answers windowed aggregates over
+    them.  It is filled from three places:
+
+        * Items(history=...) records every update() (the /latest high and low, stamped with the
+          time of the last trade, so an item that didn't trade between updates adds nothing)
+        * fetch('5m'|'1h'|...) records one averaged step for every item, with volumes
+        * fetchTimeseries(itemid) backfills up to 365 steps of one item
+
+    Aggregates use NumPy when it is installed and fall back to the array module otherwise.  Windows
+    are given as unix timestamps and are inclusive; leaving start or end out means unbounded.
+
+    Args:
+        application_name str: Name sent to the wiki in the User-Agent header by fetch()
+        application_contact str: Contact sent to the wiki in the User-Agent header by fetch()
+        timeout float: Timeout in seconds for each wiki request (defaults to the transport's 10s)
+        transport: The transport wiki requests go through, defaults to DEFAULT_TRANSPORT
+
+    Example Invocation:
+        from OSRSBytes import Items, PriceHistory
+        history = PriceHistory()
+        items = Items(history=history)
+        history.fetchTimeseries(1213, '5m')
+        print(history.vwap(1213, start=time.time() - 3600))
+        print(history.rollingMean(1213, 12))
+    """
+
+    def __init__(self, application_name = None, application_contact = None, timeout: float = None, transport = None):
+        self.__application_name = application_name if application_name else "OSRSBytes"
+        self.__application_contact = application_contact if application_contact else "info@osrsbytes.com"
+        self.__timeout = timeout
+        self.__transport = transport if transport is not None else DEFAULT_TRANSPORT
+        self.__lock = threading.RLock()
+        self.series = {}
+
+    def __seriesFor(self, itemid):
+        series = self.series.get(itemid)
+        if series is None:
+            series = self.series[itemid] = PriceSeries()
+        return series
+
+    def add(self, itemid: int, timestamp, avg_high, avg_low, high_volume = 0, low_volume = 0):
+        """add method
+
+        Records a single price point.  Missing (None) prices are kept as nan.
+        """
+        with self.__lock:
+            self.__seriesFor(int(itemid)).add(timestamp, avg_high, avg_low, high_volume, low_volume)
+
+    def recordLatest(self, prices: dict):
+        """recordLatest method
+
+        Records the data of a /latest response ({id: {'high', 'highTime', 'low', 'lowTime'}}).
+        Each point is stamped with the item's most recent trade, points that are not newer than
+        what the series already holds are skipped.
+
+        Returns:
+            int: The number of points recorded
+        """
+        recorded = 0
+        with self.__lock:
+            for itemid, price in prices.items():
+                timestamp = max(price.get('highTime') or 0, price.get('lowTime') or 0)
+                if not timestamp:
+                    continue
+                series = self.__seriesFor(int(itemid))
+                if series.timestamp and timestamp <= series.timestamp[-1]:
+                    continue
+                series.add(timestamp, price.get('high'), price.get('low'))
+                recorded += 1
+        return recorded
+
+    def recordAverages(self, timestamp, data: dict):
+        """recordAverages method
+
+        Records the data of a /5m, /1h, /6h or /24h response ({id: {'avgHighPrice', 'avgLowPrice',
+        'highPriceVolume', 'lowPriceVolume'}}) at timestamp.
+        """
+        with self.__lock:
+            for itemid, step in data.items():
+                self.__seriesFor(int(itemid)).add(
+                    timestamp, step.get('avgHighPrice'), step.get('avgLowPrice'),
+                    step.get('highPriceVolume'), step.get('lowPriceVolume'),
+                )
+
+    def __get(self, path):
+        url = WIKI_HISTORY_URL + path
+        headers = {
+            "User-Agent" : "{} - {}".format(self.__application_name, self.__application_contact)
+        }
+        try:
+            response = self.__transport.request(url, headers, self.__timeout)
+        except TransportError as TE:
+            raise HistoryError("Could not reach {}: {}".format(url, TE)) from TE
+        if response.status != 200:
+            raise HistoryError("{} answered with HTTP {}".format(url, response.status))
+        return json.loads(response.body)
+
+    def fetch(self, timestep: str = '5m', timestamp: int = None):
+        """fetch method
+
+        Fetches one averaged step of every item from the wiki and records it.
+
+        Args:
+            timestep str: One of TIMESTEPS
+            timestamp int: Start of the step to fetch, defaults to the latest complete step
+        Returns:
+            int: The timestamp of the recorded step
+        Raises:
+            HistoryError: The wiki could not be reached
+        """
+        if timestep not in TIMESTEPS:
+            raise ValueError("timestep must be one of {}".format(TIMESTEPS))
+        path = timestep if timestamp is None else "{}?timestamp={}".format(timestep, int(timestamp))
+        payload = self.__get(path)
+        self.recordAverages(payload['timestamp'], payload['data'])
+        return payload['timestamp']
+
+    def fetchTimeseries(self, itemid: int, timestep: str = '5m'):
+        """fetchTimeseries method
+
+        Fetches the wiki timeseries (up to 365 steps) of one item and records every step.
+
+        Returns:
+            int: The number of steps recorded
+        Raises:
+            HistoryError: The wiki could not be reached
+        """
+        if timestep not in TIMESTEPS:
+            raise ValueError("timestep must be one of {}".format(TIMESTEPS))
+        payload = self.__get("timeseries?timestep={}&id={}".format(timestep, int(itemid)))
+        with self.__lock:
+            series = self.__seriesFor(int(itemid))
+            for step in payload['data']:
+                series.add(step['timestamp'], step.get('avgHighPrice'), step.get('avgLowPrice'),
+                           step.get('highPriceVolume'), step.get('lowPriceVolume'))
+        return len(payload['data'])
+
+    def window(self, itemid: int, start = None, end = None, asArray: bool = False):
+        """window method
+
+        Returns every column of an item's points between start and end, as arrays (or NumPy
+        arrays with asArray=True).  An item without history returns empty columns.
+
+        Returns:
+            dict: {column: array}
+        """
+        with self.__lock:
+            series = self.series.get(int(itemid)) or PriceSeries()
+            first, stop = series.window(start, end)
+            columns = {column: getattr(series, column)[first:stop] for column, typecode in SERIES_COLUMNS}
+        if asArray:
+            numpy = _numpy()
+            if numpy is None:
+                raise ImportError("window(asArray=True) requires NumPy, install it with 'pip install numpy'")
+            columns = {column: numpy.frombuffer(values, dtype=values.typecode) for column, values in columns.items()}
+        return columns
+
+    def vwap(self, itemid: int, start = None, end = None, side: str = 'both'):
+        """vwap method
+
+        Returns the volume weighted average price of an item between start and end, or None when
+        nothing traded in the window.  Only points with a volume count, so the /latest points
+        recorded by Items (which have none) are ignored here.
+
+        Args:
+            side str: 'high' (instant buys), 'low' (instant sells) or 'both'
+        """
+        columns = self.window(itemid, start, end)
+        sides = {'high': (('avg_high', 'high_volume'),),
+                 'low': (('avg_low', 'low_volume'),),
+                 'both': (('avg_high', 'high_volume'), ('avg_low', 'low_volume'))}[side]
+        numpy = _numpy()
+        value = volume = 0
+        for price_column, volume_column in sides:
+            prices, volumes = columns[price_column], columns[volume_column]
+            if numpy is not None:
+                prices = numpy.frombuffer(prices, dtype=float)
+                volumes = numpy.frombuffer(volumes, dtype=numpy.int64)
+                traded = volumes > 0
+                value += float(numpy.dot(prices[traded], volumes[traded]))
+                volume += int(volumes.sum())
+            else:
+                value += math.fsum(map(operator.mul, compress(prices, volumes), compress(volumes, volumes)))
+                volume += sum(volumes)
+        return value / volume if volume else None
+
+    def minMax(self, itemid: int, start = None, end = None, field: str = 'avg_high'):
+        """minMax method
+
+        Returns the (lowest, highest) price of field between start and end, missing prices
+        ignored, or None when there is no price in the window.
+        """
+        if field not in PRICE_FIELDS:
+            raise ValueError("field must be one of {}".format(PRICE_FIELDS))
+        values = self.window(itemid, start, end)[field]
+        numpy = _numpy()
+        if numpy is not None:
+            values = numpy.frombuffer(values, dtype=float)
+            values = values[~numpy.isnan(values)]
+            return (float(values.min()), float(values.max())) if len(values) else None
+        values = list(filter(math.isfinite, values))
+        return (min(values), max(values)) if values else None
+
+    def rollingMean(self, itemid: int, window: int, start = None, end = None, field: str = 'avg_high',
+                    asArray: bool = False):
+        """rollingMean method
+
+        Returns the rolling mean of field over every run of window consecutive points between start
+        and end, computed from prefix sums so each mean is O(1).  Missing prices are left out of
+        the mean; a run without any price is nan.
+
+        Args:
+            asArray bool: Return a NumPy float array instead of a list
+
+        Returns:
+            list: len(points) - window + 1 means (empty if there are fewer points)
+        """
+        if field not in PRICE_FIELDS:
+            raise ValueError("field must be one of {}".format(PRICE_FIELDS))
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        values = self.window(itemid, start, end)[field]
+        numpy = _numpy()
+        if asArray and numpy is None:
+            raise ImportError("rollingMean(asArray=True) requires NumPy, install it with 'pip install numpy'")
+        if numpy is not None:
+            values = numpy.frombuffer(values, dtype=float)
+            present = ~numpy.isnan(values)
+            sums = numpy.concatenate(([0.0], numpy.cumsum(numpy.where(present, values, 0.0))))
+            counts = numpy.concatenate(([0], numpy.cumsum(present)))
+            totals = sums[window:] - sums[:-window]
+            found = counts[window:] - counts[:-window]
+            with numpy.errstate(invalid='ignore', divide='ignore'):
+                means = numpy.where(found > 0, totals / numpy.maximum(found, 1), numpy.nan)
+            return means if asArray else means.tolist()
+
+        present = [value == value for value in values]
+        sums = [0.0] + list(accumulate(value if value == value else 0.0 for value in values))
+        counts = [0] + list(accumulate(present))
+        means = []
+        for stop in range(window, len(values) + 1):
+            found = counts[stop] - counts[stop - window]
+            means.append((sums[stop] - sums[stop - window]) / found if found else NAN)
+        return means
+
+    def save(self, path: str):
+        """save method
+
+        Writes the whole history to path: a JSON header followed by the raw (little endian)
+        column arrays, zlib compressed.  The file is replaced atomically.
+        """
+        path = os.path.abspath(os.path.expanduser(path))
+        with self.__lock:
+            itemids = sorted(self.series)
+            header = json.dumps({'version': 1, 'items': [[itemid, len(self.series[itemid])] for itemid in itemids]}).encode()
+            chunks = []
+            for itemid in itemids:
+                for column, typecode in SERIES_COLUMNS:
+                    values = array(typecode, getattr(self.series[itemid], column))
+                    if sys.byteorder == 'big':
+                        values.byteswap()
+                    chunks.append(values.tobytes())
+        tmp = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp, 'wb') as f:
+            f.write(len(header).to_bytes(4, 'little'))
+            f.write(header)
+            f.write(zlib.compress(b''.join(chunks)))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, **kwargs):
+        """load method
+
+        Reads a history written by save().  Extra keyword arguments go to the constructor.
+
+        Raises:
+            HistoryError: The file is not a saved history
+        """
+        path = os.path.abspath(os.path.expanduser(path))
+        history = cls(**kwargs)
+        try:
+            with open(path, 'rb') as f:
+                size = int.from_bytes(f.read(4), 'little')
+                header = json.loads(f.read(size))
+                data = memoryview(zlib.decompress(f.read()))
+            if header.get('version') != 1:
+                raise ValueError("unknown version {}".format(header.get('version')))
+            offset = 0
+            for itemid, length in header['items']:
+                series = history.series[itemid] = PriceSeries()
+                for column, typecode in SERIES_COLUMNS:
+                    values = array(typecode)
+                    size = length * values.itemsize
+                    values.frombytes(data[offset:offset + size])
+                    if sys.byteorder == 'big':
+                        values.byteswap()
+                    setattr(series, column, values)
+                    offset += size
+        except (OSError, ValueError, KeyError, zlib.error) as err:
+            raise HistoryError("Could not load price history from {}: {}".format(path, err)) from err
+        return history
+    ##############################
+    #  END: PriceHistory Object  #
+    ##############################
@@ -0,0 +1,329 @@
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that features Item Information Lookup, Hiscores, and Market information.
+
+EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
+
+ItemTable Module holds the compact, column based storage used by Items(compact=True).  Instead of one
+dictionary per item, every numeric field is kept in its own typed array and item records are rebuilt
+on demand, so a full market snapshot costs a fraction of the memory.
+"""
+
+# Generic/Built-in Imports
+import copy
+import sys
+from array import array
+from collections.abc import Mapping
+
+# META Data
+__copyright__  = 'Copyright 2023, CFDeadlines'
+__credits__    = ['CFDeadlines (Lead Programmer, Creator)', 'Riley Fitzgibbons (Contributor)']
+__license__    = 'EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)'
+__version__    = '1.3.2'
+__maintainer__ = {
+        'CFDeadlines': 'cookm0803@gmail.com',
+        'Riley Fitz': "rileyfitzgibbons@gmail.com"
+    }
+__email__      = 'cookm0803@gmail.com'
+__status__     = 'Open'
+
+################
+#  Exceptions  #
+################
+class DoNotRunDirectly(Exception):
+    pass
+
+############################
+#  Do not run if __main__  #
+############################
+if __name__ == "__main__":
+    raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
+
+# Sentinels stored in the integer columns.  ABSENT means the item record has no such key (the wiki
+# did not send it), NULL means the key exists but its value is None (e.g. no recent trade).
+ABSENT = -1
+NULL = -2
+
+# (column, record keys) in the order the keys appear on a rectified item record
+OPTIONAL_FIELDS = (
+    ('buy_limit', ('buy_limit',)),
+    ('lowalch', ('lowalch',)),
+    ('highalch', ('highalch',)),
+    ('sp', ('sp',)),
+    ('volume', ('buy_quantity', 'sell_quantity')),
+    ('buy_average', ('buy_average',)),
+    ('sell_average', ('sell_average',)),
+)
+
+COLUMNS = ('id',) + tuple(column for column, keys in OPTIONAL_FIELDS)
+
+def alch_values(item):
+    """alch_values() function
+
+    Returns (lowalch, highalch) for a wiki mapping entry.  The wiki's own values are used when it
+    sends them, otherwise they are worked out from the store value the way the game does (40% and
+    60%, rounded down).  Either is None when neither is known.
+    """
+    value = item.get('value')
+    lowalch = item.get('lowalch')
+    highalch = item.get('highalch')
+    if lowalch is None and value is not None:
+        lowalch = value * 2 // 5
+    if highalch is None and value is not None:
+        highalch = value * 3 // 5
+    return lowalch, highalch
+
+#############################
+#  START: ItemTable Object  #
+#############################
+class ItemTable(Mapping):
+    """ItemTable Object
+
+    A read-only mapping of item name -> item record that stores its data column-wise.  Each column
+    in COLUMNS is an array('q') with one entry per item, names are interned once and indexed by
+    row.  Looking up an item returns a freshly built dictionary with exactly the same keys and
+    values Items would have stored for it, so every existing getter works unchanged.
+
+    Args:
+        names list: Interned, lowercased item names (one per row)
+        examines list: Examine text (one per row)
+        members array: 1/0 member flags (one per row)
+        columns dict: {column: array('q')} for every column in COLUMNS (read-only memoryviews cast
+                      to 'q' work too, see the Shared module)
+    """
+
+    def __init__(self, names, examines, members, columns):
+        self.names = names
+        self.examines = examines
+        self.members = members
+        self.columns = columns
+        self.__rows = {name: row for row, name in enumerate(names)}
+        self.__ids = {itemid: row for row, itemid in enumerate(columns['id'])}
+
+    @classmethod
+    def fromWiki(cls, prices, volumes, mappings):
+        """fromWiki method
+
+        Builds an ItemTable straight from the raw wiki responses, the same inputs Items
+        rectifyWikiResponse receives.  Later mapping entries with a duplicate name replace the
+        earlier row, just like they replace the earlier key in the dictionary form.
+
+        Args:
+            prices dict: a dictionary of the latest item pricing
+            volumes dict: A dictionary of the latest trading volumes
+            mappings list: A list of relevant item info
+        Returns:
+            ItemTable
+        """
+        names = []
+        examines = []
+        members = array('b')
+        columns = {column: array('q') for column in COLUMNS}
+        rows = {}
+
+        for item in mappings:
+            name = sys.intern(item['name'].lower())
+            lowalch, highalch = alch_values(item)
+            values = (
+                item['id'],
+                item.get('limit', ABSENT),
+                ABSENT if lowalch is None else lowalch,
+                ABSENT if highalch is None else highalch,
+                item.get('value', ABSENT),
+                ABSENT,
+                ABSENT,
+                ABSENT,
+            )
+            row = rows.get(name)
+            if row is None:
+                rows[name] = len(names)
+                names.append(name)
+                examines.append(item['examine'])
+                members.append(1 if item['members'] else 0)
+                for column, value in zip(COLUMNS, values):
+                    columns[column].append(NULL if value is None else value)
+            else:
+                examines[row] = item['examine']
+                members[row] = 1 if item['members'] else 0
+                for column, value in zip(COLUMNS, values):
+                    columns[column][row] = NULL if value is None else value
+
+        ids = {itemid: row for row, itemid in enumerate(columns['id'])}
+        volume = columns['volume']
+        for itemid, value in volumes.items():
+            row = ids.get(int(itemid))
+            if row is not None:
+                volume[row] = NULL if value is None else value
+
+        buy_average = columns['buy_average']
+        sell_average = columns['sell_average']
+        for itemid, price in prices.items():
+            row = ids.get(int(itemid))
+            if row is not None:
+                buy_average[row] = NULL if price['high'] is None else price['high']
+                sell_average[row] = NULL if price['low'] is None else price['low']
+
+        return cls(names, examines, members, columns)
+
+    @classmethod
+    def fromRecords(cls, records):
+        """fromRecords method
+
+        Builds an ItemTable from rectified item records, e.g. the values of a dictionary based
+        Items snapshot.
+
+        Args:
+            records iterable: Item dictionaries as returned by Items.getItem()
+        Returns:
+            ItemTable
+        """
+        names = []
+        examines = []
+        members = array('b')
+        columns = {column: array('q') for column in COLUMNS}
+        for record in records:
+            names.append(sys.intern(record['name']))
+            examines.append(record['examine'])
+            members.append(1 if record['members'] else 0)
+            columns['id'].append(record['id'])
+            for column, keys in OPTIONAL_FIELDS:
+                value = record.get(keys[0], ABSENT)
+                columns[column].append(NULL if value is None else value)
+        return cls(names, examines, members, columns)
+
+    def withMarket(self, prices, volumes):
+        """withMarket method
+
+        Returns a copy of the table with new prices and volumes.  Only the three market columns
+        are copied, names, mapping columns and the lookup indexes are shared with this table, which
+        is left untouched.  Items missing from a payload go back to ABSENT, as they would in a
+        fresh table.
+
+        Args:
+            prices dict: {item ID (int): {'high', 'low', ...}} from /latest
+            volumes dict: {item ID (int): volume} from /volumes
+        Returns:
+            tuple: (ItemTable, set of the IDs whose prices or volumes changed)
+        """
+        columns = dict(self.columns)
+        volume = columns['volume'] = array('q', columns['volume'])
+        buy_average = columns['buy_average'] = array('q', columns['buy_average'])
+        sell_average = columns['sell_average'] = array('q', columns['sell_average'])
+        changed = set()
+        for row, itemid in enumerate(columns['id']):
+            price = prices.get(itemid)
+            if price is None:
+                high = low = ABSENT
+            else:
+                high = NULL if price['high'] is None else price['high']
+                low = NULL if price['low'] is None else price['low']
+            traded = volumes.get(itemid, ABSENT)
+            traded = NULL if traded is None else traded
+            if buy_average[row] != high or sell_average[row] != low or volume[row] != traded:
+                buy_average[row] = high
+                sell_average[row] = low
+                volume[row] = traded
+                changed.add(itemid)
+        if not changed:
+            return self, changed
+
+        table = copy.copy(self)
+        table.columns = columns
+        return table, changed
+
+    def row(self, name):
+        """row method
+
+        Returns the row number for an item name, or None if the item is not in the table.
+        """
+        return self.__rows.get(name)
+
+    def rowForID(self, itemid):
+        """rowForID method
+
+        Returns the row number for an item ID, or None if the item is not in the table.
+        """
+        return self.__ids.get(itemid)
+
+    def record(self, row):
+        """record method
+
+        Rebuilds the item dictionary for a row.
+        """
+        columns = self.columns
+        record = {
+            'name': self.names[row],
+            'id': columns['id'][row],
+            'members': bool(self.members[row]),
+            'examine': self.examines[row],
+        }
+        for column, keys in OPTIONAL_FIELDS:
+            value = columns[column][row]
+            if value != ABSENT:
+                for key in keys:
+                    record[key] = None if value == NULL else value
+        return record
+
+    def column(self, column, asArray: bool = False):
+        """column method
+
+        Returns a whole column.  With asArray=True the column is returned as a NumPy int64 view of
+        the underlying array (no copy).  Sentinel values are left in place; ABSENT and NULL are
+        both negative, so filter with column >= 0.
+        """
+        if not asArray:
+            return self.columns[column]
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("column(asArray=True) requires NumPy, install it with 'pip install numpy'")
+        return numpy.frombuffer(self.columns[column], dtype=numpy.int64)
+
+    def byID(self):
+        """byID method
+
+        Returns a read-only mapping of item ID -> item record backed by this table.
+        """
+        return ItemTableIDIndex(self)
+
+    def __getitem__(self, name):
+        row = self.__rows.get(name)
+        if row is None:
+            raise KeyError(name)
+        return self.record(row)
+
+    def __contains__(self, name):
+        return name in self.__rows
+
+    def __iter__(self):
+        return iter(self.__rows)
+
+    def __len__(self):
+        return len(self.__rows)
+
+
+class ItemTableIDIndex(Mapping):
+    """ItemTableIDIndex Object
+
+    The ID keyed counterpart of ItemTable, used as the Items ID index in compact mode.
+    """
+
+    def __init__(self, table):
+        self.__table = table
+
+    def __getitem__(self, itemid):
+        row = self.__table.rowForID(itemid)
+        if row is None:
+            raise KeyError(itemid)
+        return self.__table.record(row)
+
+    def __iter__(self):
+        return iter(self.__table.columns['id'])
+
+    def __len__(self):
+        return len(self.__table)
+    ###########################
+    #  END: ItemTable Object  #
+    ###########################
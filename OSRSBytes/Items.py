@@ -11,9 +11,16 @@ be adjusted and added in the Items Module.
 """
 
 # Generic/Built-in Imports
+import asyncio
+import concurrent.futures
 import json
-import math
-import urllib.request
+import random
+import threading
+import time
+
+from OSRSBytes.Cache import DiskCache
+from OSRSBytes.ItemTable import ItemTable, alch_values
+from OSRSBytes.Transport import DEFAULT_ASYNC_TRANSPORT, DEFAULT_TRANSPORT, TransportError
 
 # META Data
 __copyright__  = 'Copyright 2023, CFDeadlines'
@@ -60,6 +67,21 @@ class APIDown(Exception):
 if __name__ == "__main__":
     raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
 
+# The wiki endpoints every snapshot is built from, in the order they are fetched.
+WIKI_ENDPOINTS = (
+    ('mapping', 'https://prices.runescape.wiki/api/v1/osrs/mapping'),
+    ('latest', 'https://prices.runescape.wiki/api/v1/osrs/latest'),
+    ('volumes', 'https://prices.runescape.wiki/api/v1/osrs/volumes'),
+)
+
+# Default time-to-live (seconds) of each cached wiki endpoint when Items is given a cache_dir.
+# Item mappings only change with game updates, prices move constantly.
+CACHE_TTL = {
+    'mapping': 86400,
+    'latest': 60,
+    'volumes': 3600,
+}
+
 ############################
 #  START: Items Object     #
 ############################
@@ -68,60 +90,308 @@ class Items(object):
 
     The Items Object accepts no arguments.  The Items object is  a dictionary of all OSRS Items.
     Dictionary is ordered by ['itemname'] as key.  Items can be entered as name or itemid and are
-    converted.  While both are accepted, itemname is 'faster' since the dictionary is keyed by it
-    and entering an itemid requires a bit of searching.
+    converted.  Item IDs are resolved through a secondary index keyed by ID, so both forms are
+    constant time lookups.
 
     Args:
-        None
+        application_name str: Name sent to the wiki in the User-Agent header
+        application_contact str: Contact sent to the wiki in the User-Agent header
+        compact bool: Store the market snapshot in a column based ItemTable instead of one
+                      dictionary per item.  Uses far less memory, every getter works the same.
+        cache_dir str: Directory to cache the wiki responses in.  Cached responses are reused
+                       until their TTL runs out and are then revalidated with ETag/Last-Modified,
+                       so a new Items() is usually a local read.  Caching is off when not supplied.
+        cache_ttl dict: Per endpoint TTL overrides in seconds, e.g. {'latest': 30}.  See CACHE_TTL.
+        timeout float: Timeout in seconds for each wiki request (defaults to the transport's 10s)
+        history PriceHistory: Record the prices of every update() into this history (see the
+                              History module).  Off when not supplied.
+        publish_to str: Publish every snapshot to this snapshot file, for SharedItems readers in
+                        other processes (see the Shared module).  Off when not supplied.
+        transport: The transport wiki requests go through, defaults to the shared pooled
+                   DEFAULT_TRANSPORT.  Use a ReplayTransport to build Items from recorded responses
+                   without a network (see the Transport module).
 
     Returns:
         None
     """
 
-    def __init__(self, application_name = None, application_contact = None):
+    def __init__(self, application_name = None, application_contact = None, compact: bool = False,
+                 cache_dir: str = None, cache_ttl: dict = None, timeout: float = None, history = None,
+                 publish_to: str = None, transport = None):
+        self._configure(application_name, application_contact, compact, cache_dir, cache_ttl, timeout, history, publish_to,
+                        transport)
+        self.update()
+
+    def _configure(self, application_name, application_contact, compact, cache_dir, cache_ttl, timeout,
+                   history = None, publish_to = None, transport = None):
+        """configure
+
+        Stores the constructor options.  Split out of __init__ so that clients which fetch
+        differently (see AsyncItems) can share them without triggering a fetch.
+        """
         self.__application_name = application_name if application_name else "OSRSBytes"
         self.__application_contact = application_contact if application_contact else "info@osrsbytes.com"
+        self.__compact = compact
+        self.__cache = DiskCache(cache_dir) if cache_dir else None
+        self.__cache_ttl = dict(CACHE_TTL, **(cache_ttl or {}))
+        self.__transport = transport if transport is not None else DEFAULT_TRANSPORT
+        self.__timeout = timeout
+        self.history = history
+        self.publish_to = publish_to
+        self.changed_ids = set()
+        self.refresh_error = None
+        self.__mapped = None
+        self.__snapshot = ({}, {})
+        self.__search_index = None
+        self.__analytics = (None, None)
+        self.__update_lock = threading.RLock()
+        self.__refresher = None
+        self.__refresh_stop = None
+
+    @property
+    def item_dict(self):
+        """item_dict property
+
+        The current snapshot, a dictionary of item records keyed by lowercased item name (an
+        ItemTable when the object was created with compact=True).  update() never modifies a
+        snapshot that has been handed out, it publishes a new one.
+        """
+        return self.__snapshot[0]
 
-        prices, volumes, mappings = self.__getHTTPRequest()
-        self.itemname = self.__rectifyWikiResponse(prices, volumes, mappings) # Why did I name you this way?
-        self.item_dict = self.itemname
-        if not (self.item_dict):
-            raise APIDown(f'The API appears to be down, please try the other')
+    @property
+    def itemname(self): # Why did I name you this way?
+        return self.__snapshot[0]
 
-    def __getHTTPRequest(self):
+    def __getHTTPRequest(self, endpoints = WIKI_ENDPOINTS):
         """getHTTPRequest
 
         This method is responsible for pulling data from runewiki API's. The
-        headers are necessary to get sucessful API requests.
+        headers are necessary to get sucessful API requests.  All endpoints
+        are requested concurrently, so this takes about as long as the slowest one.
 
         Args:
-            None
+            endpoints tuple: The (endpoint, url) pairs to fetch, all of WIKI_ENDPOINTS by default
         Returns:
             dict latest: The latest pricing info in dictionary format
             dict volumes: The latest trading volumes for items.
-            list mappings: Mappings of item info.
+            list mappings: Mappings of item info (None when /mapping was not fetched).
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            futures = {endpoint: executor.submit(self.__fetch, endpoint, url) for endpoint, url in endpoints}
+        return self._decodePayloads({endpoint: future.result() for endpoint, future in futures.items()})
+
+    def __fetch(self, endpoint, url):
+        """fetch
+
+        Returns the raw body of a single wiki endpoint, requested over the transport.
+
+        Args:
+            endpoint str: The endpoint name, used as cache key and to pick the TTL
+            url str: The full endpoint url
+        Returns:
+            bytes: The response body
+        """
+        body, headers, entry = self._prepareRequest(endpoint)
+        if body is not None:
+            return body
+        try:
+            response = self.__transport.request(url, headers, self.__timeout)
+        except TransportError as TE:
+            return self._settleResponse(endpoint, url, entry, None, TE)
+        return self._settleResponse(endpoint, url, entry, response)
+
+    def _prepareRequest(self, endpoint):
+        """prepareRequest
+
+        First half of fetching an endpoint, shared by the blocking and asyncio clients.  Without a
+        cache this only builds the request headers.  With a cache, a fresh cached body is returned
+        so no request is needed at all, and a stale one adds its If-None-Match/If-Modified-Since
+        validators to the headers.
+
+        Args:
+            endpoint str: The endpoint name, used as cache key and to pick the TTL
+        Returns:
+            tuple: (cached body or None, request headers, cache entry or None)
         """
-        url_mappings = 'https://prices.runescape.wiki/api/v1/osrs/mapping'
-        url_prices = 'https://prices.runescape.wiki/api/v1/osrs/latest'
-        url_volumes = 'https://prices.runescape.wiki/api/v1/osrs/volumes'
         headers = {
             "User-Agent" : "{} - {}".format(self.__application_name, self.__application_contact)
         }
+        entry = self.__cache.get(endpoint) if self.__cache else None
+        if entry and entry.isFresh(self.__cache_ttl.get(endpoint)):
+            return entry.body, headers, entry
+        if entry:
+            headers.update(entry.validators())
+        return None, headers, entry
+
+    def _settleResponse(self, endpoint, url, entry, response, error = None):
+        """settleResponse
+
+        Second half of fetching an endpoint.  Turns the transport response into the body to use:
+        a 304 reuses the cached body, a 200 is stored in the cache, and if the request failed
+        outright the stale cached body is served rather than failing.
+
+        Args:
+            endpoint str: The endpoint name
+            url str: The full endpoint url
+            entry CacheEntry: The entry returned by prepareRequest, if any
+            response Response: The transport response, None when the request failed
+            error Exception: The TransportError raised by the request, if any
+        Returns:
+            bytes: The response body
+        Raises:
+            APIDown: The request failed and there is nothing cached to fall back on
+        """
+        if error is not None:
+            if entry:
+                return entry.body
+            raise APIDown("Could not reach {}: {}".format(url, error)) from error
+
+        if response.status == 304 and entry:
+            return self.__cache.touch(endpoint, entry).body
+        if response.status != 200:
+            if entry:
+                return entry.body
+            raise APIDown("{} answered with HTTP {}".format(url, response.status))
+        if self.__cache:
+            self.__cache.put(endpoint, response.body, response.headers.get('etag'), response.headers.get('last-modified'))
+        return response.body
+
+    def _endpoints(self, mappings = None):
+        """endpoints
+
+        Picks the wiki endpoints an update needs.  /latest and /volumes are always fetched, /mapping
+        only for the first load, when mappings is True, or (mappings=None) once the item mappings
+        are older than the mapping TTL.
+
+        Returns:
+            tuple: (endpoint, url) pairs out of WIKI_ENDPOINTS
+        """
+        if self.__mapped is None:
+            mappings = True
+        elif mappings is None:
+            mappings = time.time() - self.__mapped >= self.__cache_ttl['mapping']
+        return tuple((endpoint, url) for endpoint, url in WIKI_ENDPOINTS if mappings or endpoint != 'mapping')
+
+    def _decodePayloads(self, bodies):
+        """decodePayloads
 
+        Decodes the raw mapping, latest and volumes bodies, given as {endpoint: body}.
 
-        req = urllib.request.Request(url_mappings, headers=headers)
-        f = urllib.request.urlopen(req)
-        mappings = json.load(f)
+        Returns:
+            tuple: (prices, volumes, mappings) as expected by rectifyWikiResponse, mappings is
+                   None when /mapping was not fetched
+        """
+        mappings = json.loads(bodies['mapping']) if 'mapping' in bodies else None
+        return json.loads(bodies['latest'])['data'], json.loads(bodies['volumes'])['data'], mappings
+
+    def _loadPayloads(self, prices, volumes, mappings = None):
+        """loadPayloads
+
+        Rebuilds item_dict and the ID index from decoded wiki payloads, or, without mappings,
+        applies the new prices and volumes to the current snapshot.  Either way the new snapshot
+        is built off to the side and published with a single reference swap, so readers on other
+        threads see the old snapshot or the new one, never a mix.  Records the prices into the
+        price history if there is one.
+
+        Returns:
+            set: The IDs of the items whose prices or volumes changed (every item after a rebuild)
+        Raises:
+            APIDown: The payloads could not be rectified
+        """
+        with self.__update_lock:
+            if mappings is None:
+                try:
+                    snapshot, changed = self.__applyMarket(prices, volumes)
+                except (AttributeError, KeyError, TypeError, ValueError):
+                    raise APIDown(f'The API appears to be down, please try the other')
+            else:
+                item_dict = self.__rectifyWikiResponse(prices, volumes, mappings)
+                if not (item_dict):
+                    raise APIDown(f'The API appears to be down, please try the other')
+                snapshot = (item_dict, self.__indexItemIDs(item_dict))
+                self.__mapped = time.time()
+                self.__search_index = None
+                changed = set(snapshot[1])
+            self.__snapshot = snapshot
+            self.changed_ids = changed
+            if self.publish_to is not None:
+                self.publish(self.publish_to)
+        if self.history is not None:
+            self.history.recordLatest(prices)
+        return changed
+
+    def _swapSnapshot(self, item_dict):
+        """swapSnapshot
+
+        Makes item_dict (a dictionary of item records or an ItemTable) the current snapshot, for
+        clients that get their snapshot from somewhere other than the wiki (see SharedItems).
+
+        Returns:
+            set: The IDs of every item in the new snapshot, also kept in changed_ids
+        """
+        with self.__update_lock:
+            self.__snapshot = (item_dict, self.__indexItemIDs(item_dict))
+            self.__search_index = None
+            self.changed_ids = set(self.__snapshot[1])
+        return self.changed_ids
+
+    def publish(self, path: str):
+        """publish Method
+
+        Writes the current snapshot to the snapshot file at path, for SharedItems readers in other
+        processes.  Dictionary snapshots are converted to an ItemTable first.
+
+        Returns:
+            int: The generation number of the published snapshot
+        """
+        from OSRSBytes.Shared import publish_table
+        item_dict = self.__snapshot[0]
+        if not isinstance(item_dict, ItemTable):
+            item_dict = ItemTable.fromRecords(item_dict.values())
+        return publish_table(item_dict, path)
 
-        req = urllib.request.Request(url_prices, headers=headers)
-        f = urllib.request.urlopen(req)
-        prices = json.load(f)['data']
+    def __applyMarket(self, prices, volumes):
+        """applyMarket
 
-        req = urllib.request.Request(url_volumes, headers=headers)
-        f = urllib.request.urlopen(req)
-        volumes = json.load(f)['data']
+        Applies a new /latest and /volumes payload to the current snapshot without touching the
+        mapping fields.  The snapshot is copied on write: only records whose prices or volumes moved
+        are copied and updated, every other record is shared with the current snapshot.  Items that
+        dropped out of a payload lose those keys, exactly as a rebuild would leave them.
 
-        return prices, volumes, mappings
+        Returns:
+            tuple: ((item_dict, item ID index) of the new snapshot, IDs of the items that changed)
+        """
+        prices = {int(itemid): price for itemid, price in prices.items()}
+        volumes = {int(itemid): volume for itemid, volume in volumes.items()}
+        item_dict, item_ids = self.__snapshot
+        if isinstance(item_dict, ItemTable):
+            table, changed = item_dict.withMarket(prices, volumes)
+            return (table, self.__indexItemIDs(table)), changed
+
+        missing = object()
+        changed = set()
+        new_dict = new_ids = None
+        for itemid, record in item_ids.items():
+            price = prices.get(itemid)
+            volume = volumes.get(itemid, missing)
+            high, low = (missing, missing) if price is None else (price['high'], price['low'])
+            current = (record.get('buy_average', missing), record.get('sell_average', missing), record.get('buy_quantity', missing))
+            if current == (high, low, volume):
+                continue
+            if new_dict is None:
+                new_dict, new_ids = dict(item_dict), dict(item_ids)
+            record = dict(record)
+            for key, value in (('buy_quantity', volume), ('sell_quantity', volume), ('buy_average', high), ('sell_average', low)):
+                if value is missing:
+                    record.pop(key, None)
+                else:
+                    record[key] = value
+            new_dict[record['name']] = record
+            new_ids[itemid] = record
+            changed.add(itemid)
+        if new_dict is None:
+            return self.__snapshot, changed
+        return (new_dict, new_ids), changed
 
     def __rectifyWikiResponse(self, prices, volumes, mappings):
         """rectifyResponseWithMappings
@@ -133,11 +403,18 @@ class Items(object):
             volumes dict: A dictionary of the latest trading volumes
             mappings list: A list of relevant item info
         Returns:
-            dict: A rectified dictionary of all available item names.
+            dict: A rectified dictionary of all available item names (an ItemTable when
+                  the object was created with compact=True).
 
         NOTE: There are more item mappings than pricing or volumes. So not
                 all mappings will have pricing/volume info.
         """
+        if self.__compact:
+            try:
+                return ItemTable.fromWiki(prices, volumes, mappings)
+            except:
+                return False
+
         rect = {}
         try:
             for item in mappings:
@@ -149,40 +426,65 @@ class Items(object):
                 rect[item['name']]['examine'] = item['examine']
                 if 'limit' in item:
                     rect[item['name']]['buy_limit'] = item['limit']
-                if 'lowalch' in item:
-                    rect[item['name']]['lowalch'] = item['lowalch']
-                if 'highalch' in item:
-                    rect[item['name']]['highalch'] = item['highalch']
+                lowalch, highalch = alch_values(item)
+                if lowalch is not None:
+                    rect[item['name']]['lowalch'] = lowalch
+                if highalch is not None:
+                    rect[item['name']]['highalch'] = highalch
                 if 'value' in item:
                     rect[item['name']]['sp'] = item['value']
 
-            for item in rect:
-                if str(rect[item]['id']) in volumes:
-                    rect[item]['buy_quantity'] = volumes[str(rect[item]['id'])]
-                    rect[item]['sell_quantity'] = volumes[str(rect[item]['id'])]
-                if str(rect[item]['id']) in prices:
-                    rect[item]['buy_average'] = prices[str(rect[item]['id'])]['high']
-                    rect[item]['sell_average'] = prices[str(rect[item]['id'])]['low']
+            item_ids = self.__indexItemIDs(rect)
+            for itemid, volume in volumes.items():
+                record = item_ids.get(int(itemid))
+                if record:
+                    record['buy_quantity'] = volume
+                    record['sell_quantity'] = volume
+            for itemid, price in prices.items():
+                record = item_ids.get(int(itemid))
+                if record:
+                    record['buy_average'] = price['high']
+                    record['sell_average'] = price['low']
             return rect
         except:
             return False
 
-    def __normalize_input(self, itemNameOrID: str):
-        """normalize_input method
+    def __indexItemIDs(self, rect):
+        """indexItemIDs
 
-        The normalize_input method replaces the old system that required OSRSBytes to create two separate dictionaries,
-        one keyed with itemid and the other keyed with itemname.  Instead, we have one dictionary keyed by Itemname and
-        normalize_input(itemNameOrID) converts it to the appropriate format.
+        This method builds the secondary item ID index that sits next to the name-keyed item_dict.
+        Each ID maps directly to its item record, so ID based lookups are a single dictionary hit
+        instead of a scan over every item.
+
+        Args:
+            rect dict: The rectified dictionary returned by rectifyWikiResponse
+        Returns:
+            dict: A dictionary of item records keyed by integer item ID
+        """
+        if isinstance(rect, ItemTable):
+            return rect.byID()
+        return {record['id']: record for record in rect.values()}
+
+    def __record(self, itemNameOrID):
+        """record method
+
+        Replaces the old system that required OSRSBytes to create two separate dictionaries, one
+        keyed with itemid and the other keyed with itemname.  Names are looked up in item_dict and
+        IDs in the ID index, both taken from the same snapshot.
 
         Args:
             itemNameOrID: str|int : The item's name or its ID
 
         Returns:
-            String : The name of the item in string format
+            dict : The item record
+        Raises:
+            KeyError : The item was not found
         """
-        if type(itemNameOrID) == int or itemNameOrID.isnumeric():
-            return self.getName(str(itemNameOrID))
-        return itemNameOrID
+        item_dict, item_ids = self.__snapshot
+        key = str(itemNameOrID).lower()
+        if type(itemNameOrID) == int or key.isnumeric():
+            return item_ids[int(key)]
+        return item_dict[key]
 
     def getItem(self, itemNameOrID: str):
         """getItem Method
@@ -191,19 +493,131 @@ class Items(object):
         all item information.
         """
         try:
-            return self.item_dict[self.__normalize_input(str(itemNameOrID).lower())]
+            return self.__record(itemNameOrID)
         except KeyError:
             raise ItemNotValid("{} is not a valid item and was not found.".format(itemNameOrID))
         
+    def getItems(self, itemNamesOrIDs):
+        """getItems Method
+
+        The getItems method is the bulk form of getItem.  When supplied a list of Item Names and/or
+        Item IDs, it returns a list of item dictionaries in the same order.  Items that are not valid
+        are returned as None rather than raising, so a single unknown item doesn't spoil the batch.
+        """
+        return self.__resolveMany(itemNamesOrIDs)
+
+    def getPrices(self, itemNamesOrIDs, fields = ('buy_average', 'sell_average', 'buy_quantity', 'sell_quantity'), asArray: bool = False):
+        """getPrices Method
+
+        The getPrices method, when supplied a list of Item Names and/or Item IDs, resolves every item
+        once and returns columnar results: a dictionary keyed by field with one list entry per item,
+        in input order.  Fields an item doesn't have (or items that are not valid) are filled with None.
+
+        Args:
+            itemNamesOrIDs list: The item names and/or IDs to look up
+            fields list: Any item keys, e.g. 'buy_average', 'sell_average', 'buy_limit', 'sp'
+            asArray bool: Return NumPy float arrays (missing values are nan) instead of lists.
+                          Requires NumPy to be installed.
+
+        Returns:
+            dict: {field: list|numpy.ndarray}
+        """
+        records = self.__resolveMany(itemNamesOrIDs)
+        columns = {}
+        for field in fields:
+            columns[field] = [record.get(field) if record else None for record in records]
+
+        if asArray:
+            try:
+                import numpy
+            except ImportError:
+                raise ImportError("getPrices(asArray=True) requires NumPy, install it with 'pip install numpy'")
+            for field, values in columns.items():
+                columns[field] = numpy.array([numpy.nan if value is None else value for value in values], dtype=float)
+        return columns
+
+    def __resolveMany(self, itemNamesOrIDs):
+        """resolveMany method
+
+        Resolves a list of item names and/or IDs into their item records in a single pass.  IDs go
+        through the ID index and names through item_dict, each exactly once.
+
+        Returns:
+            list: item records (or None for items that were not found) in input order
+        """
+        item_dict, item_ids = self.__snapshot
+        records = []
+        for itemNameOrID in itemNamesOrIDs:
+            if type(itemNameOrID) == int:
+                records.append(item_ids.get(itemNameOrID))
+                continue
+            key = str(itemNameOrID).lower()
+            if key.isnumeric():
+                records.append(item_ids.get(int(key)))
+            else:
+                records.append(item_dict.get(key))
+        return records
+
+    def analytics(self):
+        """analytics Method
+
+        The analytics method returns a MarketAnalytics object for the current snapshot: margins, GE
+        tax, profit, ROI, alch profit and buy limit profit for every item, plus ranked top() queries.
+        It is computed once per snapshot and shared until the next update.
+
+        Returns:
+            MarketAnalytics
+        """
+        snapshot = self.__snapshot
+        cached_snapshot, analytics = self.__analytics
+        if cached_snapshot is not snapshot:
+            from OSRSBytes.Analytics import MarketAnalytics
+            table = snapshot[0]
+            if not isinstance(table, ItemTable):
+                table = ItemTable.fromRecords(table.values())
+            analytics = MarketAnalytics(table)
+            self.__analytics = (snapshot, analytics)
+        return analytics
+
+    def search(self, query: str, limit: int = 10):
+        """search Method
+
+        The search method finds items by partial or misspelled name, e.g. for autocomplete.  It
+        returns up to limit item names, best first: an exact match, then names starting with the
+        query, then names with a later word starting with it, then fuzzy matches.  An item ID
+        returns that item's name.  The search index is built on first use and kept until the item
+        mappings change, price updates don't rebuild it.
+
+        Args:
+            query str: What the user typed so far
+            limit int: Maximum number of names to return
+
+        Returns:
+            list: Lowercased item names, usable with every other getter
+        """
+        query = str(query).lower().strip()
+        if query.isnumeric():
+            record = self.__snapshot[1].get(int(query))
+            return [record['name']] if record else []
+        index = self.__search_index
+        if index is None:
+            from OSRSBytes.Search import SearchIndex
+            index = self.__search_index = SearchIndex(self.__snapshot[0])
+        return index.search(query, limit)
+
     def getName(self, itemNameOrID: str):
         """getName Method
 
         The getName method, when supplied an Item Name or Item ID, returns a string value containing
         the in-game name of the Item.
         """
-        for itemid, x in self.item_dict.items():
-            if str(x['id']) == str(itemNameOrID) or str(x['name']).lower() == str(itemNameOrID):
-                return x['name'].lower()
+        item_dict, item_ids = self.__snapshot
+        if type(itemNameOrID) == int or str(itemNameOrID).isnumeric():
+            record = item_ids.get(int(itemNameOrID))
+        else:
+            record = item_dict.get(str(itemNameOrID))
+        if record:
+            return record['name'].lower()
 
     def getItemID(self, itemNameOrID: str):
         """getItemID method
@@ -211,7 +625,7 @@ class Items(object):
         The getItemID method, when supplied an Item Name or Item ID, returns a string value containing
         the Item ID of the Item.
         """
-        return self.item_dict[str(itemNameOrID).lower()]['id']
+        return self.__record(itemNameOrID)['id']
 
     def getBuyAverage(self, itemNameOrID: str):
         """getBuyAverage Method
@@ -219,7 +633,7 @@ class Items(object):
         The getBuyAverage method, when supplied an Item Name or Item ID, returns an integer value containing
         the Item's current in-game buy value.
         """
-        return self.item_dict[self.__normalize_input(str(itemNameOrID).lower())]['buy_average']
+        return self.__record(itemNameOrID)['buy_average']
 
     def getSellAverage(self, itemNameOrID: str):
         """getSellAverage Method
@@ -227,7 +641,7 @@ class Items(object):
         The getSellAverage method, when supplied an Item Name or Item ID, returns an integer value containing
         the Item's current in-game sell value.      
         """
-        return self.item_dict[self.__normalize_input(str(itemNameOrID).lower())]['sell_average']
+        return self.__record(itemNameOrID)['sell_average']
 
     def getBuyQuantity(self, itemNameOrID: str):
         """getBuyQuantity Method
@@ -235,7 +649,7 @@ class Items(object):
         The getBuyQuantity method, when supplied an Item Name or Item ID, returns an integer value containing
         the Item's current number of in-game buy orders.
         """
-        return self.item_dict[self.__normalize_input(str(itemNameOrID).lower())]['buy_quantity']
+        return self.__record(itemNameOrID)['buy_quantity']
 
     def getSellQuantity(self, itemNameOrID: str):
         """getSellQuantity Method
@@ -243,7 +657,7 @@ class Items(object):
         The getSellQuantity method, when supplied an Item Name or Item ID, returns an integer value containing
         the Item's current number of in-game sell orders.
         """     
-        return self.item_dict[self.__normalize_input(str(itemNameOrID).lower())]['sell_quantity']
+        return self.__record(itemNameOrID)['sell_quantity']
         
     def getBuyLimit(self, itemNameOrID: str):
         """getBuyLimit Method
@@ -252,7 +666,7 @@ class Items(object):
         the Grand Exchange Buy Limit for that item.  If a buy limit is not found, this method returns None
         """
         try:
-            return self.item_dict[self.__normalize_input(str(itemNameOrID).lower())]['buy_limit']
+            return self.__record(itemNameOrID)['buy_limit']
         except:
             return False
 
@@ -262,23 +676,25 @@ class Items(object):
         The getShopPrice method, when supplied an Item Name or Item ID, returns an integer value containing
         the in-game item's shop price
         """
-        return self.item_dict[self.__normalize_input(str(itemNameOrID).lower())]['sp']
+        return self.__record(itemNameOrID)['sp']
 
     def getLowAlchValue(self, itemNameOrID: str):
         """getLowAlchValue Method
 
         The getLowAlchValue method, when supplied an Item Name or Item ID, returns an integer value containing
-        the coin return value of casting Low Alchemy on the in-game item.
+        the coin return value of casting Low Alchemy on the in-game item, or None if it is not known.
+        The value comes with the item mappings, see alch_values().
         """
-        return math.ceil(self.item_dict[self.__normalize_input(str(itemNameOrID).lower())]['sp']*.40)
+        return self.__record(itemNameOrID).get('lowalch')
 
     def getHighAlchValue(self, itemNameOrID: str):
         """getHighAlchValue Method
 
         The getHighAlchValue method, when supplied an Item Name or Item ID, returns an integer value containing
-        the coin return value of casting High Alchemy on the in-game item.      
+        the coin return value of casting High Alchemy on the in-game item, or None if it is not known.
+        The value comes with the item mappings, see alch_values().
         """
-        return math.ceil(self.item_dict[self.__normalize_input(str(itemNameOrID).lower())]['sp']*.60)
+        return self.__record(itemNameOrID).get('highalch')
 
     def isMembers(self, itemNameOrID: str):
         """isMembers Method
@@ -286,19 +702,247 @@ class Items(object):
         The isMembers method, when supplied with an Item Name or Item ID, returns a boolean value dependant
         on whether the supplied item is Members Only or not.
         """
-        return bool(self.item_dict[self.__normalize_input(str(itemNameOrID).lower())]['members'])
+        return bool(self.__record(itemNameOrID)['members'])
     
-    def update(self):
+    def update(self, mappings: bool = None):
         """update Method
         
         The update method updates the item information in the object that it is called from and
-        prevents the need to reinitialize/recreate the Items object.
+        prevents the need to reinitialize/recreate the Items object.  Only /latest and /volumes are
+        refetched and applied to the existing item records; the item mappings are refetched (and
+        everything rebuilt) once they are older than the mapping TTL, or whenever mappings is True.
+        mappings=False never refetches them.
+
+        Returns:
+            set: The IDs of the items whose prices or volumes changed, also kept in changed_ids
+        """
+        return self._loadPayloads(*self.__getHTTPRequest(self._endpoints(mappings)))
+
+    def _refreshDelay(self, interval, jitter, max_backoff, failures):
+        """refreshDelay
+
+        Seconds to wait before the next background refresh: interval, doubled for every failure
+        in a row up to max_backoff, then spread by +/- jitter (a fraction) so that many processes
+        started together don't all hit the wiki at the same moment.
         """
-        prices, volumes, mappings = self.__getHTTPRequest()
-        self.itemname = self.__rectifyWikiResponse(prices, volumes, mappings) # Why did I name you this way?
-        self.item_dict = self.itemname
-        if not (self.item_dict):
-            raise APIDown(f'The API appears to be down, please try the other')
+        delay = min(interval * 2 ** failures, max(max_backoff, interval))
+        return delay * (1 + random.uniform(-jitter, jitter))
+
+    def startRefresh(self, interval: float = 60, jitter: float = 0.1, max_backoff: float = 900, mappings: bool = None):
+        """startRefresh Method
+
+        Starts refreshing the snapshot in a background daemon thread, calling update() every
+        interval seconds.  Readers never wait on a refresh: each update() builds the new snapshot
+        off to the side and swaps it in at once.  When the wiki is down (APIDown) the current
+        snapshot is kept, the error is stored in refresh_error and the wait doubles after each
+        failure, up to max_backoff seconds.  Any other error (a malformed payload, a failing
+        history database, ...) is handled the same way, so the thread never dies silently.
+
+        Args:
+            interval float: Seconds between refreshes
+            jitter float: Random spread of every wait, as a fraction of it (0.1 is +/- 10%)
+            max_backoff float: Longest wait after repeated failures
+            mappings bool: Passed to every update()
+
+        Returns:
+            threading.Thread: The refresher thread
+        """
+        self.stopRefresh()
+        stop = threading.Event()
+
+        def refresh():
+            failures = 0
+            while not stop.wait(self._refreshDelay(interval, jitter, max_backoff, failures)):
+                try:
+                    self.update(mappings)
+                except Exception as err:
+                    self.refresh_error = err
+                    failures += 1
+                else:
+                    self.refresh_error = None
+                    failures = 0
+
+        self.__refresh_stop = stop
+        self.__refresher = threading.Thread(target=refresh, name="OSRSBytes Items refresh", daemon=True)
+        self.__refresher.start()
+        return self.__refresher
+
+    def stopRefresh(self, timeout: float = None):
+        """stopRefresh Method
+
+        Stops the background refresher started by startRefresh(), waiting for an update() in
+        progress to finish.  Does nothing if no refresher is running.
+        """
+        if self.__refresher is None:
+            return
+        self.__refresh_stop.set()
+        if self.__refresher is not threading.current_thread():
+            self.__refresher.join(timeout)
+        self.__refresher = None
     ##########################
     #  END: Items Object     #
     ##########################
+
+#################################
+#  START: AsyncItems Object     #
+#################################
+class AsyncItems(Items):
+    """AsyncItems Object
+
+    The asyncio counterpart of Items.  Construction doesn't fetch anything, awaiting the object (or
+    its update() method) fetches the three wiki endpoints concurrently over a non-blocking transport
+    and builds the snapshot with the same parsing as Items.  Every getter is inherited unchanged.
+
+    Args:
+        Same as Items and in the same order, except
+        transport AsyncHTTPTransport: The transport to use, defaults to the shared one whose
+                                      semaphore bounds concurrency across all async clients.
+
+    Example Invocation:
+        from OSRSBytes import AsyncItems
+        items = await AsyncItems()
+        print(items.getBuyAverage('rune dagger'))
+        await items.update()
+    """
+
+    def __init__(self, application_name = None, application_contact = None, compact: bool = False,
+                 cache_dir: str = None, cache_ttl: dict = None, timeout: float = None, history = None,
+                 publish_to: str = None, transport = None):
+        self._configure(application_name, application_contact, compact, cache_dir, cache_ttl, timeout, history, publish_to)
+        self.__timeout = timeout
+        self.__transport = transport if transport else DEFAULT_ASYNC_TRANSPORT
+        self.__task = None
+
+    def __await__(self):
+        return self.update().__await__()
+
+    async def update(self, mappings: bool = None):
+        """update Method
+
+        Fetches the latest wiki data without blocking the event loop and applies it, the same way
+        Items.update() does.  Decoding the payloads and building the snapshot runs in the loop's
+        default executor, so other tasks keep running meanwhile.  Returns the object itself so that
+        construction can be awaited, the IDs of the items that changed are in changed_ids.
+        """
+        endpoints = self._endpoints(mappings)
+        bodies = await asyncio.gather(*(self.__fetch(endpoint, url) for endpoint, url in endpoints))
+        payloads = {endpoint: body for (endpoint, url), body in zip(endpoints, bodies)}
+        await asyncio.get_running_loop().run_in_executor(None, lambda: self._loadPayloads(*self._decodePayloads(payloads)))
+        return self
+
+    def startRefresh(self, interval: float = 60, jitter: float = 0.1, max_backoff: float = 900, mappings: bool = None):
+        """startRefresh Method
+
+        The asyncio form of Items.startRefresh(): refreshes in a task on the running event loop
+        instead of a thread, with the same interval, jitter and backoff.  Must be called from
+        within the event loop.
+
+        Returns:
+            asyncio.Task: The refresher task
+        """
+        self.stopRefresh()
+
+        async def refresh():
+            failures = 0
+            while True:
+                await asyncio.sleep(self._refreshDelay(interval, jitter, max_backoff, failures))
+                try:
+                    await self.update(mappings)
+                except Exception as err:
+                    self.refresh_error = err
+                    failures += 1
+                else:
+                    self.refresh_error = None
+                    failures = 0
+
+        self.__task = asyncio.get_running_loop().create_task(refresh())
+        return self.__task
+
+    def stopRefresh(self, timeout: float = None):
+        """stopRefresh Method
+
+        Cancels the refresher task started by startRefresh(), if any.
+        """
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+
+    async def __fetch(self, endpoint, url):
+        body, headers, entry = self._prepareRequest(endpoint)
+        if body is not None:
+            return body
+        try:
+            response = await self.__transport.request(url, headers, self.__timeout)
+        except TransportError as TE:
+            return self._settleResponse(endpoint, url, entry, None, TE)
+        return self._settleResponse(endpoint, url, entry, response)
+    ###############################
+    #  END: AsyncItems Object     #
+    ###############################
+
+#################################
+#  START: SharedItems Object    #
+#################################
+class SharedItems(Items):
+    """SharedItems Object
+
+    A read-only Items whose snapshot comes from a snapshot file published by another process
+    (Items(publish_to=...) or Items.publish()) instead of the wiki.  The file is memory-mapped, so
+    the numeric columns are shared zero-copy by every process attached to it.  update() is a local
+    header read that re-attaches only when the publisher has written a newer generation, which makes
+    startRefresh() with a short interval the usual way to follow the publisher.  Every getter is
+    inherited unchanged and works like Items(compact=True).
+
+    A snapshot that has been replaced stays mapped until the next one comes in, so readers still
+    using it can finish, and is then closed; don't keep item_dict for longer than that.
+
+    Args:
+        path str: The snapshot file
+
+    Example Invocation:
+        # one process
+        items = Items(publish_to='/dev/shm/osrsbytes/items.snapshot')
+        items.startRefresh(interval=60)
+
+        # every other process
+        items = SharedItems('/dev/shm/osrsbytes/items.snapshot')
+        items.startRefresh(interval=1, jitter=0)
+        print(items.getBuyAverage('rune dagger'))
+    """
+
+    def __init__(self, path: str):
+        self._configure(None, None, True, None, None, None)
+        self.path = path
+        self.generation = None
+        self.__retired = None
+        self.update()
+
+    def update(self, mappings: bool = None):
+        """update Method
+
+        Attaches to the latest published snapshot if it is newer than the current one.
+
+        Returns:
+            set: The IDs of every item when a new snapshot was attached, otherwise an empty set
+        Raises:
+            APIDown: The snapshot file is missing or unreadable
+        """
+        from OSRSBytes.Shared import SnapshotFileError, attach_table, read_header
+        try:
+            if read_header(self.path).generation == self.generation:
+                self.changed_ids = set()
+                return self.changed_ids
+            table, header = attach_table(self.path)
+        except SnapshotFileError as SFE:
+            raise APIDown("The shared snapshot is unavailable: {}".format(SFE)) from SFE
+        previous = self.item_dict if self.generation is not None else None
+        changed = self._swapSnapshot(table)
+        self.generation = header.generation
+        # Unmap the snapshot before the one that was just replaced
+        if self.__retired is not None:
+            self.__retired.close()
+        self.__retired = previous
+        return changed
+    ###############################
+    #  END: SharedItems Object    #
+    ###############################
@@ -0,0 +1,351 @@
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that features Item Information Lookup, Hiscores, and Market information.
+
+EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
+
+Recipes Module is responsible for the skill recipes bundled in OSRSBytes/modules (e.g. smithing.json).
+The recipe files are loaded once into a RecipeBook, which prices every recipe against an Items
+snapshot in one pass: input cost, product revenue, GE tax, profit and experience per coin spent.
+"""
+
+# Generic/Built-in Imports
+from array import array
+
+from OSRSBytes.Analytics import GE_TAX_CAP, GE_TAX_FREE_BELOW, GE_TAX_RATE, ge_tax
+from OSRSBytes.Utilities import MODULES, ModuleError
+
+# META Data
+__copyright__  = 'Copyright 2023, CFDeadlines'
+__credits__    = ['CFDeadlines (Lead Programmer, Creator)', 'Riley Fitzgibbons (Contributor)']
+__license__    = 'EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)'
+__version__    = '1.3.2'
+__maintainer__ = {
+        'CFDeadlines': 'cookm0803@gmail.com',
+        'Riley Fitz': "rileyfitzgibbons@gmail.com"
+    }
+__email__      = 'cookm0803@gmail.com'
+__status__     = 'Open'
+
+################
+#  Exceptions  #
+################
+class DoNotRunDirectly(Exception):
+    pass
+
+class RecipeError(Exception):
+    """RecipeError Exception
+
+    This exception is raised when a recipe file can't be read or doesn't describe valid recipes.
+    """
+    pass
+
+############################
+#  Do not run if __main__  #
+############################
+if __name__ == "__main__":
+    raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
+
+# Numeric result columns of RecipeBook.evaluate(), floats with nan where a price is missing:
+#   amount     items one action makes
+#   exp        experience for one action
+#   cost       the inputs of one action bought at the buy price
+#   revenue    the products of one action sold at the sell price
+#   tax        Grand Exchange tax on selling those products
+#   profit     revenue - tax - cost
+#   xp_per_gp  experience per coin lost (exp / -profit), inf for actions that don't lose money
+RESULT_COLUMNS = ('amount', 'exp', 'cost', 'revenue', 'tax', 'profit', 'xp_per_gp')
+
+NAN = float('nan')
+INF = float('inf')
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+class Recipe(object):
+    """Recipe Object
+
+    One skilling action: the items it uses up and the items it makes.
+
+    Args:
+        skill str: The skill, e.g. 'smithing'
+        name str: The lowercased item name of the product
+        amount int: How many products one action makes
+        level int: The level required, None if the recipe file doesn't say
+        exp float: Experience for one action, None if the recipe file doesn't say
+        inputs tuple: ((item name, quantity), ...) used up by one action
+    """
+    __slots__ = ('skill', 'name', 'amount', 'level', 'exp', 'inputs')
+
+    def __init__(self, skill, name, amount, level, exp, inputs):
+        self.skill = skill
+        self.name = name
+        self.amount = amount
+        self.level = level
+        self.exp = exp
+        self.inputs = tuple(inputs)
+
+    def __repr__(self):
+        return "Recipe({!r}, {!r}, amount={}, level={}, exp={}, inputs={})".format(
+            self.skill, self.name, self.amount, self.level, self.exp, self.inputs)
+
+def smithing_recipes(data: dict):
+    """smithing_recipes() function
+
+    Turns parsed smithing.json into Recipes.  Every metal has a bar (smelted from ores) and
+    products (smithed from bars).  Products without their own 'exp' earn the metal's 'multiplier'
+    per bar, products without an 'amount' make one.
+    """
+    recipes = []
+    try:
+        for metal, entries in data.items():
+            multiplier = entries.get('multiplier')
+            bar = entries.get('bar')
+            for key, entry in entries.items():
+                if key == 'multiplier':
+                    continue
+                requires = dict(entry.get('requires', {}))
+                level = requires.pop('level', None)
+                bars = requires.pop('bar_amount', 0)
+                inputs = [(ore.lower(), quantity) for ore, quantity in requires.items()]
+                if bars:
+                    if bar is None:
+                        raise RecipeError("smithing {} {} needs bars but {} has no bar".format(metal, key, metal))
+                    inputs.append((bar['name'].lower(), bars))
+                exp = entry.get('exp')
+                if exp is None and multiplier is not None and bars:
+                    exp = multiplier * bars
+                recipes.append(Recipe('smithing', entry['name'].lower(), entry.get('amount', 1), level, exp, inputs))
+    except (AttributeError, KeyError, TypeError) as err:
+        raise RecipeError("smithing.json is not a valid recipe file: {!r}".format(err)) from err
+    return recipes
+
+# Skill module name -> function turning its parsed JSON into Recipes
+RECIPE_PARSERS = {
+    'smithing': smithing_recipes,
+}
+
+def load_module(skill: str, modules = MODULES):
+    """load_module() function
+
+    Returns the parsed modules/<skill>.json from the module registry, which parses each file only
+    once.  An empty file (a skill that isn't filled in yet) parses as an empty dictionary.
+
+    Raises:
+        RecipeError: The file is missing or not valid JSON
+    """
+    try:
+        return modules[skill]
+    except KeyError:
+        raise RecipeError("No recipe module for {}, expected one of {}".format(skill, sorted(modules)))
+    except ModuleError as err:
+        raise RecipeError(str(err)) from err
+
+##############################
+#  START: RecipeBook Object  #
+##############################
+class RecipeBook(object):
+    """RecipeBook Object
+
+    An indexed, immutable set of recipes.  Every item a recipe uses or makes gets one slot in
+    names, and the recipes are flattened into typed arrays (one entry per recipe, one entry per
+    recipe input), so evaluate() prices every recipe with a handful of whole-array operations.
+
+    Args:
+        recipes iterable: Recipe objects
+    """
+
+    def __init__(self, recipes):
+        self.recipes = list(recipes)
+        self.names = []
+        slots = {}
+        def slot(name):
+            if name not in slots:
+                slots[name] = len(self.names)
+                self.names.append(name)
+            return slots[name]
+
+        self.__products = array('q')
+        self.__amounts = array('d')
+        self.__exp = array('d')
+        self.__input_recipes = array('q')
+        self.__input_items = array('q')
+        self.__input_amounts = array('d')
+        self.__by_product = {}
+        self.__by_input = {}
+        for index, recipe in enumerate(self.recipes):
+            self.__products.append(slot(recipe.name))
+            self.__amounts.append(recipe.amount)
+            self.__exp.append(NAN if recipe.exp is None else recipe.exp)
+            self.__by_product.setdefault(recipe.name, []).append(recipe)
+            for name, quantity in recipe.inputs:
+                self.__input_recipes.append(index)
+                self.__input_items.append(slot(name))
+                self.__input_amounts.append(quantity)
+                self.__by_input.setdefault(name, []).append(recipe)
+
+    @classmethod
+    def fromModules(cls, skills = None, modules = MODULES):
+        """fromModules method
+
+        Builds a RecipeBook from the recipe files bundled in OSRSBytes/modules.
+
+        Args:
+            skills list: The skills to load, every skill with a parser in RECIPE_PARSERS if None
+            modules ModuleRegistry: Where to read the recipe files from
+        Returns:
+            RecipeBook
+        """
+        recipes = []
+        for skill in (RECIPE_PARSERS if skills is None else skills):
+            if skill not in RECIPE_PARSERS:
+                raise RecipeError("No recipe parser for {}, expected one of {}".format(skill, sorted(RECIPE_PARSERS)))
+            recipes.extend(RECIPE_PARSERS[skill](load_module(skill, modules)))
+        return cls(recipes)
+
+    def makes(self, name: str):
+        """makes method
+
+        Returns the recipes that make the item called name.
+        """
+        return list(self.__by_product.get(name.lower(), ()))
+
+    def usedIn(self, name: str):
+        """usedIn method
+
+        Returns the recipes that use up the item called name.
+        """
+        return list(self.__by_input.get(name.lower(), ()))
+
+    def evaluate(self, items, buy_field: str = 'buy_average', sell_field: str = 'sell_average'):
+        """evaluate method
+
+        Prices every recipe against the current snapshot of items.  Every item name is resolved
+        once, then costs, revenues, tax and profit are computed for all recipes together (with
+        NumPy when it is installed).
+
+        Args:
+            items Items: Any Items object (Items, AsyncItems, SharedItems)
+            buy_field str: The item field inputs are bought at
+            sell_field str: The item field products are sold at
+        Returns:
+            RecipeResults
+        """
+        numpy = _numpy()
+        prices = items.getPrices(self.names, fields = (buy_field, sell_field), asArray = numpy is not None)
+        buy, sell = prices[buy_field], prices[sell_field]
+        if numpy is not None:
+            columns = self.__evaluateArrays(numpy, buy, sell)
+        else:
+            columns = self.__evaluateLists(
+                [NAN if price is None else float(price) for price in buy],
+                [NAN if price is None else float(price) for price in sell],
+            )
+        return RecipeResults(self.recipes, columns)
+
+    def __evaluateArrays(self, numpy, buy, sell):
+        amounts = numpy.frombuffer(self.__amounts, dtype=float)
+        exp = numpy.frombuffer(self.__exp, dtype=float)
+        inputs = numpy.frombuffer(self.__input_items, dtype=numpy.int64)
+        spent = numpy.frombuffer(self.__input_amounts, dtype=float) * buy[inputs]
+        cost = numpy.bincount(numpy.frombuffer(self.__input_recipes, dtype=numpy.int64), weights=spent, minlength=len(self.recipes))
+
+        price = sell[numpy.frombuffer(self.__products, dtype=numpy.int64)]
+        revenue = amounts * price
+        tax = amounts * numpy.where(price < GE_TAX_FREE_BELOW, 0.0, numpy.minimum(numpy.floor(price * GE_TAX_RATE), GE_TAX_CAP))
+        profit = revenue - tax - cost
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            xp_per_gp = numpy.where(profit < 0, exp / -profit, numpy.where(numpy.isnan(profit), numpy.nan, numpy.inf))
+        return {'amount': amounts, 'exp': exp, 'cost': cost, 'revenue': revenue, 'tax': tax, 'profit': profit, 'xp_per_gp': xp_per_gp}
+
+    def __evaluateLists(self, buy, sell):
+        cost = [0.0] * len(self.recipes)
+        for recipe, item, quantity in zip(self.__input_recipes, self.__input_items, self.__input_amounts):
+            cost[recipe] += quantity * buy[item]
+
+        price = [sell[product] for product in self.__products]
+        revenue = [amount * each for amount, each in zip(self.__amounts, price)]
+        tax = [NAN if each != each else amount * ge_tax(each) for amount, each in zip(self.__amounts, price)]
+        profit = [r - t - c for r, t, c in zip(revenue, tax, cost)]
+        xp_per_gp = [
+            exp / -gain if gain < 0 else (NAN if gain != gain else INF)
+            for exp, gain in zip(self.__exp, profit)
+        ]
+        return {'amount': list(self.__amounts), 'exp': list(self.__exp), 'cost': cost, 'revenue': revenue,
+                'tax': tax, 'profit': profit, 'xp_per_gp': xp_per_gp}
+
+    def __len__(self):
+        return len(self.recipes)
+    ############################
+    #  END: RecipeBook Object  #
+    ############################
+
+#################################
+#  START: RecipeResults Object  #
+#################################
+class RecipeResults(object):
+    """RecipeResults Object
+
+    The priced recipes returned by RecipeBook.evaluate().  columns holds one entry per recipe, in
+    recipes order, for every column in RESULT_COLUMNS (lists, or NumPy arrays when NumPy is installed).
+    """
+
+    def __init__(self, recipes, columns):
+        self.recipes = recipes
+        self.columns = columns
+
+    def row(self, index: int):
+        """row method
+
+        Returns one priced recipe as a dictionary, with None for values that couldn't be priced.
+        """
+        recipe = self.recipes[index]
+        record = {'skill': recipe.skill, 'name': recipe.name, 'level': recipe.level, 'inputs': recipe.inputs}
+        for column in RESULT_COLUMNS:
+            value = float(self.columns[column][index])
+            record[column] = None if value != value else value
+        return record
+
+    def top(self, metric: str = 'profit', limit: int = 10, level: int = None, skill: str = None, ascending: bool = False):
+        """top method
+
+        Ranks the recipes that could be priced by metric and returns the best limit of them.
+
+        Args:
+            metric str: One of RESULT_COLUMNS, e.g. 'profit' or 'xp_per_gp'
+            limit int: How many recipes to return
+            level int: Only recipes that need at most this level (recipes without a known level
+                       are kept)
+            skill str: Only recipes for this skill
+            ascending bool: Return the lowest values instead of the highest
+
+        Returns:
+            list: row() dictionaries, best first
+        """
+        if metric not in RESULT_COLUMNS:
+            raise ValueError("metric must be one of {}".format(RESULT_COLUMNS))
+        values = self.columns[metric]
+        ranked = []
+        for index, recipe in enumerate(self.recipes):
+            value = float(values[index])
+            if value != value:
+                continue
+            if level is not None and recipe.level is not None and recipe.level > level:
+                continue
+            if skill is not None and recipe.skill != skill:
+                continue
+            ranked.append((value if ascending else -value, index))
+        ranked.sort()
+        return [self.row(index) for value, index in ranked[:max(limit, 0)]]
+
+    def __len__(self):
+        return len(self.recipes)
+    ###############################
+    #  END: RecipeResults Object  #
+    ###############################
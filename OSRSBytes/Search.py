@@ -0,0 +1,206 @@
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that features Item Information Lookup, Hiscores, and Market information.
+
+EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
+
+Search Module holds the item name search behind Items.search(): prefix lookups for autocomplete and
+trigram based fuzzy matching for misspelled names.  The index is built once per set of item names
+and every query is a few binary searches and dictionary hits, not a scan over every item.
+"""
+
+# Generic/Built-in Imports
+from bisect import bisect_left
+from collections import Counter
+from itertools import chain
+
+# META Data
+__copyright__  = 'Copyright 2023, CFDeadlines'
+__credits__    = ['CFDeadlines (Lead Programmer, Creator)', 'Riley Fitzgibbons (Contributor)']
+__license__    = 'EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)'
+__version__    = '1.3.2'
+__maintainer__ = {
+        'CFDeadlines': 'cookm0803@gmail.com',
+        'Riley Fitz': "rileyfitzgibbons@gmail.com"
+    }
+__email__      = 'cookm0803@gmail.com'
+__status__     = 'Open'
+
+################
+#  Exceptions  #
+################
+class DoNotRunDirectly(Exception):
+    pass
+
+############################
+#  Do not run if __main__  #
+############################
+if __name__ == "__main__":
+    raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
+
+# Fuzzy matches scoring below this trigram (Dice) similarity are dropped
+MIN_SIMILARITY = 0.3
+
+# How many of the names sharing the most trigrams with the query are scored in full
+FUZZY_CANDIDATES = 20
+
+def trigrams(text: str):
+    """trigrams() function
+
+    Returns the set of three character slices of text, padded so that the start of the text and
+    the start of every word count extra.
+    """
+    padded = "  {} ".format(text.replace(" ", "  "))
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _pattern(text):
+    """Returns the bit masks edit_distance() needs for one side, so they can be built once per query"""
+    peq = {}
+    for position, char in enumerate(text):
+        peq[char] = peq.get(char, 0) | (1 << position)
+    return peq, len(text)
+
+def _distance(pattern, text):
+    peq, length = pattern
+    if not length or not text:
+        return length + len(text)
+    mask = (1 << length) - 1
+    high = 1 << (length - 1)
+    pv, mv, score = mask, 0, length
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    return score
+
+def edit_distance(a: str, b: str):
+    """edit_distance() function
+
+    Returns the Levenshtein distance between a and b.  Uses the bit-parallel algorithm of Myers
+    (in Hyyro's form): one column of the distance matrix is a pair of Python integers, so each
+    character of b costs a handful of integer operations instead of a loop over a.
+    """
+    return _distance(_pattern(a), b)
+
+###############################
+#  START: SearchIndex Object  #
+###############################
+class SearchIndex(object):
+    """SearchIndex Object
+
+    An immutable search index over item names.
+
+        * names are kept in a sorted list, so every name starting with a prefix is one
+          contiguous slice found with two binary searches
+        * every later word of a name is kept in a second sorted list of (word, name) pairs, so
+          'dagger' finds 'rune dagger'
+        * every name's trigrams are kept in an inverted index, so the names sharing the most
+          trigrams with a misspelled query are counted without looking at the others
+
+    Args:
+        names iterable: The lowercased item names to index
+    """
+
+    def __init__(self, names):
+        self.names = sorted(set(names))
+        self.words = sorted(
+            (word, name)
+            for name in self.names
+            for position, word in enumerate(name.split())
+            if position
+        )
+        self.__trigram_counts = []
+        postings = {}
+        for row, name in enumerate(self.names):
+            grams = trigrams(name)
+            self.__trigram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(row)
+        self.__postings = postings
+
+    def prefix(self, query: str, limit: int = 10):
+        """prefix method
+
+        Returns up to limit names starting with query, shortest first, followed by names with a
+        later word starting with query.
+        """
+        query = query.lower().strip()
+        if not query or limit <= 0:
+            return []
+        stop = query + '\uffff'
+        names = self.names
+        matches = sorted(names[bisect_left(names, query):bisect_left(names, stop)], key=len)[:limit]
+        if len(matches) < limit:
+            words = self.words
+            seen = set(matches)
+            later = sorted(
+                (name for word, name in words[bisect_left(words, (query,)):bisect_left(words, (stop,))]
+                 if name not in seen),
+                key=len,
+            )
+            matches.extend(dict.fromkeys(later))
+        return matches[:limit]
+
+    def fuzzy(self, query: str, limit: int = 10):
+        """fuzzy method
+
+        Returns up to limit names that look like query, best first.  Candidates are the names that
+        share the most trigrams with the query; they are ranked by trigram similarity and then by
+        edit distance.
+        """
+        query = query.lower().strip()
+        if not query or limit <= 0:
+            return []
+        grams = trigrams(query)
+        postings = self.__postings
+        shared = Counter(chain.from_iterable(postings[gram] for gram in grams if gram in postings))
+        counts = self.__trigram_counts
+        scored = []
+        for row, common in shared.most_common(max(FUZZY_CANDIDATES, limit)):
+            similarity = 2.0 * common / (len(grams) + counts[row])
+            if similarity >= MIN_SIMILARITY:
+                scored.append((-similarity, row))
+        if not scored:
+            return []
+        scored.sort()
+
+        # Edit distance only orders names of equal similarity, so it is only needed for the names
+        # that can still make the cut
+        cutoff = scored[min(limit, len(scored)) - 1][0]
+        pattern = _pattern(query)
+        ranked = sorted(
+            (similarity, _distance(pattern, self.names[row]), len(self.names[row]), self.names[row])
+            for similarity, row in scored
+            if similarity <= cutoff
+        )
+        return [name for similarity, distance, length, name in ranked[:limit]]
+
+    def search(self, query: str, limit: int = 10):
+        """search method
+
+        Returns up to limit names for query: an exact match first, then prefix matches (see
+        prefix()), then fuzzy matches (see fuzzy()) to fill up the rest.
+        """
+        matches = self.prefix(query, limit)
+        if len(matches) < limit:
+            seen = set(matches)
+            matches.extend(name for name in self.fuzzy(query, limit) if name not in seen)
+        return matches[:limit]
+
+    def __len__(self):
+        return len(self.names)
+    #############################
+    #  END: SearchIndex Object  #
+    #############################
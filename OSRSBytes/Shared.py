@@ -0,0 +1,241 @@
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that features Item Information Lookup, Hiscores, and Market information.
+
+EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
+
+Shared Module is responsible for sharing one market snapshot between processes.  One process writes
+the ItemTable to a snapshot file, every other process memory-maps it read-only, so N worker processes
+share one copy of the numeric columns through the page cache instead of each downloading and holding
+their own.
+"""
+
+# Generic/Built-in Imports
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from array import array
+
+from OSRSBytes.ItemTable import COLUMNS, ItemTable
+
+# META Data
+__copyright__  = 'Copyright 2023, CFDeadlines'
+__credits__    = ['CFDeadlines (Lead Programmer, Creator)', 'Riley Fitzgibbons (Contributor)']
+__license__    = 'EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)'
+__version__    = '1.3.2'
+__maintainer__ = {
+        'CFDeadlines': 'cookm0803@gmail.com',
+        'Riley Fitz': "rileyfitzgibbons@gmail.com"
+    }
+__email__      = 'cookm0803@gmail.com'
+__status__     = 'Open'
+
+################
+#  Exceptions  #
+################
+class DoNotRunDirectly(Exception):
+    pass
+
+class SnapshotFileError(Exception):
+    """SnapshotFileError Exception
+
+    This exception is raised when a snapshot file is missing, truncated, or written by an
+    incompatible version of OSRSBytes.
+    """
+    pass
+
+############################
+#  Do not run if __main__  #
+############################
+if __name__ == "__main__":
+    raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
+
+# Snapshot file layout (all little endian):
+#   header   magic, format version, rows, generation, published (unix time), metadata length
+#   metadata JSON {'columns': [...], 'names': [...], 'examines': [...], 'members': [...]}, padded to 8 bytes
+#   columns  rows int64 values per column, in metadata 'columns' order
+SNAPSHOT_MAGIC = b'OSRSITEM'
+SNAPSHOT_FORMAT = 1
+HEADER = struct.Struct('<8sIIQdQ')
+
+# Held from reading the current generation to renaming the new file into place, so publishers in
+# one process never hand out the same generation twice
+_PUBLISH_LOCK = threading.Lock()
+
+class SnapshotHeader(object):
+    """SnapshotHeader Object
+
+    The fixed size header at the start of a snapshot file.  generation goes up by one with every
+    publish, so readers can tell whether the file changed by reading just the header.
+    """
+    __slots__ = ('format_version', 'rows', 'generation', 'published', 'metadata_length')
+
+    def __init__(self, format_version, rows, generation, published, metadata_length):
+        self.format_version = format_version
+        self.rows = rows
+        self.generation = generation
+        self.published = published
+        self.metadata_length = metadata_length
+
+    @classmethod
+    def unpack(cls, data):
+        if len(data) < HEADER.size:
+            raise SnapshotFileError("Snapshot file is truncated")
+        magic, format_version, rows, generation, published, metadata_length = HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotFileError("Not an OSRSBytes snapshot file")
+        if format_version != SNAPSHOT_FORMAT:
+            raise SnapshotFileError("Unsupported snapshot format {}, expected {}".format(format_version, SNAPSHOT_FORMAT))
+        return cls(format_version, rows, generation, published, metadata_length)
+
+def read_header(path: str):
+    """read_header() function
+
+    Reads only the header of a snapshot file.
+
+    Raises:
+        SnapshotFileError: The file is missing or not a snapshot file
+    """
+    try:
+        with open(os.path.expanduser(path), 'rb') as f:
+            return SnapshotHeader.unpack(f.read(HEADER.size))
+    except OSError as err:
+        raise SnapshotFileError("Could not read snapshot {}: {}".format(path, err)) from err
+
+def publish_table(table: ItemTable, path: str):
+    """publish_table() function
+
+    Writes table to the snapshot file at path with the next generation number.  The file is written
+    next to path and renamed over it, so readers that have the old file mapped keep a complete
+    (old) snapshot and new readers get a complete new one.
+
+    Publishes to one path are serialised within a process, but the generation is read from the
+    current file, so only one process should publish to a given path.
+
+    Returns:
+        int: The generation that was published
+    """
+    path = os.path.abspath(os.path.expanduser(path))
+    metadata = json.dumps({
+        'columns': list(COLUMNS),
+        'names': table.names,
+        'examines': table.examines,
+        'members': list(table.members),
+    }).encode()
+    metadata += b' ' * (-(HEADER.size + len(metadata)) % 8)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with _PUBLISH_LOCK:
+        try:
+            generation = read_header(path).generation + 1
+        except SnapshotFileError:
+            generation = 1
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, len(table), generation, time.time(), len(metadata)))
+                f.write(metadata)
+                for column in COLUMNS:
+                    values = table.columns[column]
+                    if sys.byteorder != 'little':
+                        values = array('q', values)
+                        values.byteswap()
+                    f.write(memoryview(values).cast('B'))
+            # mkstemp creates the file readable by its owner only
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+    return generation
+
+###############################
+#  START: MappedTable Object  #
+###############################
+class MappedTable(ItemTable):
+    """MappedTable Object
+
+    The ItemTable attach_table() returns.  It owns the memory mapping its numeric columns point
+    into, and close() releases the columns and unmaps the file.  The table can't be read after
+    that.
+    """
+
+    def __init__(self, names, examines, members, columns, mapping):
+        super().__init__(names, examines, members, columns)
+        self.mapping = mapping
+
+    def close(self):
+        """close method
+
+        Releases the column views and closes the mapping.  If something else still holds a view
+        into the mapping it is left to be unmapped once that is dropped.  Closing twice is a no-op.
+        """
+        if self.mapping is None:
+            return
+        for values in self.columns.values():
+            if isinstance(values, memoryview):
+                try:
+                    values.release()
+                except BufferError:
+                    # Exported, e.g. through column(asArray=True), mmap.close() fails below as well
+                    pass
+        try:
+            self.mapping.close()
+        except BufferError:
+            pass
+        self.mapping = None
+    #############################
+    #  END: MappedTable Object  #
+    #############################
+
+def attach_table(path: str):
+    """attach_table() function
+
+    Maps the snapshot file at path read-only and returns a MappedTable whose numeric columns are
+    memoryviews straight into the mapping (no copy).  Names and examine texts are decoded once.
+    The mapping stays valid after the publisher replaces the file, until the table is closed.
+
+    Returns:
+        tuple: (MappedTable, SnapshotHeader)
+    Raises:
+        SnapshotFileError: The file is missing, truncated or not a snapshot file
+    """
+    path = os.path.expanduser(path)
+    try:
+        with open(path, 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as err:
+        raise SnapshotFileError("Could not map snapshot {}: {}".format(path, err)) from err
+
+    try:
+        header = SnapshotHeader.unpack(mapping)
+        offset = HEADER.size + header.metadata_length
+        try:
+            metadata = json.loads(mapping[HEADER.size:offset])
+        except ValueError as err:
+            raise SnapshotFileError("Snapshot {} has corrupt metadata".format(path)) from err
+        if len(mapping) < offset + 8 * header.rows * len(metadata['columns']):
+            raise SnapshotFileError("Snapshot file is truncated")
+    except SnapshotFileError:
+        mapping.close()
+        raise
+
+    columns = {}
+    with memoryview(mapping) as view:
+        for column in metadata['columns']:
+            with view[offset:offset + 8 * header.rows] as raw:
+                values = raw.cast('q')
+            if sys.byteorder != 'little':
+                values = array('q', values)
+                values.byteswap()
+            columns[column] = values
+            offset += 8 * header.rows
+    names = [sys.intern(name) for name in metadata['names']]
+    return MappedTable(names, metadata['examines'], array('b', metadata['members']), columns, mapping), header
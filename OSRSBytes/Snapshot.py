@@ -0,0 +1,302 @@
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that features Item Information Lookup, Hiscores, and Market information.
+
+EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
+
+Snapshot Module holds the compact record types for parsed hiscores data.  A PlayerSnapshot keeps a
+whole player in two integer arrays instead of nested dictionaries, which matters when tens of
+thousands of players are held in memory at once.
+"""
+
+# Generic/Built-in Imports
+import time
+from array import array
+from collections import namedtuple
+
+from OSRSBytes.Experience import MAX_EXPERIENCE, XP_TABLE
+
+# META Data
+__copyright__  = 'Copyright 2023, CFDeadlines'
+__credits__    = ['CFDeadlines (Lead Programmer, Creator)', 'Riley Fitzgibbons (Contributor)']
+__license__    = 'EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)'
+__version__    = '1.3.2'
+__maintainer__ = {
+        'CFDeadlines': 'cookm0803@gmail.com',
+        'Riley Fitz': "rileyfitzgibbons@gmail.com"
+    }
+__email__      = 'cookm0803@gmail.com'
+__status__     = 'Open'
+
+################
+#  Exceptions  #
+################
+class DoNotRunDirectly(Exception):
+    pass
+
+############################
+#  Do not run if __main__  #
+############################
+if __name__ == "__main__":
+    raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
+
+SKILLS = (
+    'attack',
+    'defense',
+    'strength',
+    'hitpoints',
+    'ranged',
+    'prayer',
+    'magic',
+    'cooking',
+    'woodcutting',
+    'fletching',
+    'fishing',
+    'firemaking',
+    'crafting',
+    'smithing',
+    'mining',
+    'herblore',
+    'agility',
+    'thieving',
+    'slayer',
+    'farming',
+    'runecrafting',
+    'hunter',
+    'construction',
+)
+
+BOUNTY_HUNTER = (
+    "hunter",
+    "rogue",
+    "hunter_legacy",
+    "rogue_legacy",
+)
+
+CLUE_TIERS = (
+    "all",
+    "beginner",
+    "easy",
+    "medium",
+    "hard",
+    "elite",
+    "master",
+)
+
+# I partake in none of this so if someone wants to clear this up
+# please feel free to
+LMS_ARENA_SW = (
+    "lms_rank",
+    "pvp_arena_rank",
+    "soul_wars_zeal",
+)
+
+# The index_lite.ws response is one "rank,level,experience" or "rank,score" line per entry, in a
+# fixed order.  Each row is (section, entry names, line kind); the line after the overall total
+# row is the first skill.  Boss names aren't fixed, None is replaced with the scraped boss list.
+INDEX_LITE_LAYOUT = (
+    ('stats', SKILLS, 'skill'),
+    (None, 2, 'skip'), # "unknown" rows (open issue if you know them)
+    ('bounties', BOUNTY_HUNTER, 'activity'),
+    ('clues', CLUE_TIERS, 'activity'),
+    ('lms_arenas_sw', LMS_ARENA_SW, 'activity'),
+    ('bosses', None, 'activity'),
+)
+
+ACTIVITY_SECTIONS = tuple(section for section, names, kind in INDEX_LITE_LAYOUT if kind == 'activity')
+
+# Row of every skill in PlayerSnapshot.skills ('total' is row 0)
+SKILL_ROWS = {name: row for row, name in enumerate(('total',) + SKILLS)}
+
+# Name -> row within its section for the fixed activity sections
+ACTIVITY_ROWS = {
+    section: {name: row for row, name in enumerate(names)}
+    for section, names, kind in INDEX_LITE_LAYOUT
+    if kind == 'activity' and names is not None
+}
+
+#################################
+#  START: Record Objects        #
+#################################
+class SkillEntry(namedtuple('SkillEntry', ('rank', 'level', 'experience'))):
+    """SkillEntry Object
+
+    An immutable (rank, level, experience) record.  The experience needed for the next level is
+    derived from the XP table rather than stored.
+    """
+    __slots__ = ()
+
+    @property
+    def next_level_exp(self):
+        if self.experience == MAX_EXPERIENCE:
+            return 0
+        return XP_TABLE[self.level + 1]
+
+    @property
+    def exp_to_next_level(self):
+        if self.experience == MAX_EXPERIENCE:
+            return 0
+        return XP_TABLE[self.level + 1] - self.experience
+
+    def asDict(self):
+        return {
+            'rank': self.rank,
+            'level': self.level,
+            'experience': self.experience,
+            'next_level_exp': self.next_level_exp,
+            'exp_to_next_level': self.exp_to_next_level,
+        }
+
+
+class ActivityEntry(namedtuple('ActivityEntry', ('rank', 'score'))):
+    """ActivityEntry Object
+
+    An immutable (rank, score) record, used for bounty hunter, clues, LMS/PvP Arena/Soul Wars and bosses.
+    """
+    __slots__ = ()
+
+    def asDict(self):
+        return {'rank': self.rank, 'score': self.score}
+
+
+class PlayerSnapshot(object):
+    """PlayerSnapshot Object
+
+    One player's parsed hiscores.  Skills are kept as rank, level, experience triples in a single
+    array('q') (row 0 is the overall total) and every activity as rank, score pairs in a single
+    array('i'), in index_lite order.  The boss list is shared by reference with every other
+    snapshot parsed against it.  Entries are handed out as SkillEntry/ActivityEntry records.
+
+    If the response was shorter than the layout, the arrays are simply shorter and the missing
+    entries don't exist.
+
+    Args:
+        username str: The player the snapshot belongs to
+        actype str: The account type
+        skills array: rank, level, experience triples
+        activities array: rank, score pairs
+        bosses tuple: Boss names in hiscores order
+        timestamp float: When the snapshot was taken, defaults to now
+    """
+    __slots__ = ('username', 'actype', 'timestamp', 'skills', 'activities', 'bosses')
+
+    def __init__(self, username, actype, skills, activities, bosses, timestamp = None):
+        self.username = username
+        self.actype = actype
+        self.skills = skills
+        self.activities = activities
+        self.bosses = bosses
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    @classmethod
+    def fromIndexLite(cls, text: str, bosses = (), username: str = '', actype: str = 'N', timestamp = None):
+        """fromIndexLite method
+
+        Parses an index_lite.ws response in a single forward pass over its lines, driven by
+        INDEX_LITE_LAYOUT, straight into the snapshot arrays.
+        """
+        lines = text.split("\n")
+        skills = array('q', (int(value) for value in lines[0].split(",")[:3]))
+        activities = array('i')
+        cursor = 1
+        end = len(lines)
+
+        for section, names, kind in INDEX_LITE_LAYOUT:
+            if kind == 'skip':
+                cursor += names
+                continue
+            count = len(bosses if names is None else names)
+            stop = min(cursor + count, end)
+            target = skills if kind == 'skill' else activities
+            width = 3 if kind == 'skill' else 2
+            while cursor < stop and lines[cursor]:
+                target.extend(int(value) for value in lines[cursor].split(",")[:width])
+                cursor += 1
+            if cursor < stop:
+                break
+        return cls(username, actype, skills, activities, bosses, timestamp)
+
+    def __activityRow(self, section, name):
+        if section == 'bosses':
+            try:
+                row = self.bosses.index(name)
+            except ValueError:
+                return None
+        else:
+            row = ACTIVITY_ROWS[section].get(name)
+            if row is None:
+                return None
+        return self.__sectionStart(section) + row
+
+    @staticmethod
+    def __sectionStart(section):
+        """Returns the row of the first entry of section in activities"""
+        start = 0
+        for previous in ACTIVITY_SECTIONS:
+            if previous == section:
+                break
+            start += len(ACTIVITY_ROWS[previous])
+        return start
+
+    def skill(self, name: str):
+        """skill method
+
+        Returns the SkillEntry for a skill ('total' for the overall row), or None if the snapshot
+        has no such skill.
+        """
+        row = SKILL_ROWS.get(name)
+        if row is None or 3 * row + 3 > len(self.skills):
+            return None
+        offset = 3 * row
+        return SkillEntry(self.skills[offset], self.skills[offset + 1], self.skills[offset + 2])
+
+    def activity(self, section: str, name: str):
+        """activity method
+
+        Returns the ActivityEntry for name in section ('bounties', 'clues', 'lms_arenas_sw' or
+        'bosses'), or None if the snapshot has no such entry.
+        """
+        row = self.__activityRow(section, name)
+        if row is None or 2 * row + 2 > len(self.activities):
+            return None
+        return ActivityEntry(self.activities[2 * row], self.activities[2 * row + 1])
+
+    def section(self, section: str):
+        """section method
+
+        Returns one section as the dictionary Hiscores has always exposed for a single user,
+        e.g. section('clues') -> {'all': {'rank': 1, 'score': 2}, ...}.  The 'stats' section
+        keeps its 'total' row as strings, as it always has been.
+        """
+        if section == 'stats':
+            subset = {}
+            total = self.skill('total')
+            subset['total'] = {'rank': str(total.rank), 'level': str(total.level), 'experience': str(total.experience)}
+            for name in SKILLS:
+                entry = self.skill(name)
+                if entry is None:
+                    break
+                subset[name] = entry.asDict()
+            return subset
+
+        names = self.bosses if section == 'bosses' else ACTIVITY_ROWS[section]
+        activities = self.activities
+        start = self.__sectionStart(section)
+        subset = {}
+        for row, name in enumerate(names, start):
+            if 2 * row + 2 > len(activities):
+                break
+            subset[name] = {'rank': activities[2 * row], 'score': activities[2 * row + 1]}
+        return subset
+
+    def asDicts(self):
+        """asDicts method
+
+        Returns every section as {section: dictionary}, see section().
+        """
+        return {section: self.section(section) for section in ('stats',) + ACTIVITY_SECTIONS}
+    ###############################
+    #  END: Record Objects        #
+    ###############################
@@ -0,0 +1,288 @@
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that features Item Information Lookup, Hiscores, and Market information.
+
+EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
+
+Tracker Module is responsible for keeping player hiscores over time and answering questions about
+what changed, e.g. experience gained in a week.  Anything that stores or compares snapshots of the
+same player should go in the Tracker Module.
+"""
+
+# Generic/Built-in Imports
+import json
+import os
+import sqlite3
+import sys
+import threading
+import zlib
+from array import array
+
+from OSRSBytes.Snapshot import ACTIVITY_ROWS, BOUNTY_HUNTER, CLUE_TIERS, LMS_ARENA_SW, SKILLS, PlayerSnapshot
+
+# META Data
+__copyright__  = 'Copyright 2023, CFDeadlines'
+__credits__    = ['CFDeadlines (Lead Programmer, Creator)', 'Riley Fitzgibbons (Contributor)']
+__license__    = 'EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)'
+__version__    = '1.3.2'
+__maintainer__ = {
+        'CFDeadlines': 'cookm0803@gmail.com',
+        'Riley Fitz': "rileyfitzgibbons@gmail.com"
+    }
+__email__      = 'cookm0803@gmail.com'
+__status__     = 'Open'
+
+################
+#  Exceptions  #
+################
+class DoNotRunDirectly(Exception):
+    pass
+
+class TrackerError(Exception):
+    pass
+
+############################
+#  Do not run if __main__  #
+############################
+if __name__ == "__main__":
+    raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS layouts ("
+    "id INTEGER PRIMARY KEY, bosses TEXT NOT NULL UNIQUE)",
+    "CREATE TABLE IF NOT EXISTS snapshots ("
+    "player TEXT NOT NULL, actype TEXT NOT NULL, ts REAL NOT NULL, layout INTEGER NOT NULL, "
+    "keyframe INTEGER NOT NULL, skill_count INTEGER NOT NULL, data BLOB NOT NULL, "
+    "PRIMARY KEY (player, actype, ts))",
+    "CREATE INDEX IF NOT EXISTS snapshots_ts ON snapshots (actype, ts)",
+)
+
+def _encode(values):
+    data = array('q', values)
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return zlib.compress(data.tobytes())
+
+def _decode(blob):
+    data = array('q')
+    data.frombytes(zlib.decompress(blob))
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return data
+
+#################################
+#  START: SnapshotStore Object  #
+#################################
+class SnapshotStore(object):
+    """SnapshotStore Object
+
+    The SnapshotStore object records PlayerSnapshots in a SQLite database and answers range
+    queries over them.  Each player's snapshots form a chain: every keyframe_interval-th row (and
+    the first one, or one after the boss list changed) stores every value, the rows in between only
+    store the difference to the previous row.  Rows are zlib compressed, and since most values don't
+    move between polls the deltas are nearly all zeros and shrink to a few dozen bytes.
+
+    Snapshots of a player must be added in time order.
+
+    Args:
+        path str: The database file, created if missing (':memory:' for a throwaway store)
+        keyframe_interval int: Rows between full keyframes, bounds how many deltas a read replays
+
+    Example Invocation:
+        store = SnapshotStore('~/.local/share/osrsbytes/snapshots.sqlite')
+        store.add(Hiscores('Zezima').snapshot)
+        print(store.gains('zezima', week_ago, now)['skills']['attack'])
+        print(store.topGainers('slayer', week_ago, now, limit=10))
+    """
+
+    def __init__(self, path: str, keyframe_interval: int = 32):
+        if path != ':memory:':
+            path = os.path.abspath(os.path.expanduser(path))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.__db = sqlite3.connect(path, check_same_thread=False)
+        self.__lock = threading.Lock()
+        self.__layouts = {}
+        self.__layout_ids = {}
+        self.__last = {}
+        with self.__db:
+            for statement in SCHEMA:
+                self.__db.execute(statement)
+        for layout, bosses in self.__db.execute("SELECT id, bosses FROM layouts"):
+            self.__layouts[layout] = tuple(json.loads(bosses))
+            self.__layout_ids[self.__layouts[layout]] = layout
+
+    def __layout(self, bosses):
+        bosses = tuple(bosses)
+        layout = self.__layout_ids.get(bosses)
+        if layout is None:
+            cursor = self.__db.execute("INSERT INTO layouts (bosses) VALUES (?)", (json.dumps(bosses),))
+            layout = cursor.lastrowid
+            self.__layouts[layout] = bosses
+            self.__layout_ids[bosses] = layout
+        return layout
+
+    def add(self, snapshot):
+        """add method
+
+        Records a PlayerSnapshot (or a Hiscores object, its snapshot is used).
+
+        Raises:
+            TrackerError: The snapshot is not newer than the player's latest stored snapshot
+        """
+        snapshot = getattr(snapshot, 'snapshot', snapshot)
+        key = (snapshot.username, snapshot.actype)
+        values = list(snapshot.skills) + list(snapshot.activities)
+
+        with self.__lock, self.__db:
+            layout = self.__layout(snapshot.bosses)
+            last = self.__last.get(key)
+            if last is None:
+                latest = self.__db.execute(
+                    "SELECT MAX(ts) FROM snapshots WHERE player = ? AND actype = ?", key
+                ).fetchone()[0]
+                if latest is not None and snapshot.timestamp <= latest:
+                    raise TrackerError("Snapshots of {} must be added in time order".format(snapshot.username))
+            elif snapshot.timestamp <= last[0]:
+                raise TrackerError("Snapshots of {} must be added in time order".format(snapshot.username))
+
+            keyframe = (
+                last is None
+                or last[1] != layout
+                or len(last[2]) != len(values)
+                or last[3] + 1 >= self.keyframe_interval
+            )
+            if keyframe:
+                data = values
+                since_keyframe = 0
+            else:
+                data = [value - previous for value, previous in zip(values, last[2])]
+                since_keyframe = last[3] + 1
+
+            self.__db.execute(
+                "INSERT INTO snapshots (player, actype, ts, layout, keyframe, skill_count, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                key + (snapshot.timestamp, layout, int(keyframe), len(snapshot.skills), _encode(data)),
+            )
+            self.__last[key] = (snapshot.timestamp, layout, values, since_keyframe)
+
+    def __rows(self, player, actype, start, end):
+        return self.__db.execute(
+            "SELECT ts, layout, keyframe, skill_count, data FROM snapshots "
+            "WHERE player = ? AND actype = ? AND ts >= ? AND ts <= ? ORDER BY ts",
+            (player, actype, start, end),
+        )
+
+    def __replay(self, player, actype, start, end):
+        """Yields (ts, layout, skill_count, values) for every snapshot of a player between start and end"""
+        keyframe_ts = self.__db.execute(
+            "SELECT MAX(ts) FROM snapshots WHERE player = ? AND actype = ? AND ts <= ? AND keyframe = 1",
+            (player, actype, start),
+        ).fetchone()[0]
+        values = None
+        for ts, layout, keyframe, skill_count, data in self.__rows(player, actype, keyframe_ts if keyframe_ts is not None else start, end):
+            data = _decode(data)
+            if keyframe or values is None:
+                values = data
+            else:
+                values = array('q', [previous + delta for previous, delta in zip(values, data)])
+            if ts >= start:
+                yield ts, layout, skill_count, values
+
+    def __snapshot(self, player, actype, ts, layout, skill_count, values):
+        return PlayerSnapshot(player, actype, values[:skill_count], array('i', values[skill_count:]), self.__layouts[layout], ts)
+
+    def snapshots(self, username: str, start: float = float('-inf'), end: float = float('inf'), actype: str = 'N'):
+        """snapshots method
+
+        Returns every stored PlayerSnapshot of a player between start and end (inclusive, unix
+        timestamps), oldest first.
+        """
+        username = username.lower()
+        with self.__lock:
+            return [self.__snapshot(username, actype, *row) for row in self.__replay(username, actype, start, end)]
+
+    def __endpoints(self, username, actype, start, end):
+        """Returns the first and last PlayerSnapshot of a player between start and end, or None"""
+        first_ts, last_ts = self.__db.execute(
+            "SELECT MIN(ts), MAX(ts) FROM snapshots WHERE player = ? AND actype = ? AND ts >= ? AND ts <= ?",
+            (username, actype, start, end),
+        ).fetchone()
+        if first_ts is None:
+            return None
+        first = last = None
+        for row in self.__replay(username, actype, first_ts, last_ts):
+            if first is None:
+                first = row
+            last = row
+        return self.__snapshot(username, actype, *first), self.__snapshot(username, actype, *last)
+
+    def gains(self, username: str, start: float, end: float, actype: str = 'N'):
+        """gains method
+
+        Returns what a player gained between their first and last snapshot within start and end:
+        experience per skill (and 'total') and score per clue tier, boss and other activity.
+        Unranked values count as 0.  Returns None when there is no snapshot in the range.
+
+        Returns:
+            dict: {'skills': {...}, 'bounties': {...}, 'clues': {...}, 'lms_arenas_sw': {...},
+                   'bosses': {...}}
+        """
+        username = username.lower()
+        with self.__lock:
+            endpoints = self.__endpoints(username, actype, start, end)
+        if endpoints is None:
+            return None
+        first, last = endpoints
+
+        gains = {'skills': {}}
+        for name in ('total',) + SKILLS:
+            before, after = first.skill(name), last.skill(name)
+            if before is not None and after is not None:
+                gains['skills'][name] = max(after.experience, 0) - max(before.experience, 0)
+        for section, names in (('bounties', BOUNTY_HUNTER), ('clues', CLUE_TIERS),
+                               ('lms_arenas_sw', LMS_ARENA_SW), ('bosses', last.bosses)):
+            gains[section] = {}
+            for name in names:
+                before, after = first.activity(section, name), last.activity(section, name)
+                if after is not None:
+                    gains[section][name] = max(after.score, 0) - (max(before.score, 0) if before is not None else 0)
+        return gains
+
+    def topGainers(self, skill: str, start: float, end: float, limit: int = 10, actype: str = 'N'):
+        """topGainers method
+
+        Ranks every player with snapshots between start and end by experience gained in skill (a
+        skill name or 'total'), or by score gained when skill is a boss, clue tier or activity.
+
+        Returns:
+            list: [(username, gained), ...] best first, at most limit entries
+        """
+        skill = skill.lower()
+        with self.__lock:
+            players = [row[0] for row in self.__db.execute(
+                "SELECT DISTINCT player FROM snapshots WHERE actype = ? AND ts >= ? AND ts <= ?",
+                (actype, start, end),
+            )]
+            ranking = []
+            for player in players:
+                first, last = self.__endpoints(player, actype, start, end)
+                if skill == 'total' or skill in SKILLS:
+                    before, after = first.skill(skill), last.skill(skill)
+                    gained = None if before is None or after is None else max(after.experience, 0) - max(before.experience, 0)
+                else:
+                    section = next((section for section, rows in ACTIVITY_ROWS.items() if skill in rows), 'bosses')
+                    before, after = first.activity(section, skill), last.activity(section, skill)
+                    gained = None if after is None else max(after.score, 0) - (max(before.score, 0) if before is not None else 0)
+                if gained is not None:
+                    ranking.append((player, gained))
+        ranking.sort(key=lambda entry: entry[1], reverse=True)
+        return ranking[:limit]
+
+    def close(self):
+        self.__db.close()
+    ###############################
+    #  END: SnapshotStore Object  #
+    ###############################
@@ -0,0 +1,529 @@
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that features Item Information Lookup, Hiscores, and Market information.
+
+EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
+
+Transport Module is responsible for the HTTP connections made to the OSRS and RuneWiki APIs.  Changes
+that involve how requests are sent (connection reuse, timeouts, compression) should go in the Transport Module.
+"""
+
+# Generic/Built-in Imports
+import asyncio
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import urllib.parse
+
+# META Data
+__copyright__  = 'Copyright 2023, CFDeadlines'
+__credits__    = ['CFDeadlines (Lead Programmer, Creator)', 'Riley Fitzgibbons (Contributor)']
+__license__    = 'EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)'
+__version__    = '1.3.2'
+__maintainer__ = {
+        'CFDeadlines': 'cookm0803@gmail.com',
+        'Riley Fitz': "rileyfitzgibbons@gmail.com"
+    }
+__email__      = 'cookm0803@gmail.com'
+__status__     = 'Open'
+
+################
+#  Exceptions  #
+################
+class DoNotRunDirectly(Exception):
+    pass
+
+class TransportError(Exception):
+    """TransportError Exception
+
+    This exception is raised when a request could not be completed at all (connection refused,
+    timed out, dropped mid-response).  HTTP error statuses are not exceptions, they are returned
+    on the Response.
+    """
+    pass
+
+############################
+#  Do not run if __main__  #
+############################
+if __name__ == "__main__":
+    raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
+
+DEFAULT_TIMEOUT = 10
+
+#################################
+#  START: HTTPTransport Object  #
+#################################
+class Response(object):
+    """Response Object
+
+    A fully read HTTP response.  The body is already decompressed.
+    """
+    __slots__ = ('status', 'headers', 'body')
+
+    def __init__(self, status: int, headers: dict, body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+
+class HTTPTransport(object):
+    """HTTPTransport Object
+
+    The HTTPTransport object sends GET requests over a pool of keep-alive connections, kept per
+    host, so repeated requests to the same API reuse an open TLS connection instead of doing a new
+    handshake each time.  It is thread safe: every request checks out its own connection, so several
+    threads can have requests in flight at once, and the connection goes back in the pool afterwards.
+    Responses are requested gzip compressed and transparently decompressed.
+
+    Args:
+        timeout float: Socket timeout in seconds for each request
+        max_idle int: Maximum idle connections kept per host
+
+    Example Invocation:
+        transport = HTTPTransport(timeout=5)
+        response = transport.request('https://prices.runescape.wiki/api/v1/osrs/latest')
+        print(response.status, len(response.body))
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, max_idle: int = 8):
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.__idle = {}
+        self.__lock = threading.Lock()
+
+    def __acquire(self, scheme, host, timeout, fresh = False):
+        with self.__lock:
+            idle = self.__idle.get((scheme, host))
+            if fresh and idle:
+                # The pool for this host went stale, its other idle connections most likely did too
+                stale, self.__idle[(scheme, host)] = idle, []
+                for conn in stale:
+                    conn.close()
+            elif idle:
+                conn = idle.pop()
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, timeout=timeout), False
+        return http.client.HTTPConnection(host, timeout=timeout), False
+
+    def __release(self, scheme, host, conn):
+        with self.__lock:
+            idle = self.__idle.setdefault((scheme, host), [])
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, url: str, headers: dict = None, timeout: float = None):
+        """request method
+
+        Sends a GET request for url and returns the fully read Response.  A request that fails on
+        a reused connection (the server may have closed it while idle) is retried once on a new one,
+        dropping the host's other idle connections.  Timeouts are not retried.
+
+        Args:
+            url str: The full url to fetch
+            headers dict: Extra request headers
+            timeout float: Overrides the transport timeout for this request
+
+        Returns:
+            Response
+
+        Raises:
+            TransportError: The request could not be completed
+        """
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path = "{}?{}".format(path, parts.query)
+        request_headers = {'Accept-Encoding': 'gzip'}
+        request_headers.update(headers or {})
+        timeout = self.timeout if timeout is None else timeout
+
+        fresh = False
+        while True:
+            conn, reused = self.__acquire(parts.scheme, parts.netloc, timeout, fresh)
+            try:
+                conn.request('GET', path, headers=request_headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError) as err:
+                conn.close()
+                if reused and not isinstance(err, socket.timeout):
+                    fresh = True
+                    continue
+                raise TransportError("Request to {} failed: {}".format(url, err)) from err
+            break
+
+        if response.will_close:
+            conn.close()
+        else:
+            self.__release(parts.scheme, parts.netloc, conn)
+
+        response_headers = {key.lower(): value for key, value in response.getheaders()}
+        if response_headers.get('content-encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return Response(response.status, response_headers, body)
+
+    def close(self):
+        """close method
+
+        Closes every idle connection held by the pool.
+        """
+        with self.__lock:
+            idle, self.__idle = self.__idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+    ###############################
+    #  END: HTTPTransport Object  #
+    ###############################
+
+class RateLimiter(object):
+    """RateLimiter Object
+
+    Spaces out calls so that no more than rate of them start per second, across every thread
+    sharing the limiter.  wait() blocks until the caller's slot comes up.
+
+    Args:
+        rate float: Calls allowed per second
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self.__next = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def wait(self):
+        with self.__lock:
+            now = time.monotonic()
+            slot = max(now, self.__next)
+            self.__next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+######################################
+#  START: AsyncHTTPTransport Object  #
+######################################
+class AsyncHTTPTransport(object):
+    """AsyncHTTPTransport Object
+
+    The asyncio counterpart of HTTPTransport.  Requests are written straight onto asyncio streams,
+    so awaiting one never blocks the event loop, and open connections are kept per host and reused
+    the same way.  At most max_concurrency requests are in flight at once, the rest wait on a
+    semaphore.  The pool belongs to the event loop it was first used in; used from a new loop it
+    starts over with fresh connections.
+
+    Args:
+        timeout float: Timeout in seconds for each request, including connecting
+        max_concurrency int: Maximum number of requests in flight at once
+        max_idle int: Maximum idle connections kept per host
+
+    Example Invocation:
+        transport = AsyncHTTPTransport(max_concurrency=4)
+        response = await transport.request('https://prices.runescape.wiki/api/v1/osrs/latest')
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, max_concurrency: int = 8, max_idle: int = 8):
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_idle = max_idle
+        self.__loop = None
+        self.__semaphore = None
+        self.__idle = {}
+
+    def __bind(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self.__loop:
+            self.__loop = loop
+            self.__semaphore = asyncio.Semaphore(self.max_concurrency)
+            self.__idle = {}
+
+    async def request(self, url: str, headers: dict = None, timeout: float = None):
+        """request method
+
+        Sends a GET request for url and returns the fully read Response.  A request that fails on
+        a reused connection is retried once on a new one, dropping the host's other idle connections.
+
+        Args:
+            url str: The full url to fetch
+            headers dict: Extra request headers
+            timeout float: Overrides the transport timeout for this request
+
+        Returns:
+            Response
+
+        Raises:
+            TransportError: The request could not be completed or timed out
+        """
+        self.__bind()
+        timeout = self.timeout if timeout is None else timeout
+        async with self.__semaphore:
+            try:
+                return await asyncio.wait_for(self.__request(url, headers or {}), timeout)
+            except asyncio.TimeoutError as err:
+                raise TransportError("Request to {} timed out".format(url)) from err
+
+    async def __request(self, url, headers):
+        parts = urllib.parse.urlsplit(url)
+        https = parts.scheme == 'https'
+        port = parts.port or (443 if https else 80)
+        key = (parts.scheme, parts.hostname, port)
+        path = parts.path or '/'
+        if parts.query:
+            path = "{}?{}".format(path, parts.query)
+
+        request_headers = {'Host': parts.netloc, 'Accept-Encoding': 'gzip', 'Connection': 'keep-alive'}
+        request_headers.update(headers)
+        lines = ["GET {} HTTP/1.1".format(path)]
+        lines += ["{}: {}".format(name, value) for name, value in request_headers.items()]
+        payload = ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1')
+
+        fresh = False
+        while True:
+            idle = self.__idle.get(key)
+            if fresh and idle:
+                self.__idle[key] = []
+                for stale_reader, stale_writer in idle:
+                    stale_writer.close()
+                idle = None
+            reused = bool(idle)
+            if reused:
+                reader, writer = idle.pop()
+            else:
+                try:
+                    reader, writer = await asyncio.open_connection(parts.hostname, port, ssl=True if https else None)
+                except OSError as err:
+                    raise TransportError("Request to {} failed: {}".format(url, err)) from err
+            try:
+                writer.write(payload)
+                await writer.drain()
+                status, response_headers, body, keep_alive = await self.__readResponse(reader)
+            except (OSError, EOFError, ValueError) as err:
+                writer.close()
+                if reused:
+                    fresh = True
+                    continue
+                raise TransportError("Request to {} failed: {}".format(url, err)) from err
+            except BaseException:
+                writer.close()
+                raise
+            break
+
+        idle = self.__idle.setdefault(key, [])
+        if keep_alive and len(idle) < self.max_idle:
+            idle.append((reader, writer))
+        else:
+            writer.close()
+
+        if response_headers.get('content-encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return Response(status, response_headers, body)
+
+    async def __readResponse(self, reader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise EOFError("connection closed before the response")
+        version, status = status_line.decode('latin-1').split(None, 2)[:2]
+        status = int(status)
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        if status in (204, 304) or 100 <= status < 200:
+            body = b''
+        elif headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';', 1)[0].strip(), 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+        else:
+            body = await reader.read()
+            keep_alive = False
+        return status, headers, body, keep_alive
+    ####################################
+    #  END: AsyncHTTPTransport Object  #
+    ####################################
+
+#################################
+#  START: Recording Transports  #
+#################################
+def recording_key(url: str):
+    """recording_key() function
+
+    Returns the file name stem a response for url is recorded under.
+    """
+    return hashlib.sha256(url.encode()).hexdigest()[:32]
+
+# Headers that describe the body as it came over the wire.  Transports hand out bodies already
+# decompressed and de-chunked, so these aren't recorded.
+WIRE_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+class RecordingTransport(object):
+    """RecordingTransport Object
+
+    Forwards every request to another transport and saves each response it gets back to directory:
+    the body as <key>.body and the url, status and headers as <key>.json (without WIRE_HEADERS, the
+    body is stored decoded).  A later response for the same url replaces the earlier one.  Hand the
+    directory to ReplayTransport to serve the same responses without a network.
+
+    Args:
+        directory str: Directory to record into, created if missing
+        transport: The transport that does the real requests, defaults to DEFAULT_TRANSPORT
+
+    Example Invocation:
+        items = Items(transport=RecordingTransport('fixtures/wiki'))
+    """
+
+    def __init__(self, directory: str, transport = None):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.transport = transport if transport is not None else DEFAULT_TRANSPORT
+        os.makedirs(self.directory, exist_ok=True)
+
+    def request(self, url: str, headers: dict = None, timeout: float = None):
+        """request method
+
+        Sends the request through the wrapped transport, records the response and returns it.
+        """
+        response = self.transport.request(url, headers, timeout)
+        self.record(url, response)
+        return response
+
+    def record(self, url: str, response: Response):
+        """record method
+
+        Saves response as the recording for url.
+        """
+        key = recording_key(url)
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in WIRE_HEADERS}
+        meta = json.dumps({'url': url, 'status': response.status, 'headers': headers}, indent=1)
+        self.__write(key + '.body', response.body)
+        self.__write(key + '.json', meta.encode())
+
+    def __write(self, filename, data):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, os.path.join(self.directory, filename))
+
+
+class ReplayTransport(object):
+    """ReplayTransport Object
+
+    Serves the responses recorded by RecordingTransport from disk, so Items, Hiscores and
+    PriceHistory can be built with no network at all (e.g. Items(transport=ReplayTransport(path))).
+    Request headers are ignored, so conditional requests get the full recorded response.
+    Recordings are read on first use and kept in memory; every replay returns a new Response.
+
+    Args:
+        directory str: Directory holding the recordings
+    """
+
+    def __init__(self, directory: str):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.requests = []
+        self.__responses = {}
+        self.__lock = threading.Lock()
+
+    def urls(self):
+        """urls method
+
+        Returns the urls of every recording in the directory.
+        """
+        urls = []
+        for filename in sorted(os.listdir(self.directory)):
+            if filename.endswith('.json'):
+                with open(os.path.join(self.directory, filename), 'r') as f:
+                    urls.append(json.load(f)['url'])
+        return urls
+
+    def response(self, url: str):
+        """response method
+
+        Returns the recorded Response for url.
+
+        Raises:
+            TransportError: There is no recording for the url
+        """
+        with self.__lock:
+            recorded = self.__responses.get(url)
+            if recorded is None:
+                key = os.path.join(self.directory, recording_key(url))
+                try:
+                    with open(key + '.json', 'r') as f:
+                        meta = json.load(f)
+                    with open(key + '.body', 'rb') as f:
+                        body = f.read()
+                except (OSError, ValueError) as err:
+                    raise TransportError("No recorded response for {} in {}".format(url, self.directory)) from err
+                recorded = self.__responses[url] = (meta['status'], meta['headers'], body)
+            self.requests.append(url)
+        status, headers, body = recorded
+        return Response(status, dict(headers), body)
+
+    def request(self, url: str, headers: dict = None, timeout: float = None):
+        """request method
+
+        Same signature as HTTPTransport.request, answered from the recordings.
+        """
+        return self.response(url)
+
+
+class AsyncRecordingTransport(RecordingTransport):
+    """AsyncRecordingTransport Object
+
+    RecordingTransport for AsyncItems and AsyncHiscores: request() is a coroutine and the wrapped
+    transport defaults to DEFAULT_ASYNC_TRANSPORT.  Responses are written the same way, so
+    recordings from either one replay through ReplayTransport or AsyncReplayTransport.
+
+    Example Invocation:
+        items = await AsyncItems(transport=AsyncRecordingTransport('fixtures/wiki'))
+    """
+
+    def __init__(self, directory: str, transport = None):
+        super().__init__(directory, transport if transport is not None else DEFAULT_ASYNC_TRANSPORT)
+
+    async def request(self, url: str, headers: dict = None, timeout: float = None):
+        response = await self.transport.request(url, headers, timeout)
+        self.record(url, response)
+        return response
+
+class AsyncReplayTransport(ReplayTransport):
+    """AsyncReplayTransport Object
+
+    ReplayTransport for AsyncItems and AsyncHiscores: request() is a coroutine.
+    """
+
+    async def request(self, url: str, headers: dict = None, timeout: float = None):
+        return self.response(url)
+    ###############################
+    #  END: Recording Transports  #
+    ###############################
+
+# Shared by every client that isn't handed its own transport, so connections are pooled process wide.
+DEFAULT_TRANSPORT = HTTPTransport()
+DEFAULT_ASYNC_TRANSPORT = AsyncHTTPTransport()
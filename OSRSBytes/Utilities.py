@@ -7,12 +7,21 @@ OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that
 EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
 
 Utilies Module will contain methods and information that directly involve manipulation of this
-package and returning information on it.  Currently, Location of Script is the only feature.
+package and returning information on it: the location of the package and the registry of the data
+files bundled in OSRSBytes/modules.
 
 Usable with:
     print(Utilities().__package_dir__)
+    print(MODULES['smithing'])
 """
+import hashlib
+import json
+import marshal
 import os
+import sys
+import tempfile
+import threading
+from collections.abc import Mapping
 
 # META Data
 __copyright__  = 'Copyright 2023, CFDeadlines'
@@ -26,9 +35,169 @@ __maintainer__ = {
 __email__      = 'cookm0803@gmail.com'
 __status__     = 'Open'
 
+################
+#  Exceptions  #
+################
+class ModuleError(Exception):
+    """ModuleError Exception
+
+    This exception is raised when a bundled module file is missing or is not valid JSON.
+    """
+    pass
+
+# Suggested cache_dir for a ModuleRegistry that keeps parsed module files between runs
+DEFAULT_MODULE_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'osrsbytes', 'modules')
+
 class Utilities(object):
     def __init__(self):
         self.getLocation()
 
     def getLocation(self):
-        self.__package_dir__, self.__here__, self.__this__, self.__script__ = os.path.dirname(os.path.realpath(__file__))
+        """getLocation method
+
+        Sets __package_dir__ (the OSRSBytes package), __modules_dir__ (the bundled data files),
+        __this__ (this file), __here__ (the working directory) and __script__ (the running script,
+        None in an interactive session).
+        """
+        self.__this__ = os.path.realpath(__file__)
+        self.__package_dir__ = os.path.dirname(self.__this__)
+        self.__modules_dir__ = os.path.join(self.__package_dir__, 'modules')
+        try:
+            self.__here__ = os.getcwd()
+        except OSError:
+            self.__here__ = None
+        script = sys.argv[0] if sys.argv and sys.argv[0] else None
+        self.__script__ = os.path.realpath(script) if script else None
+
+##################################
+#  START: ModuleRegistry Object  #
+##################################
+class ModuleRegistry(Mapping):
+    """ModuleRegistry Object
+
+    A read-only mapping of module name -> parsed JSON for the data files in OSRSBytes/modules (e.g.
+    'smithing' for smithing.json).  Nothing is read when the registry is created: the directory is
+    listed on first use and each file is parsed the first time it is asked for, then kept.  Empty
+    files (modules that aren't filled in yet) parse as an empty dictionary.
+
+    With a cache_dir, parsed files are also written there with marshal (which, unlike pickle,
+    can't run code when it is loaded) under the SHA-256 of the file contents, so later runs skip
+    the JSON parse until the file changes.  A cache that can't be read or written is ignored.
+    The cache is off by default: the bundled files parse in well under a millisecond.
+
+    The parsed data is shared by every caller, do not modify it.
+
+    Args:
+        directory str: Directory holding the module files, the bundled modules if None
+        cache_dir str: Directory for the compiled cache (e.g. DEFAULT_MODULE_CACHE), None for no cache
+    """
+
+    def __init__(self, directory: str = None, cache_dir: str = None):
+        self.directory = directory
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir)) if cache_dir else None
+        self.__files = None
+        self.__loaded = {}
+        self.__lock = threading.Lock()
+
+    def __discover(self):
+        if self.__files is None:
+            directory = self.directory or Utilities().__modules_dir__
+            try:
+                filenames = sorted(os.listdir(directory))
+            except OSError:
+                filenames = []
+            self.__files = {
+                filename[:-len('.json')]: os.path.join(directory, filename)
+                for filename in filenames
+                if filename.endswith('.json')
+            }
+        return self.__files
+
+    def path(self, name: str):
+        """path method
+
+        Returns the path of the module file for name.
+
+        Raises:
+            ModuleError: There is no such module
+        """
+        try:
+            return self.__discover()[name]
+        except KeyError:
+            raise ModuleError("No module named {}, expected one of {}".format(name, sorted(self.__discover())))
+
+    def __load(self, name):
+        path = self.path(name)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError as err:
+            raise ModuleError("Could not read module {}: {}".format(path, err)) from err
+
+        cache_path = None
+        if self.cache_dir:
+            digest = hashlib.sha256(data).hexdigest()
+            cache_path = os.path.join(self.cache_dir, "{}-{}.marshal".format(name, digest))
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached = marshal.load(f)
+                if isinstance(cached, (dict, list)):
+                    return cached
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+
+        if not data.strip():
+            parsed = {}
+        else:
+            try:
+                parsed = json.loads(data)
+            except ValueError as err:
+                raise ModuleError("Module {} is not valid JSON: {}".format(path, err)) from err
+        if cache_path:
+            self.__store(cache_path, parsed)
+        return parsed
+
+    def __store(self, cache_path, parsed):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp-')
+            with os.fdopen(fd, 'wb') as f:
+                marshal.dump(parsed, f)
+            os.replace(tmp, cache_path)
+        except OSError:
+            return
+        # Drop the compiled forms of older versions of this file
+        current = os.path.basename(cache_path)
+        prefix = current.rsplit('-', 1)[0] + '-'
+        for filename in os.listdir(self.cache_dir):
+            if filename.startswith(prefix) and len(filename) == len(current) and filename != current:
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError:
+                    pass
+
+    def __getitem__(self, name):
+        try:
+            return self.__loaded[name]
+        except KeyError:
+            if name not in self.__discover():
+                raise
+        with self.__lock:
+            if name not in self.__loaded:
+                self.__loaded[name] = self.__load(name)
+            return self.__loaded[name]
+
+    def __contains__(self, name):
+        return name in self.__discover()
+
+    def __iter__(self):
+        return iter(self.__discover())
+
+    def __len__(self):
+        return len(self.__discover())
+    ################################
+    #  END: ModuleRegistry Object  #
+    ################################
+
+# The bundled modules
+MODULES = ModuleRegistry()
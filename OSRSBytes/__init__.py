@@ -7,10 +7,67 @@ OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that
 EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
 """
 
+# Generic/Built-in Imports
+import importlib
+import sys
+import types
+
 # Initialize OSRSBytes Modules
-from OSRSBytes.Hiscores import *
-from OSRSBytes.Items import *
-from OSRSBytes.Utilities import *
+#
+# Submodules are imported the first time one of their names is used (see __getattr__), so importing
+# the package doesn't pull in the HTTP, asyncio and sqlite machinery for code that only needs, say,
+# the experience table.  Every public class, function and exception is listed here with the submodule
+# that defines it; module constants such as caches and URLs stay on their submodule.
+_EXPORTS = {name: module for module, names in (
+    ('Analytics', ('MarketAnalytics',)),
+    ('Cache', ('CacheEntry', 'CachedValue', 'DiskCache', 'MemoryCache', 'ResponseCache', 'SQLiteCache')),
+    ('Experience', ('LevelError', 'MAX_EXPERIENCE', 'MAX_LEVEL', 'MAX_VIRTUAL_LEVEL', 'XP_TABLE', 'level_for_xp',
+                    'levels_for_xp', 'xp_for_level', 'xp_to_level')),
+    ('Hiscores', ('AsyncHiscores', 'BossError', 'BountyError', 'ClueError', 'Hiscores', 'HiscoresError', 'LMSArenaError',
+                  'SkillError', 'fetch_boss_list', 'hiscoresURL', 'parse_boss_list', 'parse_index_lite')),
+    ('History', ('HistoryError', 'PriceHistory', 'PriceSeries')),
+    ('ItemTable', ('ItemTable', 'alch_values')),
+    ('Items', ('APIDown', 'AsyncItems', 'ItemNotValid', 'Items', 'SharedItems')),
+    ('Search', ('SearchIndex',)),
+    ('Shared', ('MappedTable', 'SnapshotFileError', 'attach_table', 'publish_table', 'read_header')),
+    ('Snapshot', ('PlayerSnapshot',)),
+    ('Transport', ('RateLimiter', 'Response', 'TransportError')),
+    ('Utilities', ('ModuleError', 'ModuleRegistry', 'Utilities')),
+) for name in names}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(__name__ + '.' + module), name)
+    elif not name.startswith('_'):
+        # Submodules without a same-named export, e.g. OSRSBytes.Transport
+        try:
+            value = importlib.import_module(__name__ + '.' + name)
+        except ModuleNotFoundError as err:
+            if err.name != __name__ + '.' + name:
+                raise
+            raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name)) from None
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+class _Package(types.ModuleType):
+    """The package module's type.  Importing a submodule binds it on the package under its own name,
+    so the first import of OSRSBytes.Items would replace the Items class with the Items module; the
+    class is bound instead, as the old eager 'from OSRSBytes.Items import *' left it."""
+
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and _EXPORTS.get(name) == name and value.__name__ == __name__ + '.' + name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+sys.modules[__name__].__class__ = _Package
 
 # META Data
 __copyright__  = 'Copyright 2023, CFDeadlines'
@@ -0,0 +1,57 @@
+import pytest
+
+from OSRSBytes.Analytics import GE_TAX_CAP, ge_tax
+from OSRSBytes import Transport
+
+
+def test_ge_tax():
+    assert ge_tax(49) == 0
+    assert ge_tax(50) == 1
+    assert ge_tax(4820) == 96
+    assert ge_tax(10 ** 9) == GE_TAX_CAP
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_analytics(monkeypatch, offline_items, wiki_request, prices, compact):
+    items = offline_items(compact=compact)
+    analytics = items.analytics()
+    assert items.analytics() is analytics
+    assert len(analytics) == 5
+
+    dagger = analytics.item(analytics.table.row("rune dagger"))
+    assert dagger["margin"] == 120
+    assert dagger["tax"] == 96
+    assert dagger["profit"] == 24
+    assert dagger["roi"] == pytest.approx(24 / 4700)
+    assert dagger["alch_profit"] == 4500 - 4820 - 190
+    assert dagger["limit_profit"] == 24 * 125
+
+    # Untraded items have no metrics and never rank
+    curio = analytics.item(analytics.table.row("untraded curio"))
+    assert curio["profit"] is None and curio["buy_average"] is None
+    assert len(analytics.top("profit", limit=10)) == 4
+
+    assert [item["name"] for item in analytics.top("profit", limit=2)] == ["rune dagger", "fire rune"]
+    assert [item["name"] for item in analytics.top("profit", limit=2, ascending=True)] == ["bandos chestplate", "nature rune"]
+    assert [item["name"] for item in analytics.top("margin", members=False, min_volume=1000000)] == ["nature rune", "fire rune"]
+    assert [item["name"] for item in analytics.top("roi", members=True)] == ["bandos chestplate"]
+    assert [item["name"] for item in analytics.top("roi", min_price=100)] == ["rune dagger", "nature rune", "bandos chestplate"]
+    assert analytics.top("profit", limit=0) == []
+    with pytest.raises(ValueError):
+        analytics.top("popularity")
+
+    assert analytics.nature_rune == 190
+    alchs = analytics.alchTable()
+    assert alchs["name"] == ["fire rune", "nature rune", "rune dagger", "bandos chestplate"]
+    assert alchs["alch_profit"] == [2 - 5 - 190, 162 - 190 - 190, 4500 - 4820 - 190, 159000 - 18500000 - 190]
+    assert analytics.alchTable(members=True, min_volume=100)["id"] == [11832]
+
+    assert list(analytics.column("margin"))[analytics.table.row("fire rune")] == 1
+
+    # A new snapshot gets new analytics
+    prices["1213"]["high"] = 5000
+    monkeypatch.setattr(Transport.DEFAULT_TRANSPORT, "request", wiki_request(prices))
+    items.update()
+    updated = items.analytics()
+    assert updated is not analytics
+    assert updated.item(updated.table.row("rune dagger"))["margin"] == 300
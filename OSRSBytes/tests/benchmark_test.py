@@ -0,0 +1,54 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import OSRSBytes
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(OSRSBytes.__file__)))
+
+
+@pytest.fixture
+def bench(monkeypatch):
+    """The benchmarks.run module, importable from the repository root for the length of the test"""
+    monkeypatch.syspath_prepend(ROOT)
+    return importlib.import_module("benchmarks.run")
+
+
+def test_synthetic_fixtures_replay(bench, hiscores_module, tmp_path):
+    from benchmarks.fixtures import manifest, record_synthetic
+
+    record_synthetic(str(tmp_path), items = 200, players = 12)
+    assert len(manifest(str(tmp_path))['players']) == 12
+    shared = hiscores_module.BOSS_LIST_CACHE
+    with bench.boss_list_cache(str(tmp_path)):
+        assert hiscores_module.BOSS_LIST_CACHE is not shared
+        suite = {name: (function, ops) for name, function, ops in bench.benchmarks(str(tmp_path), (1, 10, 100))}
+        assert "items.rectify" in suite and "hiscores.boss_list" in suite
+        # Bulk sizes above the recorded players are left out
+        assert "hiscores.bulk_10" in suite and "hiscores.bulk_100" not in suite
+        for function, ops in suite.values():
+            function()
+    assert hiscores_module.BOSS_LIST_CACHE is shared
+
+
+def test_check(bench):
+    results = {"a": {"median": 10.0}, "b": {"median": 30.0}}
+    regressions = bench.check(results, {"a": 20, "b": 20}, {"a": {"median": 5.0}}, tolerance = 0.5)
+    assert [(r["name"], r["against"]) for r in regressions] == [("a", "baseline"), ("b", "threshold")]
+    assert bench.check(results, {"a": 20, "b": 40}, {"a": {"median": 8.0}}, tolerance = 0.5) == []
+
+
+def test_run_writes_json(tmp_path):
+    output = tmp_path / "results.json"
+    env = dict(os.environ, PYTHONPATH = ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run([sys.executable, "-m", "benchmarks.run", "--quick", "--only", "hiscores.boss_list",
+                             "--output", str(output)], cwd = ROOT, env = env, capture_output = True, text = True)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(output.read_text())
+    assert list(report["results"]) == ["hiscores.boss_list"]
+    assert report["results"]["hiscores.boss_list"]["unit"] == "us/op"
+    assert report["regressions"] == []
@@ -0,0 +1,179 @@
+import copy
+import importlib
+import json
+
+import pytest
+
+from OSRSBytes import Items
+from OSRSBytes import Transport
+from OSRSBytes.Cache import CachedValue
+from OSRSBytes.Transport import Response
+
+MAPPINGS = [
+    {"id": 1213, "name": "Rune dagger", "members": False, "examine": "A powerful dagger.",
+     "limit": 125, "lowalch": 3000, "highalch": 4500, "value": 7500},
+    {"id": 554, "name": "Fire rune", "members": False, "examine": "One of the 4 basic elemental Runes.",
+     "limit": 25000, "lowalch": 1, "highalch": 2, "value": 4},
+    {"id": 561, "name": "Nature rune", "members": False, "examine": "Used for alchemy spells.",
+     "limit": 18000, "lowalch": 108, "highalch": 162, "value": 270},
+    {"id": 11832, "name": "Bandos chestplate", "members": True, "examine": "A sturdy chestplate.",
+     "limit": 8, "lowalch": 106000, "highalch": 159000, "value": 265000},
+    {"id": 12345, "name": "Untraded curio", "members": True, "examine": "Nobody trades this."},
+]
+
+PRICES = {
+    "1213": {"high": 4820, "highTime": 1697600000, "low": 4700, "lowTime": 1697600010},
+    "554": {"high": 5, "highTime": 1697600000, "low": 4, "lowTime": 1697600000},
+    "561": {"high": 190, "highTime": 1697600000, "low": 187, "lowTime": 1697600000},
+    "11832": {"high": 18500000, "highTime": 1697600000, "low": 18200000, "lowTime": 1697600000},
+}
+
+VOLUMES = {"1213": 1520, "554": 3120000, "561": 2400000, "11832": 310}
+
+BOSSES = ["rifts_closed", "abyssal_sire", "alchemical_hydra", "vorkath", "wintertodt", "zulrah"]
+
+
+def make_wiki_request(prices = PRICES, volumes = VOLUMES, mappings = MAPPINGS, requests = None):
+    """Returns a transport request function answering with canned wiki payloads
+
+    Every request made is appended to requests (if supplied) as (url, headers) so tests can count them.
+    """
+    payloads = {
+        "mapping": mappings,
+        "latest": {"data": prices},
+        "volumes": {"data": volumes},
+    }
+
+    def request(url, headers = None, timeout = None):
+        endpoint = url.rsplit("/", 1)[1]
+        if requests is not None:
+            requests.append((url, headers))
+        if headers.get("If-None-Match") == '"v1"':
+            return Response(304, {}, b"")
+        body = json.dumps(payloads[endpoint]).encode()
+        return Response(200, {"etag": '"v1"'}, body)
+    return request
+
+
+def make_boss_page(bosses = BOSSES):
+    """Builds the activity hiscores page that the boss list is scraped from"""
+    lines = ['<span style="color: #d9c27e;display: block;text-align: center;">----</span>']
+    lines += ["<junk>"] * 14
+    lines += ['<a href="#" class="activity-link {}">{}</a>'.format(boss, boss.title()) for boss in bosses]
+    lines += ["</div>"]
+    return "\n".join(lines).encode()
+
+
+def make_index_lite(seed = 1, bosses = BOSSES):
+    """Builds an index_lite.ws response, values are derived from seed so players differ"""
+    lines = ["{},{},{}".format(1000 * seed, 1500, 200000000)]
+    for skill in range(23):
+        lines.append("{},{},{}".format(seed + skill, 90 + skill % 10, 6000000 + seed * 1000 + skill))
+    lines += ["-1,-1", "-1,-1"]
+    for activity in range(4 + 7 + 3 + len(bosses)):
+        lines.append("{},{}".format(100 + seed + activity, 10 * seed + activity + 1))
+    return "\n".join(lines).encode()
+
+
+def make_hiscores_request(players, requests = None, boss_status = 200):
+    """Returns a transport request function serving players ({username: seed}) from canned responses
+
+    Unknown players answer 404.  Every url requested is appended to requests (if supplied).
+    """
+    def request(url, headers = None, timeout = None):
+        if requests is not None:
+            requests.append(url)
+        if "overall?category_type=1" in url:
+            return Response(boss_status, {}, make_boss_page() if boss_status == 200 else b"")
+        username = url.rsplit("player=", 1)[1].replace("%20", " ")
+        if username not in players:
+            return Response(404, {}, b"")
+        return Response(200, {}, make_index_lite(players[username]))
+    return request
+
+
+@pytest.fixture
+def prices():
+    """The canned /latest payload, a copy the test may modify"""
+    return copy.deepcopy(PRICES)
+
+
+@pytest.fixture
+def volumes():
+    """The canned /volumes payload, a copy the test may modify"""
+    return copy.deepcopy(VOLUMES)
+
+
+@pytest.fixture
+def mappings():
+    """The canned /mapping payload, a copy the test may modify"""
+    return copy.deepcopy(MAPPINGS)
+
+
+@pytest.fixture
+def wiki_request():
+    """make_wiki_request(prices, volumes, mappings, requests), builds a canned wiki transport request function"""
+    return make_wiki_request
+
+
+@pytest.fixture
+def offline_items(monkeypatch):
+    """Builds Items objects against canned wiki payloads instead of the live API
+
+    Call it as offline_items(prices, volumes, mappings, requests, **Items arguments), every
+    argument is optional.
+    """
+    def build(prices = PRICES, volumes = VOLUMES, mappings = MAPPINGS, requests = None, **kwargs):
+        monkeypatch.setattr(Transport.DEFAULT_TRANSPORT, "request", make_wiki_request(prices, volumes, mappings, requests))
+        return Items(**kwargs)
+    return build
+
+
+@pytest.fixture
+def bosses():
+    """The boss names of the canned hiscores responses"""
+    return list(BOSSES)
+
+
+@pytest.fixture
+def index_lite():
+    """make_index_lite(seed, bosses), builds a canned index_lite.ws response"""
+    return make_index_lite
+
+
+@pytest.fixture
+def boss_page():
+    """make_boss_page(bosses), builds the canned page the boss list is scraped from"""
+    return make_boss_page
+
+
+@pytest.fixture
+def hiscores_request():
+    """make_hiscores_request(players, requests, boss_status), builds a canned hiscores transport request function"""
+    return make_hiscores_request
+
+
+@pytest.fixture
+def hiscores_module():
+    """The Hiscores module, the package exports the Hiscores class under its name"""
+    return importlib.import_module("OSRSBytes.Hiscores")
+
+
+@pytest.fixture
+def boss_list_cache(monkeypatch, hiscores_module):
+    """Gives the test its own empty boss list cache and returns it"""
+    cache = CachedValue(ttl=3600)
+    monkeypatch.setattr(hiscores_module, "BOSS_LIST_CACHE", cache)
+    return cache
+
+
+@pytest.fixture
+def offline_hiscores(monkeypatch, boss_list_cache):
+    """Serves hiscores from canned responses instead of the live API, see make_hiscores_request()
+
+    Call it as offline_hiscores(players, requests, boss_status).  The test gets its own empty boss
+    list cache.
+    """
+    def serve(players, requests = None, boss_status = 200):
+        monkeypatch.setattr(Transport.DEFAULT_TRANSPORT, "request", make_hiscores_request(players, requests, boss_status))
+    return serve
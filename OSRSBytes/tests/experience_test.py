@@ -0,0 +1,27 @@
+from OSRSBytes import LevelError, level_for_xp, levels_for_xp, xp_for_level, xp_to_level
+
+
+def test_xp_table():
+    assert xp_for_level(1) == 0
+    assert xp_for_level(2) == 83
+    assert xp_for_level(92) == 6517253
+    assert xp_for_level(99) == 13034431
+    assert xp_for_level(126) == 188884740
+    for level in (0, 127):
+        try:
+            xp_for_level(level)
+            assert False, "expected LevelError"
+        except LevelError:
+            pass
+
+
+def test_level_lookups():
+    assert level_for_xp(-1) == 1
+    assert level_for_xp(82) == 1
+    assert level_for_xp(83) == 2
+    assert level_for_xp(13034430) == 98
+    assert level_for_xp(200000000) == 99
+    assert level_for_xp(200000000, virtual=True) == 126
+    assert levels_for_xp([0, 83, 14391160], virtual=True) == [1, 2, 100]
+    assert xp_to_level(13000000, 99) == 34431
+    assert xp_to_level(14000000, 99) == 0
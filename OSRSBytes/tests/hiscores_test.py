@@ -1,4 +1,6 @@
 from OSRSBytes import Hiscores
+from OSRSBytes import HiscoresError
+from OSRSBytes.Cache import CachedValue
 
 def test(verbose = True):
     pvp_user = Hiscores("C Engineer")
@@ -71,4 +73,126 @@ def test(verbose = True):
         if len(failed_tests) == 0:
             return True
         else:
-            return False
\ No newline at end of file
+            return False
+
+
+def test_offline_lookup(offline_hiscores, bosses):
+    offline_hiscores({"zezima": 3})
+    user = Hiscores("Zezima")
+    assert user.skill("attack", "rank") == 3
+    assert user.skill("defense", "experience") == 6003001
+    assert user.stats["zezima"]["total"]["level"] == "1500"
+    assert user.clue("all") == 35
+    assert user.boss("zulrah", "rank") == 103 + 14 + 5
+    assert list(user.getBossGenerator()) == bosses
+    # The section dictionaries are built once and kept
+    assert user.stats is user.stats and user.bosses is user.bosses
+    assert user.bosses["zezima"]["zulrah"] == {"rank": 103 + 14 + 5, "score": 10 * 3 + 14 + 5 + 1}
+
+
+def test_fetch_many(offline_hiscores):
+    players = {"player {}".format(seed): seed for seed in range(1, 21)}
+    offline_hiscores(players)
+    results = dict(Hiscores.fetch_many(list(players) + ["nobody"], max_workers=4, rate_limit=1000))
+    assert len(results) == 21
+    assert isinstance(results["nobody"], HiscoresError)
+    for username, seed in players.items():
+        assert results[username].skill("attack", "rank") == seed
+
+
+def test_async_hiscores(hiscores_request, boss_list_cache):
+    import asyncio
+    from OSRSBytes import AsyncHiscores
+
+    class AsyncTransport(object):
+        def __init__(self, players):
+            self.request_sync = hiscores_request(players)
+
+        async def request(self, url, headers = None, timeout = None):
+            await asyncio.sleep(0)
+            return self.request_sync(url, headers, timeout)
+
+    async def run():
+        transport = AsyncTransport({"zezima": 2, "lynx titan": 5})
+        return await asyncio.gather(
+            AsyncHiscores("Zezima", transport = transport),
+            AsyncHiscores("Lynx Titan", transport = transport),
+        )
+
+    zezima, lynx = asyncio.run(run())
+    assert zezima.skill("attack", "rank") == 2
+    assert lynx.skill("attack", "rank") == 5
+    assert lynx.boss("vorkath", "score") == 10 * 5 + 14 + 3 + 1
+
+
+def test_boss_list_cache(monkeypatch, offline_hiscores, hiscores_module, bosses, tmp_path):
+    requests = []
+    offline_hiscores({"player {}".format(seed): seed for seed in range(10)}, requests)
+    for seed in range(10):
+        Hiscores("player {}".format(seed))
+    assert sum("overall?category_type=1" in url for url in requests) == 1
+
+    # Persisted lists are picked up by a fresh (e.g. restarted) process
+    path = str(tmp_path / "bosses.json")
+    CachedValue(ttl=3600, path=path).set(bosses)
+    requests.clear()
+    monkeypatch.setattr(hiscores_module, "BOSS_LIST_CACHE", CachedValue(ttl=3600, path=path))
+    assert list(Hiscores("player 1").getBossGenerator()) == bosses
+    assert len(requests) == 1
+
+    # A path set after creation is normalised like one passed to the constructor
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    cache = CachedValue(ttl=3600)
+    cache.path = "~/cache/bosses.json"
+    assert cache.path == str(tmp_path / "cache" / "bosses.json")
+    cache.set(bosses)
+    assert not (tmp_path / "~").exists()
+    assert CachedValue(ttl=3600, path=cache.path).get() == bosses
+
+
+def test_boss_list_fallback(offline_hiscores):
+    offline_hiscores({"zezima": 1}, boss_status = 503)
+    user = Hiscores("Zezima")
+    assert list(user.getBossGenerator())[:2] == ["rifts_closed", "abyssal_sire"]
+    assert user.boss("abyssal_sire", "rank") == 100 + 1 + 14 + 1
+
+
+def test_response_cache(offline_hiscores, tmp_path):
+    from OSRSBytes.Cache import MemoryCache, SQLiteCache
+
+    requests = []
+    offline_hiscores({"zezima": 1, "lynx titan": 2, "woox": 3}, requests)
+
+    cache = MemoryCache(ttl=60, max_entries=2)
+    for username in ["Zezima", "zezima", "Lynx Titan", "Woox", "Zezima"]:
+        Hiscores(username, cache=cache)
+    player_requests = [url for url in requests if "index_lite" in url]
+    # zezima was evicted (least recently used) once woox came in
+    assert len(player_requests) == 4
+    assert cache.stats() == {"hits": 1, "misses": 4, "entries": 2}
+
+    path = str(tmp_path / "hiscores.sqlite")
+    Hiscores("Woox", "N", SQLiteCache(path))
+    requests.clear()
+    restarted = SQLiteCache(path)
+    assert Hiscores("Woox", cache=restarted).skill("attack", "rank") == 3
+    assert not [url for url in requests if "index_lite" in url]
+    assert restarted.stats()["hits"] == 1
+
+
+def test_parse_index_lite(index_lite, bosses):
+    from OSRSBytes.Hiscores import SKILLS, parse_index_lite
+
+    parsed = parse_index_lite(index_lite(4).decode(), bosses)
+    assert parsed["stats"]["total"] == {"rank": "4000", "level": "1500", "experience": "200000000"}
+    assert list(parsed["stats"]) == ["total"] + list(SKILLS)
+    assert parsed["stats"]["attack"] == {"rank": 4, "level": 90, "experience": 6004000,
+                                         "next_level_exp": 5902831, "exp_to_next_level": -101169}
+    assert parsed["bounties"]["hunter"] == {"rank": 104, "score": 41}
+    assert parsed["clues"]["master"] == {"rank": 114, "score": 51}
+    assert parsed["lms_arenas_sw"]["soul_wars_zeal"] == {"rank": 117, "score": 54}
+    assert list(parsed["bosses"]) == bosses
+
+    # Responses shorter than the boss list simply stop early
+    assert len(parse_index_lite(index_lite(4, bosses[:2]).decode(), bosses)["bosses"]) == 2
@@ -0,0 +1,99 @@
+import json
+import math
+
+import pytest
+
+from OSRSBytes import PriceHistory
+from OSRSBytes import Transport
+from OSRSBytes.History import HistoryError
+from OSRSBytes.Transport import Response
+
+
+def history_request(payloads, requests = None):
+    """Returns a transport request function answering /5m, /1h and /timeseries from payloads keyed by path"""
+    def request(url, headers = None, timeout = None):
+        path = url.rsplit("/", 1)[1]
+        if requests is not None:
+            requests.append(path)
+        if path not in payloads:
+            return Response(404, {}, b"")
+        return Response(200, {}, json.dumps(payloads[path]).encode())
+    return request
+
+
+def test_items_record_history(offline_items, prices):
+    history = PriceHistory()
+    items = offline_items(history=history)
+    assert list(history.window(1213)["avg_high"]) == [4820.0]
+    assert list(history.window(1213)["timestamp"]) == [1697600010]
+
+    # Items that didn't trade since the last update add nothing
+    items.update()
+    assert len(history.series[1213]) == 1
+
+    prices["1213"] = {"high": 4900, "highTime": 1697600300, "low": None, "lowTime": None}
+    offline_items(prices=prices, history=history)
+    assert list(history.window(1213)["avg_high"]) == [4820.0, 4900.0]
+    assert math.isnan(history.window(1213)["avg_low"][1])
+
+
+def test_aggregates():
+    history = PriceHistory()
+    points = [(300, 100, 90, 10, 0), (0, 110, 100, 0, 30), (600, None, 80, 0, 10), (900, 130, None, 20, 0)]
+    for point in points:
+        history.add(561, *point)
+    assert list(history.window(561)["timestamp"]) == [0, 300, 600, 900]
+
+    assert history.vwap(561) == pytest.approx((100 * 10 + 100 * 30 + 80 * 10 + 130 * 20) / 70)
+    assert history.vwap(561, side="high") == pytest.approx((100 * 10 + 130 * 20) / 30)
+    assert history.vwap(561, start=300, end=600, side="low") == 80
+    assert history.vwap(554) is None
+
+    assert history.minMax(561) == (100, 130)
+    assert history.minMax(561, end=300, field="avg_low") == (90, 100)
+    assert history.minMax(561, start=1000) is None
+
+    assert history.rollingMean(561, 2) == [105, 100, 130]
+    assert history.rollingMean(561, 4, field="avg_low") == [90]
+    assert history.rollingMean(561, 5) == []
+
+    # A point at an existing timestamp replaces it
+    history.add(561, 300, 200, 90)
+    assert history.minMax(561) == (110, 200)
+
+
+def test_fetch_and_save(monkeypatch, tmp_path):
+    payloads = {
+        "5m": {"timestamp": 1697600100, "data": {
+            "561": {"avgHighPrice": 190, "highPriceVolume": 1000, "avgLowPrice": 186, "lowPriceVolume": 3000},
+        }},
+        "timeseries?timestep=1h&id=1213": {"itemId": 1213, "data": [
+            {"timestamp": 1697590800, "avgHighPrice": 4810, "avgLowPrice": 4690, "highPriceVolume": 12, "lowPriceVolume": 40},
+            {"timestamp": 1697594400, "avgHighPrice": 4830, "avgLowPrice": None, "highPriceVolume": 8, "lowPriceVolume": 0},
+        ]},
+    }
+    requests = []
+    monkeypatch.setattr(Transport.DEFAULT_TRANSPORT, "request", history_request(payloads, requests))
+    history = PriceHistory()
+    assert history.fetch("5m") == 1697600100
+    assert history.fetchTimeseries(1213, "1h") == 2
+    assert requests == ["5m", "timeseries?timestep=1h&id=1213"]
+    assert history.vwap(561) == pytest.approx((190 * 1000 + 186 * 3000) / 4000)
+    assert history.minMax(1213) == (4810, 4830)
+    with pytest.raises(HistoryError):
+        history.fetch("1h")
+    with pytest.raises(ValueError):
+        history.fetch("1m")
+
+    path = tmp_path / "history.bin"
+    history.save(str(path))
+    loaded = PriceHistory.load(str(path))
+    assert sorted(loaded.series) == [561, 1213]
+    for column in ("timestamp", "avg_high", "high_volume", "low_volume"):
+        assert loaded.window(1213)[column] == history.window(1213)[column]
+    assert math.isnan(loaded.window(1213)["avg_low"][1])
+    assert loaded.vwap(1213) == history.vwap(1213)
+
+    path.write_bytes(b"not a history")
+    with pytest.raises(HistoryError):
+        PriceHistory.load(str(path))
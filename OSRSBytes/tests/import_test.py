@@ -0,0 +1,68 @@
+import json
+import os
+import subprocess
+import sys
+
+import OSRSBytes
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(OSRSBytes.__file__)))
+
+# Modules that importing the package (or only the experience math) must not pull in
+HEAVY_MODULES = ["asyncio", "http.client", "json", "sqlite3", "urllib.request", "OSRSBytes.Hiscores", "OSRSBytes.Items"]
+
+# Records what a fresh import of the package, and of the experience math, has loaded
+PROBE = """
+import sys
+import OSRSBytes
+loaded = [name for name in {heavy} if name in sys.modules]
+from OSRSBytes import xp_for_level
+xp_loaded = [name for name in {heavy} if name in sys.modules]
+import json
+print(json.dumps({{"loaded": loaded, "xp_loaded": xp_loaded}}))
+"""
+
+
+def run(code):
+    env = dict(os.environ, PYTHONPATH = ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run([sys.executable, "-c", code], env = env, capture_output = True, text = True, check = True)
+    return result.stdout
+
+
+def test_import_is_lazy():
+    loaded = json.loads(run(PROBE.format(heavy = HEAVY_MODULES)))
+    assert loaded["loaded"] == []
+    assert loaded["xp_loaded"] == []
+
+
+def test_items_import_is_lazy():
+    # Analytics, search and snapshot sharing are only imported once they are used
+    code = (
+        "import sys\n"
+        "from OSRSBytes import Items\n"
+        "print([name for name in ('OSRSBytes.Analytics', 'OSRSBytes.Search', 'OSRSBytes.Shared') if name in sys.modules])\n"
+    )
+    assert run(code).strip() == "[]"
+
+
+def test_lazy_exports():
+    assert OSRSBytes.Items.__name__ == "Items" and isinstance(OSRSBytes.Items, type)
+    assert OSRSBytes.xp_for_level(99) == 13034431
+    assert "PriceHistory" in dir(OSRSBytes)
+    assert OSRSBytes.Transport.__name__ == "OSRSBytes.Transport"
+    try:
+        OSRSBytes.NotAThing
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("OSRSBytes.NotAThing should raise AttributeError")
+
+
+def test_submodule_import_keeps_class():
+    # Importing a submodule first must not leave the module where the class of the same name belongs
+    code = (
+        "import OSRSBytes.Hiscores, OSRSBytes.Items, OSRSBytes.ItemTable\n"
+        "import OSRSBytes\n"
+        "from OSRSBytes import Hiscores, Items\n"
+        "print(Hiscores.__module__, Items.__module__, OSRSBytes.ItemTable.__module__, OSRSBytes.Utilities.__module__)\n"
+    )
+    assert run(code).split() == ["OSRSBytes.Hiscores", "OSRSBytes.Items", "OSRSBytes.ItemTable", "OSRSBytes.Utilities"]
@@ -1,4 +1,9 @@
+import threading
+
+import pytest
+
 from OSRSBytes import Items
+from OSRSBytes import Transport
 
 def test(verbose = False):
     items = Items()
@@ -165,3 +170,205 @@ def test(verbose = False):
         if len(failed_list)==0:
             return True
         return False
+
+
+def test_item_id_index(offline_items):
+    items = offline_items()
+    assert items.getName(1213) == "rune dagger"
+    assert items.getName("1213") == "rune dagger"
+    assert items.getName("rune dagger") == "rune dagger"
+    assert items.getName(99999) is None
+    assert items.getItem(1213) is items.getItem("Rune Dagger")
+    assert items.getItemID("1213") == 1213
+    assert items.getBuyAverage("554") == 5
+
+    items.update()
+    assert items.getItem(11832) is items.item_dict["bandos chestplate"]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_incremental_update(monkeypatch, offline_items, wiki_request, prices, volumes, compact):
+    requests = []
+    items = offline_items(requests = requests, compact = compact)
+    assert items.changed_ids == {1213, 554, 561, 11832, 12345}
+    dagger = items.getItem("rune dagger")
+    nature = items.getItem(561)
+    snapshot = items.item_dict
+
+    prices["1213"] = {"high": 4900, "highTime": 1697600300, "low": 4700, "lowTime": 1697600010}
+    prices.pop("11832")
+    volumes["554"] = 3200000
+    requests.clear()
+    monkeypatch.setattr(Transport.DEFAULT_TRANSPORT, "request", wiki_request(prices, volumes, requests = requests))
+    assert items.update() == {1213, 554, 11832}
+    assert sorted(url.rsplit("/", 1)[1] for url, headers in requests) == ["latest", "volumes"]
+    assert items.getBuyAverage(1213) == 4900
+    assert items.getSellQuantity("fire rune") == 3200000
+    assert "buy_average" not in items.getItem(11832)
+    assert items.getItem(11832)["buy_quantity"] == 310
+    # The new snapshot was built off to the side, the old one is untouched
+    assert dagger["buy_average"] == 4820
+    assert snapshot["bandos chestplate"]["buy_average"] == 18500000
+    if not compact:
+        assert items.getItem(561) is nature
+
+    # Nothing moved, nothing changed
+    assert items.update() == set()
+
+    # Forcing the mappings rebuilds everything
+    requests.clear()
+    assert items.update(mappings = True) == {1213, 554, 561, 11832, 12345}
+    assert len(requests) == 3
+    assert items.getBuyAverage(1213) == 4900
+
+
+def test_background_refresh(monkeypatch, offline_items):
+    import threading
+    from OSRSBytes.Items import APIDown
+
+    items = offline_items()
+    calls = []
+    refreshed = threading.Event()
+
+    def update(mappings = None):
+        calls.append(mappings)
+        if len(calls) == 1:
+            raise APIDown("wiki is down")
+        if len(calls) == 2:
+            raise KeyError("data")  # a malformed payload doesn't stop the refresher either
+        refreshed.set()
+        return set()
+
+    delays = []
+    monkeypatch.setattr(items, "update", update)
+    monkeypatch.setattr(items, "_refreshDelay", lambda *args: delays.append(args[-1]) or 0.01)
+    items.startRefresh(interval = 60, mappings = False)
+    assert refreshed.wait(5)
+    items.stopRefresh()
+    assert calls[:3] == [False, False, False]
+    assert delays[:4] == [0, 1, 2, 0]
+    assert items.refresh_error is None
+
+    # Backoff doubles per failure and is capped, jitter stays within its bounds
+    assert Items._refreshDelay(items, 60, 0, 900, 3) == 480
+    assert Items._refreshDelay(items, 60, 0, 900, 10) == 900
+    assert 54 <= Items._refreshDelay(items, 60, 0.1, 900, 0) <= 66
+
+
+def test_bulk_lookups(offline_items):
+    items = offline_items()
+    records = items.getItems(["rune dagger", 554, "561", "not an item"])
+    assert [record["id"] if record else None for record in records] == [1213, 554, 561, None]
+
+    prices = items.getPrices([1213, "Bandos chestplate", 12345, 0], fields = ["buy_average", "buy_limit"])
+    assert prices["buy_average"] == [4820, 18500000, None, None]
+    assert prices["buy_limit"] == [125, 8, None, None]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_alch_values(offline_items, mappings, compact):
+    mappings = mappings + [
+        # No wiki alch values, only a store value
+        {"id": 1215, "name": "Dragon dagger", "members": True, "examine": "A powerful dagger.", "value": 30001},
+    ]
+    items = offline_items(mappings = mappings, compact = compact)
+    assert items.getLowAlchValue("rune dagger") == 3000
+    assert items.getHighAlchValue(1213) == 4500
+    assert items.getLowAlchValue("dragon dagger") == 12000
+    assert items.getHighAlchValue("dragon dagger") == 18000
+    assert items.getHighAlchValue("untraded curio") is None
+
+
+def test_compact_storage(offline_items):
+    items = offline_items()
+    compact = offline_items(compact = True)
+    assert len(compact.item_dict) == len(items.item_dict)
+    for name, record in items.item_dict.items():
+        assert compact.getItem(name) == record
+        assert compact.getItem(record["id"]) == record
+    assert compact.getSellQuantity(554) == 3120000
+    assert compact.getBuyLimit("untraded curio") is False
+
+    prices = compact.getPrices(["rune dagger", 12345], fields = ["sell_average"])
+    assert prices["sell_average"] == [4700, None]
+
+
+def test_disk_cache(offline_items, tmp_path):
+    requests = []
+    offline_items(requests = requests, cache_dir = str(tmp_path))
+    assert len(requests) == 3
+
+    requests.clear()
+    items = offline_items(requests = requests, cache_dir = str(tmp_path))
+    assert len(requests) == 0
+    assert items.getBuyAverage(1213) == 4820
+
+    # Expired entries are revalidated, a 304 reuses the cached body
+    items = offline_items(requests = requests, cache_dir = str(tmp_path), cache_ttl = {"latest": 0})
+    assert [url.rsplit("/", 1)[1] for url, headers in requests] == ["latest"]
+    assert requests[0][1]["If-None-Match"] == '"v1"'
+    assert items.getSellAverage(1213) == 4700
+
+
+def test_async_items(wiki_request):
+    import asyncio
+    from OSRSBytes import AsyncItems
+
+    class AsyncTransport(object):
+        def __init__(self):
+            self.requests = []
+            self.request_sync = wiki_request(requests = self.requests)
+
+        async def request(self, url, headers = None, timeout = None):
+            await asyncio.sleep(0)
+            return self.request_sync(url, headers, timeout)
+
+    threads = []
+
+    class RecordingItems(AsyncItems):
+        def _loadPayloads(self, *payloads):
+            threads.append(threading.get_ident())
+            return super()._loadPayloads(*payloads)
+
+    async def run():
+        transport = AsyncTransport()
+        items = await RecordingItems(transport = transport, compact = True)
+        await items.update()
+        return items, transport
+
+    items, transport = asyncio.run(run())
+    # update() only refetches /latest and /volumes
+    assert len(transport.requests) == 5
+    # The snapshot is built off the event loop's thread
+    assert len(threads) == 2 and threading.get_ident() not in threads
+    assert items.getBuyAverage(1213) == 4820
+    assert items.getName("554") == "fire rune"
+
+
+def test_async_background_refresh(monkeypatch):
+    import asyncio
+    from OSRSBytes import AsyncItems
+
+    items = AsyncItems()
+    calls, errors = [], []
+
+    async def update(mappings = None):
+        calls.append(mappings)
+        errors.append(items.refresh_error)
+        if len(calls) == 1:
+            raise OSError("connection reset")
+        return items
+
+    monkeypatch.setattr(items, "update", update)
+    monkeypatch.setattr(items, "_refreshDelay", lambda *args: 0)
+
+    async def run():
+        items.startRefresh(mappings = False)
+        while len(calls) < 2:
+            await asyncio.sleep(0.01)
+        items.stopRefresh()
+
+    asyncio.run(asyncio.wait_for(run(), 5))
+    # The error was stored and the refresher kept going
+    assert calls[:2] == [False, False]
+    assert errors[0] is None and isinstance(errors[1], OSError)
@@ -0,0 +1,74 @@
+import math
+
+import pytest
+
+from OSRSBytes.Recipes import RecipeBook, RecipeError, load_module
+
+SMITHING_MAPPINGS = [
+    {"id": 436, "name": "Copper ore", "members": False, "examine": "This needs refining.", "limit": 13000, "value": 3},
+    {"id": 438, "name": "Tin ore", "members": False, "examine": "This needs refining.", "limit": 13000, "value": 3},
+    {"id": 2349, "name": "Bronze bar", "members": False, "examine": "It's a bar of bronze.", "limit": 10000, "value": 8},
+    {"id": 1205, "name": "Bronze dagger", "members": False, "examine": "Short but pointy.", "limit": 125, "value": 10},
+    {"id": 1321, "name": "Bronze scimitar", "members": False, "examine": "A vicious, curved sword.", "limit": 125, "value": 32},
+    {"id": 39, "name": "Bronze arrowtips", "members": False, "examine": "I can make some arrows with these.", "limit": 10000, "value": 1},
+]
+
+SMITHING_PRICES = {
+    "436": {"high": 40, "highTime": 1697600000, "low": 35, "lowTime": 1697600000},
+    "438": {"high": 30, "highTime": 1697600000, "low": 28, "lowTime": 1697600000},
+    "2349": {"high": 150, "highTime": 1697600000, "low": 140, "lowTime": 1697600000},
+    "1205": {"high": 60, "highTime": 1697600000, "low": 55, "lowTime": 1697600000},
+    "1321": {"high": 400, "highTime": 1697600000, "low": 390, "lowTime": 1697600000},
+    "39": {"high": 14, "highTime": 1697600000, "low": 12, "lowTime": 1697600000},
+}
+
+
+def test_load_modules():
+    assert load_module("fletching") == {}
+    with pytest.raises(RecipeError):
+        load_module("not a skill")
+    with pytest.raises(RecipeError):
+        RecipeBook.fromModules(["fletching"])
+
+    book = RecipeBook.fromModules()
+    bar, = book.makes("Bronze bar")
+    assert bar.inputs == (("copper ore", 2), ("tin ore", 2))
+    assert bar.exp == 6.2 and bar.level == 1
+
+    scimitar, = book.makes("bronze scimitar")
+    assert scimitar.inputs == (("bronze bar", 2),)
+    assert scimitar.exp == 25 and scimitar.level == 5
+    # iron products don't list an amount or level
+    dagger, = book.makes("iron dagger")
+    assert dagger.amount == 1 and dagger.level is None and dagger.exp == 25
+    assert {recipe.name for recipe in book.usedIn("coal")} == {"steel bar", "mithril bar"}
+
+
+def test_evaluate(offline_items):
+    items = offline_items(prices = SMITHING_PRICES, volumes = {}, mappings = SMITHING_MAPPINGS)
+    book = RecipeBook.fromModules(["smithing"])
+    results = book.evaluate(items)
+    assert len(results) == len(book)
+
+    rows = {recipe.name: index for index, recipe in enumerate(book.recipes)}
+    bar = results.row(rows["bronze bar"])
+    assert bar["cost"] == 2 * 40 + 2 * 30
+    assert bar["revenue"] == 140
+    assert bar["tax"] == 2
+    assert bar["profit"] == 140 - 2 - 140
+    assert bar["xp_per_gp"] == pytest.approx(6.2 / 2)
+
+    arrowtips = results.row(rows["bronze arrowtips"])
+    assert arrowtips["revenue"] == 15 * 12
+    assert arrowtips["tax"] == 0
+    assert arrowtips["profit"] == 15 * 12 - 150
+    assert arrowtips["xp_per_gp"] == math.inf
+
+    # Unpriced recipes (no market data for the product or an input) are left out of rankings
+    assert results.row(rows["iron dagger"])["profit"] is None
+    assert [row["name"] for row in results.top("profit", limit=3)] == ["bronze scimitar", "bronze arrowtips", "bronze bar"]
+    assert [row["name"] for row in results.top("profit", level=4)] == ["bronze bar", "bronze dagger"]
+    assert results.top("profit", skill="fletching") == []
+    assert results.top("xp_per_gp", ascending=True, limit=1)[0]["name"] == "bronze dagger"
+    with pytest.raises(ValueError):
+        results.top("fun")
@@ -0,0 +1,51 @@
+import pytest
+
+from OSRSBytes.Search import SearchIndex, edit_distance
+
+NAMES = [
+    "rune dagger", "rune dagger(p++)", "rune dart", "rune 2h sword", "runite bar", "dragon dagger",
+    "bronze dagger", "fire rune", "nature rune", "bandos chestplate", "abyssal whip", "abyssal dagger",
+]
+
+
+def test_edit_distance():
+    assert edit_distance("kitten", "sitting") == 3
+    assert edit_distance("rune dagger", "rune dagger") == 0
+    assert edit_distance("", "rune") == 4
+    assert edit_distance("rnue dager", "rune dagger") == 3
+    assert edit_distance("a" * 80, "a" * 79 + "b") == 1
+
+
+def test_search_index():
+    index = SearchIndex(NAMES)
+    # Prefix matches come shortest first, then names with a later word starting with the query
+    assert index.prefix("rune da") == ["rune dart", "rune dagger", "rune dagger(p++)"]
+    assert index.prefix("dagger") == ["rune dagger", "bronze dagger", "dragon dagger", "abyssal dagger", "rune dagger(p++)"]
+    assert index.prefix("rune", limit=3) == ["rune dart", "rune dagger", "rune 2h sword"]
+    assert index.prefix("") == []
+
+    assert index.fuzzy("rnue dager")[0] == "rune dagger"
+    assert index.fuzzy("abysal wip")[0] == "abyssal whip"
+    assert index.fuzzy("bandos chestplat")[0] == "bandos chestplate"
+    assert index.fuzzy("zzzz") == []
+
+    # Prefix matches first, fuzzy matches fill the rest
+    assert index.search("abyssal w", limit=3) == ["abyssal whip", "abyssal dagger"]
+    results = index.search("rune da", limit=4)
+    assert results[:3] == ["rune dart", "rune dagger", "rune dagger(p++)"]
+    assert len(results) == 4
+    assert index.search("rune dagger")[0] == "rune dagger"
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_items_search(offline_items, compact):
+    items = offline_items(compact=compact)
+    assert items.search("Rune d", limit=1) == ["rune dagger"]
+    assert items.search("natre run")[0] == "nature rune"
+    assert items.search("rune", limit=2) == ["rune dagger", "fire rune"]
+    assert items.search("561") == ["nature rune"]
+    assert items.search("99999") == []
+    assert items.getBuyAverage(items.search("bandos chest")[0]) == 18500000
+    # Still answers after the snapshot is swapped
+    items.update()
+    assert items.search("bandos", limit=1) == ["bandos chestplate"]
@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+from OSRSBytes import Transport
+from OSRSBytes.Items import APIDown, SharedItems
+from OSRSBytes.Shared import SnapshotFileError, attach_table, read_header
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_publish_and_attach(monkeypatch, offline_items, wiki_request, prices, tmp_path, compact):
+    path = tmp_path / "items.snapshot"
+    items = offline_items(compact = compact, publish_to = str(path))
+    assert read_header(str(path)).generation == 1
+
+    shared = SharedItems(str(path))
+    assert shared.generation == 1
+    assert len(shared.item_dict) == len(items.item_dict)
+    for name, record in items.item_dict.items():
+        assert shared.getItem(name) == record
+    assert shared.getItem(561) == items.getItem(561)
+    assert shared.getBuyLimit("untraded curio") is False
+
+    # The numeric columns are views into the mapped file, not copies
+    assert isinstance(shared.item_dict.columns["buy_average"], memoryview)
+
+    # Nothing new published, nothing to do
+    assert shared.update() == set()
+
+    prices["1213"] = {"high": 5000, "highTime": 1697600300, "low": 4750, "lowTime": 1697600300}
+    monkeypatch.setattr(Transport.DEFAULT_TRANSPORT, "request", wiki_request(prices))
+    old = shared.item_dict
+    items.update()
+    assert shared.getBuyAverage(1213) == 4820
+    assert shared.update() == {1213, 554, 561, 11832, 12345}
+    assert shared.generation == 2
+    assert shared.getBuyAverage(1213) == 5000
+    # Readers holding the old snapshot still see it whole
+    assert old["rune dagger"]["buy_average"] == 4820
+
+    # It is unmapped once the snapshot after it has been replaced as well
+    items.update()
+    assert shared.update() == set(shared.item_dict.byID())
+    assert shared.generation == 3
+    assert old.mapping is None and shared.item_dict.mapping is not None
+    assert shared.getBuyAverage(1213) == 5000
+
+
+def test_snapshot_errors(tmp_path):
+    path = tmp_path / "items.snapshot"
+    with pytest.raises(APIDown):
+        SharedItems(str(path))
+    path.write_bytes(b"definitely not a snapshot, but long enough for a header")
+    with pytest.raises(SnapshotFileError):
+        attach_table(str(path))
+
+
+def test_held_column_view(monkeypatch, offline_items, tmp_path):
+    import struct
+
+    path = tmp_path / "items.snapshot"
+    items = offline_items(compact = True, publish_to = str(path))
+    shared = SharedItems(str(path))
+    # Holds an export on a column of the first snapshot, like column(asArray=True) does
+    held = struct.iter_unpack("<q", shared.item_dict.columns["sell_average"])
+    for generation in (2, 3, 4):
+        items.update()
+        shared.update()
+        assert shared.generation == generation
+    assert shared.getBuyAverage(1213) == 4820
+    assert next(held) is not None
+
+
+def test_concurrent_publishers(offline_items, tmp_path):
+    import threading
+    from OSRSBytes.Shared import publish_table
+
+    items = offline_items(compact = True)
+    path = str(tmp_path / "items.snapshot")
+    generations = []
+
+    def publish():
+        for _ in range(20):
+            generations.append(publish_table(items.item_dict, path))
+
+    threads = [threading.Thread(target = publish) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(generations) == list(range(1, 81))
+    assert read_header(path).generation == 80
+    assert sorted(os.listdir(tmp_path)) == ["items.snapshot"]
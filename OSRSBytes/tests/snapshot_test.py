@@ -0,0 +1,28 @@
+from OSRSBytes.Snapshot import ActivityEntry, PlayerSnapshot, SkillEntry
+
+
+def test_player_snapshot(index_lite, bosses):
+    snapshot = PlayerSnapshot.fromIndexLite(index_lite(2).decode(), bosses, "zezima", "N", timestamp=1.0)
+    assert snapshot.skill("total") == SkillEntry(2000, 1500, 200000000)
+    attack = snapshot.skill("attack")
+    assert attack == SkillEntry(2, 90, 6002000)
+    assert attack.next_level_exp == 5902831
+    assert snapshot.skill("construction").rank == 2 + 22
+    assert snapshot.skill("sailing") is None
+
+    assert snapshot.activity("bounties", "hunter") == ActivityEntry(102, 21)
+    assert snapshot.activity("clues", "all") == ActivityEntry(106, 25)
+    assert snapshot.activity("bosses", "zulrah") == ActivityEntry(121, 40)
+    assert snapshot.activity("bosses", "not a boss") is None
+    assert snapshot.section("lms_arenas_sw")["lms_rank"] == {"rank": 113, "score": 32}
+
+    # Entries share the boss list and hold no per-entry objects
+    assert snapshot.bosses is bosses
+    assert not hasattr(attack, "__dict__")
+
+
+def test_short_response(index_lite, bosses):
+    snapshot = PlayerSnapshot.fromIndexLite(index_lite(2, bosses[:3]).decode(), bosses)
+    assert snapshot.activity("bosses", "alchemical_hydra") is not None
+    assert snapshot.activity("bosses", "vorkath") is None
+    assert list(snapshot.section("bosses")) == bosses[:3]
@@ -0,0 +1,55 @@
+import pytest
+
+from OSRSBytes.Snapshot import PlayerSnapshot
+from OSRSBytes.Tracker import SnapshotStore, TrackerError
+
+
+@pytest.fixture
+def snapshot(index_lite, bosses):
+    """Builds the PlayerSnapshot of a canned index_lite.ws response"""
+    def build(username, seed, timestamp, boss_list = bosses):
+        return PlayerSnapshot.fromIndexLite(index_lite(seed, boss_list).decode(), boss_list, username, "N", timestamp)
+    return build
+
+
+def test_snapshot_store(snapshot, tmp_path):
+    path = tmp_path / "snapshots.sqlite"
+    store = SnapshotStore(str(path), keyframe_interval=4)
+    for day in range(10):
+        store.add(snapshot("zezima", 2 + day, 86400.0 * day))
+        store.add(snapshot("lynx titan", 2 + 3 * day, 86400.0 * day))
+
+    # Every snapshot comes back intact through the keyframe/delta chain
+    history = store.snapshots("Zezima")
+    assert len(history) == 10
+    assert history[7].skills == snapshot("zezima", 9, 0).skills
+    assert history[7].activities == snapshot("zezima", 9, 0).activities
+    assert history[7].timestamp == 86400.0 * 7
+
+    gains = store.gains("zezima", 86400.0 * 2, 86400.0 * 6)
+    assert gains["skills"]["attack"] == 4000
+    assert gains["bosses"]["zulrah"] == 40
+    assert gains["clues"]["all"] == 40
+    assert store.gains("zezima", 86400.0 * 20, 86400.0 * 30) is None
+
+    assert store.topGainers("attack", 0, 86400.0 * 9) == [("lynx titan", 27000), ("zezima", 9000)]
+    assert store.topGainers("zulrah", 0, 86400.0 * 9, limit=1) == [("lynx titan", 270)]
+    store.close()
+
+    # Reopening continues the chains where they left off
+    store = SnapshotStore(str(path), keyframe_interval=4)
+    with pytest.raises(TrackerError):
+        store.add(snapshot("zezima", 20, 86400.0 * 9))
+    store.add(snapshot("zezima", 20, 86400.0 * 10))
+    assert store.gains("zezima", 86400.0 * 9, 86400.0 * 10)["skills"]["attack"] == 9000
+    store.close()
+
+
+def test_boss_list_change(snapshot, bosses):
+    store = SnapshotStore(":memory:")
+    store.add(snapshot("zezima", 2, 1.0, bosses[:-1]))
+    store.add(snapshot("zezima", 3, 2.0))
+    assert store.snapshots("zezima")[0].bosses == tuple(bosses[:-1])
+    gains = store.gains("zezima", 0, 3.0)
+    assert gains["bosses"]["vorkath"] == 10
+    assert gains["bosses"]["zulrah"] == 50
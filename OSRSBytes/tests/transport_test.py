@@ -0,0 +1,233 @@
+import gzip
+import os
+import http.server
+import socket
+import threading
+
+from OSRSBytes.Transport import HTTPTransport, TransportError
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = "{} {}".format(self.path, self.client_address[1]).encode()
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+        self.send_response(200)
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_pooled_gzip_requests():
+    server = serve()
+    transport = HTTPTransport(timeout=5)
+    try:
+        url = "http://127.0.0.1:{}/api?x=1".format(server.server_address[1])
+        first = transport.request(url)
+        second = transport.request(url)
+        assert first.status == 200
+        assert first.body.startswith(b"/api?x=1 ")
+        # Same client port means the keep-alive connection was reused
+        assert first.body == second.body
+    finally:
+        transport.close()
+        server.shutdown()
+
+
+def test_unreachable_host():
+    server = serve()
+    port = server.server_address[1]
+    server.shutdown()
+    server.server_close()
+    try:
+        HTTPTransport(timeout=1).request("http://127.0.0.1:{}/".format(port))
+        assert False, "expected TransportError"
+    except TransportError:
+        pass
+
+
+class FlakyServer(object):
+    """A keep-alive server that closes each connection after one response (mode 'close'), keeps it
+    open ('keep') or stops answering ('hang')"""
+
+    def __init__(self):
+        self.mode = "close"
+        self.accepted = 0
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(16)
+        self.url = "http://127.0.0.1:{}/".format(self.sock.getsockname()[1])
+        threading.Thread(target=self.accept, daemon=True).start()
+
+    def accept(self):
+        while True:
+            try:
+                conn, address = self.sock.accept()
+            except OSError:
+                return
+            self.accepted += 1
+            threading.Thread(target=self.serve, args=(conn,), daemon=True).start()
+
+    def serve(self, conn):
+        while conn.recv(65536):
+            if self.mode == "hang":
+                continue
+            conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            if self.mode == "close":
+                conn.close()
+                return
+
+
+def test_stale_connections_are_retried_once(monkeypatch):
+    server = FlakyServer()
+    transport = HTTPTransport(timeout=5)
+    # Three pooled connections that the server has already closed
+    threads = [threading.Thread(target=transport.request, args=(server.url,)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    acquire = transport._HTTPTransport__acquire
+    attempts = []
+    monkeypatch.setattr(transport, "_HTTPTransport__acquire", lambda *args: attempts.append(args) or acquire(*args))
+    # One stale connection fails, the others are dropped and the retry uses a new connection
+    assert transport.request(server.url).body == b"ok"
+    assert len(attempts) == 2
+
+    # A timeout on a reused connection is not retried
+    server.mode = "keep"
+    transport.request(server.url)
+    server.mode = "hang"
+    attempts.clear()
+    accepted = server.accepted
+    try:
+        transport.request(server.url, timeout=0.2)
+        assert False, "expected TransportError"
+    except TransportError:
+        pass
+    assert len(attempts) == 1 and server.accepted == accepted
+    server.sock.close()
+
+
+def test_async_pooled_gzip_requests():
+    import asyncio
+    from OSRSBytes.Transport import AsyncHTTPTransport
+
+    server = serve()
+    transport = AsyncHTTPTransport(timeout=5, max_concurrency=2)
+    url = "http://127.0.0.1:{}/api?x=1".format(server.server_address[1])
+
+    async def run():
+        first = await transport.request(url)
+        second = await transport.request(url)
+        many = await asyncio.gather(*(transport.request(url) for _ in range(6)))
+        return first, second, many
+
+    try:
+        first, second, many = asyncio.run(run())
+        assert first.status == 200
+        assert first.body.startswith(b"/api?x=1 ")
+        assert first.body == second.body
+        assert all(response.status == 200 for response in many)
+    finally:
+        server.shutdown()
+
+
+class CannedTransport(object):
+    def __init__(self, request):
+        self.request = request
+
+
+def no_network(url, headers = None, timeout = None):
+    raise AssertionError("unexpected request to {}".format(url))
+
+
+def test_record_and_replay_items(monkeypatch, wiki_request, tmp_path):
+    import asyncio
+    from OSRSBytes import AsyncItems, Items
+    from OSRSBytes import Transport as transport_module
+    from OSRSBytes.Transport import AsyncReplayTransport, RecordingTransport, ReplayTransport
+
+    monkeypatch.setattr(transport_module.DEFAULT_TRANSPORT, "request", no_network)
+    recorder = RecordingTransport(str(tmp_path), CannedTransport(wiki_request()))
+    recorded = Items(transport = recorder)
+    assert len(os.listdir(tmp_path)) == 6  # body and metadata for each of the three endpoints
+
+    replay = ReplayTransport(str(tmp_path))
+    assert sorted(url.rsplit("/", 1)[1] for url in replay.urls()) == ["latest", "mapping", "volumes"]
+    items = Items(transport = replay)
+    assert items.item_dict == recorded.item_dict
+    assert items.getBuyAverage("rune dagger") == 4820
+    assert items.update() == set()
+    assert len(replay.requests) == 5
+
+    items = asyncio.run(AsyncItems(transport = AsyncReplayTransport(str(tmp_path))).update())
+    assert items.getSellAverage(561) == 187
+
+    try:
+        replay.request("https://example.com/not-recorded")
+        assert False, "expected TransportError"
+    except TransportError:
+        pass
+
+
+def test_record_and_replay_hiscores(monkeypatch, hiscores_request, hiscores_module, bosses, boss_list_cache, tmp_path):
+    from OSRSBytes import Hiscores
+    from OSRSBytes import Transport as transport_module
+    from OSRSBytes.Cache import CachedValue
+    from OSRSBytes.Transport import RecordingTransport, ReplayTransport
+
+    monkeypatch.setattr(transport_module.DEFAULT_TRANSPORT, "request", no_network)
+    recorder = RecordingTransport(str(tmp_path), CannedTransport(hiscores_request({"zezima": 3})))
+    recorded = Hiscores("Zezima", transport = recorder)
+    assert Hiscores("nobody", transport = recorder).status == 404
+
+    # A fresh boss list cache, so the boss list page is replayed too
+    monkeypatch.setattr(hiscores_module, "BOSS_LIST_CACHE", CachedValue(ttl=3600))
+    replay = ReplayTransport(str(tmp_path))
+    user = Hiscores("Zezima", transport = replay)
+    assert user.stats == recorded.stats
+    assert list(user.getBossGenerator()) == bosses
+    assert Hiscores("nobody", transport = replay).status == 404
+    assert len(replay.requests) == 3
+
+
+def test_record_over_gzip(tmp_path):
+    import asyncio
+    from OSRSBytes.Transport import AsyncHTTPTransport, AsyncRecordingTransport, RecordingTransport, ReplayTransport
+
+    server = serve()
+    url = "http://127.0.0.1:{}/api?x=1".format(server.server_address[1])
+    try:
+        recorded = RecordingTransport(str(tmp_path / "sync"), HTTPTransport(timeout=5)).request(url)
+        async_recorded = asyncio.run(AsyncRecordingTransport(str(tmp_path / "async"), AsyncHTTPTransport(timeout=5)).request(url))
+    finally:
+        server.shutdown()
+
+    # Bodies are recorded decompressed, so the headers describing the compressed body are dropped
+    for directory, response in (("sync", recorded), ("async", async_recorded)):
+        replayed = ReplayTransport(str(tmp_path / directory)).request(url)
+        assert replayed.body == response.body
+        assert replayed.body.startswith(b"/api?x=1 ")
+        assert not {"content-encoding", "content-length"} & {name.lower() for name in replayed.headers}
+
+
+def test_async_clients_take_the_same_arguments():
+    import inspect
+    from OSRSBytes import AsyncHiscores, AsyncItems, Hiscores, Items
+
+    for sync, asynchronous in ((Items, AsyncItems), (Hiscores, AsyncHiscores)):
+        assert list(inspect.signature(asynchronous).parameters) == list(inspect.signature(sync).parameters)
@@ -0,0 +1,58 @@
+import importlib
+import os
+
+import pytest
+
+from OSRSBytes.Utilities import ModuleError, ModuleRegistry, Utilities
+
+# The package re-exports the Utilities class under the module's name
+utilities = importlib.import_module("OSRSBytes.Utilities")
+
+
+def test_get_location():
+    location = Utilities()
+    assert os.path.basename(location.__package_dir__) == "OSRSBytes"
+    assert os.path.exists(os.path.join(location.__modules_dir__, "smithing.json"))
+    assert location.__this__ == os.path.realpath(utilities.__file__)
+
+
+def test_module_registry(monkeypatch, tmp_path):
+    modules = tmp_path / "modules"
+    modules.mkdir()
+    (modules / "smithing.json").write_text('{"bronze": {"multiplier": 12.5}}')
+    (modules / "fletching.json").write_text("\n")
+    (modules / "broken.json").write_text('{"bronze": {},}')
+    (modules / "notes.txt").write_text("not a module")
+    cache = tmp_path / "cache"
+
+    registry = ModuleRegistry(str(modules), cache_dir = str(cache))
+    assert not cache.exists()  # nothing is read until asked for
+    assert sorted(registry) == ["broken", "fletching", "smithing"]
+    assert "smithing" in registry and "notes" not in registry
+    assert registry["smithing"] == {"bronze": {"multiplier": 12.5}}
+    assert registry["smithing"] is registry["smithing"]
+    assert registry["fletching"] == {}
+    assert registry.get("woodcutting") is None
+    with pytest.raises(ModuleError):
+        registry["broken"]
+    compiled, = [name for name in os.listdir(cache) if name.startswith("smithing-")]
+
+    # A new registry reads the compiled form instead of parsing the JSON again
+    monkeypatch.setattr(utilities.json, "loads", None)
+    assert ModuleRegistry(str(modules), cache_dir = str(cache))["smithing"] == {"bronze": {"multiplier": 12.5}}
+    monkeypatch.undo()
+
+    # Changing the file changes the key, the stale compiled form is dropped
+    (modules / "smithing.json").write_text('{"iron": {"multiplier": 25}}')
+    assert ModuleRegistry(str(modules), cache_dir = str(cache))["smithing"] == {"iron": {"multiplier": 25}}
+    assert compiled not in os.listdir(cache)
+    assert len([name for name in os.listdir(cache) if name.startswith("smithing-")]) == 1
+
+    # A compiled form that isn't valid is ignored and the JSON parsed instead
+    compiled, = [name for name in os.listdir(cache) if name.startswith("smithing-")]
+    (cache / compiled).write_bytes(b"\x80\x04not marshal data")
+    assert ModuleRegistry(str(modules), cache_dir = str(cache))["smithing"] == {"iron": {"multiplier": 25}}
+
+    # The cache is opt-in, by default nothing is written
+    assert ModuleRegistry(str(modules)).cache_dir is None
+    assert ModuleRegistry(str(modules))["smithing"] == {"iron": {"multiplier": 25}}
@@ -0,0 +1,133 @@
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that features Item Information Lookup, Hiscores, and Market information.
+
+EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
+
+Benchmark fixtures: recorded responses (see OSRSBytes.Transport.RecordingTransport) for the benchmark
+suite to replay.  record_synthetic() records a deterministic, full size data set (every endpoint
+Items and Hiscores use) without touching the network; record_live() records the real APIs once.
+Either way the directory gets a manifest.json naming the players that were recorded.
+"""
+
+# Generic/Built-in Imports
+import json
+import os
+import random
+
+from OSRSBytes.Hiscores import FALLBACK_BOSSES, Hiscores, fetch_boss_list, hiscoresURL
+from OSRSBytes.Items import WIKI_ENDPOINTS, Items
+from OSRSBytes.Snapshot import BOUNTY_HUNTER, CLUE_TIERS, LMS_ARENA_SW, SKILLS
+from OSRSBytes.Transport import RecordingTransport, Response
+
+# Roughly the size of the live wiki mapping
+SYNTHETIC_ITEMS = 4200
+SYNTHETIC_PLAYERS = 1000
+
+MATERIALS = ("bronze", "iron", "steel", "black", "mithril", "adamant", "rune", "dragon", "oak", "willow",
+             "maple", "yew", "magic", "blue", "green", "red", "cooked", "raw", "uncut", "ancient")
+KINDS = ("dagger", "sword", "longsword", "scimitar", "mace", "warhammer", "battleaxe", "2h sword", "platebody",
+         "platelegs", "plateskirt", "chainbody", "full helm", "med helm", "sq shield", "kiteshield", "boots",
+         "gloves", "arrow", "bolts", "dart", "knife", "javelin", "logs", "plank", "shortbow", "longbow",
+         "shark", "lobster", "ore", "bar", "gem", "amulet", "ring", "necklace", "bracelet", "cape", "hood",
+         "robe top", "robe bottom", "staff", "wand", "shield", "pickaxe", "axe", "harpoon", "seed", "potion(4)",
+         "potion(3)", "potion(2)", "potion(1)")
+
+def manifest(directory: str):
+    """manifest() function
+
+    Returns the manifest.json of a fixture directory: {'players': [...], 'source': ...}.
+    """
+    with open(os.path.join(directory, 'manifest.json'), 'r') as f:
+        return json.load(f)
+
+def write_manifest(directory, players, source):
+    with open(os.path.join(directory, 'manifest.json'), 'w') as f:
+        json.dump({'players': list(players), 'source': source}, f, indent=1)
+
+def boss_page(bosses = FALLBACK_BOSSES):
+    """Builds the activity hiscores page that the boss list is scraped from"""
+    lines = ['<span style="color: #d9c27e;display: block;text-align: center;">----</span>']
+    lines += ["<br>"] * 14
+    lines += ['<a href="#" class="activity-link {}">{}</a>'.format(boss, boss.replace('_', ' ').title()) for boss in bosses]
+    lines += ["</div>"]
+    return "\n".join(lines).encode()
+
+def index_lite(rng, bosses = FALLBACK_BOSSES):
+    """Builds an index_lite.ws response with a full row for every skill, activity and boss"""
+    lines = ["{},{},{}".format(rng.randint(1, 2000000), rng.randint(500, 2277), rng.randint(10 ** 6, 4600000000))]
+    for skill in SKILLS:
+        lines.append("{},{},{}".format(rng.randint(1, 2000000), rng.randint(1, 99), rng.randint(0, 200000000)))
+    lines += ["-1,-1", "-1,-1"]
+    for activity in range(len(BOUNTY_HUNTER) + len(CLUE_TIERS) + len(LMS_ARENA_SW) + len(bosses)):
+        if rng.random() < 0.3:
+            lines.append("-1,-1")
+        else:
+            lines.append("{},{}".format(rng.randint(1, 500000), rng.randint(1, 5000)))
+    return "\n".join(lines).encode()
+
+def wiki_payloads(rng, count):
+    """Builds the mapping, latest and volumes payloads for count items"""
+    mappings, prices, volumes = [], {}, {}
+    for itemid in range(count):
+        name = "{} {}".format(MATERIALS[itemid % len(MATERIALS)], KINDS[(itemid // len(MATERIALS)) % len(KINDS)])
+        if itemid >= len(MATERIALS) * len(KINDS):
+            name = "{} ({})".format(name, itemid // (len(MATERIALS) * len(KINDS)))
+        value = rng.randint(1, 500000)
+        item = {"id": itemid, "name": name.capitalize(), "members": rng.random() < 0.7,
+                "examine": "A {}.".format(name), "value": value, "lowalch": value * 2 // 5, "highalch": value * 3 // 5}
+        if rng.random() < 0.9:
+            item["limit"] = rng.choice((8, 70, 125, 1000, 10000, 25000))
+        mappings.append(item)
+        if rng.random() < 0.85:
+            high = rng.randint(1, 50000000)
+            prices[str(itemid)] = {"high": high, "highTime": 1697600000, "low": max(1, high - rng.randint(0, high // 10)),
+                                   "lowTime": 1697600000}
+            volumes[str(itemid)] = rng.randint(0, 5000000)
+    return {"mapping": mappings, "latest": {"data": prices}, "volumes": {"data": volumes}}
+
+class SyntheticTransport(object):
+    """Answers every Items and Hiscores url with the synthetic payloads"""
+
+    def __init__(self, items, players, seed):
+        payloads = wiki_payloads(random.Random(seed), items)
+        self.wiki = {url: json.dumps(payloads[endpoint]).encode() for endpoint, url in WIKI_ENDPOINTS}
+        self.players = {hiscoresURL(name, 'N'): index_lite(random.Random("{}{}".format(seed, name))) for name in players}
+        self.bosses = boss_page()
+
+    def request(self, url, headers = None, timeout = None):
+        if url in self.wiki:
+            return Response(200, {'content-type': 'application/json'}, self.wiki[url])
+        if url in self.players:
+            return Response(200, {}, self.players[url])
+        if 'category_type=1' in url:
+            return Response(200, {}, self.bosses)
+        return Response(404, {}, b"")
+
+def record_synthetic(directory: str, items: int = SYNTHETIC_ITEMS, players: int = SYNTHETIC_PLAYERS, seed: int = 2023):
+    """record_synthetic() function
+
+    Records a synthetic data set into directory: the three wiki endpoints for items items, the boss
+    list page and players index_lite responses.  The same arguments always record the same bytes.
+    """
+    names = ["player {}".format(number) for number in range(players)]
+    recorder = RecordingTransport(directory, SyntheticTransport(items, names, seed))
+    record(recorder, names)
+    write_manifest(directory, names, 'synthetic items={} players={} seed={}'.format(items, players, seed))
+
+def record_live(directory: str, players):
+    """record_live() function
+
+    Records the live wiki endpoints, the boss list page and every player in players into directory.
+    """
+    record(RecordingTransport(directory), players)
+    write_manifest(directory, players, 'live')
+
+def record(recorder, players):
+    Items(transport = recorder)
+    fetch_boss_list(recorder)
+    for name, result in Hiscores.fetch_many(players, transport = recorder):
+        if isinstance(result, Exception):
+            raise result
@@ -0,0 +1,238 @@
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+OSRSBytes() is an all-in-one Python library for Old School Runescape (OSRS) that features Item Information Lookup, Hiscores, and Market information.
+
+EPL-2.0 (https://github.com/Coffee-fueled-deadlines/OSRSBytes/blob/master/LICENSE)
+
+Benchmark suite for the parsing, lookup and refresh hot paths, run from the repository root:
+
+    python -m benchmarks.run --output results.json
+
+Every benchmark replays recorded responses (see benchmarks/fixtures.py), so results only measure
+OSRSBytes itself.  Results are written as JSON, checked against the per benchmark limits in
+benchmarks/thresholds.json and, with --baseline, against an earlier results file.  The exit status
+is 1 when anything regressed.
+"""
+
+# Generic/Built-in Imports
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+
+from OSRSBytes.Cache import CachedValue
+from OSRSBytes.Hiscores import BOSS_LIST_URL, Hiscores, parse_boss_list
+from OSRSBytes.Items import WIKI_ENDPOINTS, Items, __version__
+from OSRSBytes.Transport import ReplayTransport
+
+from benchmarks.fixtures import manifest, record_synthetic
+
+# The package exports the Hiscores class under the module's name
+hiscores_module = importlib.import_module('OSRSBytes.Hiscores')
+
+SCHEMA = 1
+THRESHOLDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'thresholds.json')
+
+# Player counts of the bulk lookup benchmarks
+BULK_SIZES = (1, 10, 100, 1000)
+
+# Fixture sizes, repeats and bulk sizes of a --quick run
+QUICK = {'items': 500, 'players': 100, 'repeat': 3, 'min_time': 0.02, 'bulk': (1, 10, 100)}
+
+# How many names and IDs the getter benchmarks look up per call
+GETTER_SAMPLE = 1000
+
+@contextlib.contextmanager
+def boss_list_cache(fixtures: str):
+    """boss_list_cache() context manager
+
+    Swaps Hiscores' process wide BOSS_LIST_CACHE for one holding the recorded boss list, so every
+    lookup gets the same list without a fetch (the scrape is benchmarked on its own), and puts the
+    original back on exit.  Set up and run benchmarks() inside it.
+    """
+    shared = hiscores_module.BOSS_LIST_CACHE
+    cache = CachedValue(ttl=shared.ttl)
+    cache.set(parse_boss_list(ReplayTransport(fixtures).response(BOSS_LIST_URL).body))
+    hiscores_module.BOSS_LIST_CACHE = cache
+    try:
+        yield cache
+    finally:
+        hiscores_module.BOSS_LIST_CACHE = shared
+
+def benchmarks(fixtures: str, bulk_sizes = BULK_SIZES):
+    """benchmarks() function
+
+    Returns the benchmarks for a fixture directory as (name, function, ops) tuples, where one call of
+    function performs ops operations.  Everything a benchmark needs is set up here, outside the timings.
+    Call it, and the benchmarks, within boss_list_cache().
+    """
+    replay = ReplayTransport(fixtures)
+    players = manifest(fixtures)['players']
+    bodies = {endpoint: replay.response(url).body for endpoint, url in WIKI_ENDPOINTS}
+    boss_page = replay.response(BOSS_LIST_URL).body
+
+    items = Items(transport = replay)
+    compact = Items(compact = True, transport = replay)
+    # Items without a price raise KeyError, only traded items are looked up
+    traded = [name for name, record in items.item_dict.items() if 'buy_average' in record]
+    names = traded[::max(1, len(traded) // GETTER_SAMPLE)][:GETTER_SAMPLE]
+    ids = [items.getItemID(name) for name in names]
+
+    def rectify(client):
+        prices, volumes, mappings = client._decodePayloads(bodies)
+        return lambda: client._Items__rectifyWikiResponse(prices, volumes, mappings)
+
+    def by_name():
+        for name in names:
+            items.getBuyAverage(name)
+
+    def by_id():
+        for itemid in ids:
+            items.getBuyAverage(itemid)
+
+    parsed = [Hiscores(name, transport = replay) for name in players[:100]]
+
+    def parse_players():
+        for player in parsed:
+            player._Hiscores__parseData()
+
+    def bulk(count):
+        def lookup():
+            for name, result in Hiscores.fetch_many(players[:count], transport = replay):
+                if isinstance(result, Exception):
+                    raise result
+        return lookup
+
+    suite = [
+        ('items.rectify', rectify(items), 1),
+        ('items.rectify_compact', rectify(compact), 1),
+        ('items.update', lambda: items.update(mappings = True), 1),
+        ('items.getter_by_name', by_name, len(names)),
+        ('items.getter_by_id', by_id, len(ids)),
+        ('hiscores.parse', parse_players, len(parsed)),
+        ('hiscores.boss_list', lambda: parse_boss_list(boss_page), 1),
+    ]
+    suite += [('hiscores.bulk_{}'.format(count), bulk(count), count) for count in bulk_sizes if count <= len(players)]
+    return suite
+
+def measure(function, ops: int, repeat: int = 5, min_time: float = 0.2):
+    """measure() function
+
+    Times function with timeit, calling it often enough per repeat to run for at least min_time
+    seconds, and returns the per operation timings in microseconds.
+    """
+    timer = timeit.Timer(function)
+    number, elapsed = timer.autorange()
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    timings = [seconds / (number * ops) * 1e6 for seconds in timer.repeat(repeat = repeat, number = number)]
+    return {
+        'unit': 'us/op',
+        'median': round(statistics.median(timings), 3),
+        'min': round(min(timings), 3),
+        'ops': ops,
+        'calls': number,
+        'repeat': repeat,
+    }
+
+def check(results: dict, thresholds: dict = None, baseline: dict = None, tolerance: float = 0.25):
+    """check() function
+
+    Returns the regressions in results: every benchmark whose median is above its threshold, or more
+    than tolerance (a fraction) above its median in baseline, a results dictionary from an earlier run.
+    """
+    regressions = []
+    for name, result in sorted(results.items()):
+        limit = (thresholds or {}).get(name)
+        if limit is not None and result['median'] > limit:
+            regressions.append({'name': name, 'median': result['median'], 'limit': limit, 'against': 'threshold'})
+        previous = (baseline or {}).get(name)
+        if previous is not None and result['median'] > previous['median'] * (1 + tolerance):
+            regressions.append({'name': name, 'median': result['median'], 'limit': round(previous['median'] * (1 + tolerance), 3),
+                                'against': 'baseline'})
+    return regressions
+
+def run(fixtures: str, repeat: int = 5, bulk_sizes = BULK_SIZES, only = None, log = None, min_time: float = 0.2):
+    """run() function
+
+    Runs every benchmark (or those whose name starts with one of only) against a fixture directory
+    and returns {name: result}, see measure().
+    """
+    results = {}
+    with boss_list_cache(fixtures):
+        for name, function, ops in benchmarks(fixtures, bulk_sizes):
+            if only and not name.startswith(tuple(only)):
+                continue
+            results[name] = measure(function, ops, repeat, min_time)
+            if log:
+                log("{:<24} {:>12.3f} us/op  (min {:.3f}, {} ops/call)".format(name, results[name]['median'],
+                                                                             results[name]['min'], ops))
+    return results
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = 'python -m benchmarks.run', description = 'Benchmarks the parsing, lookup and refresh hot paths against recorded responses.')
+    parser.add_argument('--fixtures', help = 'Fixture directory, synthetic fixtures are recorded into it when it has no manifest.json '
+                                             '(default: a temporary directory)')
+    parser.add_argument('--output', help = 'Write the JSON results to this file instead of stdout')
+    parser.add_argument('--thresholds', default = THRESHOLDS, help = 'JSON file of {benchmark: maximum median us/op}')
+    parser.add_argument('--baseline', help = 'Results file of an earlier run to compare against')
+    parser.add_argument('--tolerance', type = float, default = 0.25, help = 'Allowed slowdown against --baseline (default: 0.25)')
+    parser.add_argument('--repeat', type = int, default = 5, help = 'Timing repeats per benchmark (default: 5)')
+    parser.add_argument('--only', action = 'append', help = 'Only run benchmarks starting with this name, can be repeated')
+    parser.add_argument('--quick', action = 'store_true', help = 'Small fixtures and fewer repeats, for a smoke test')
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        repeat, min_time, bulk_sizes = QUICK['repeat'], QUICK['min_time'], QUICK['bulk']
+    else:
+        repeat, min_time, bulk_sizes = args.repeat, 0.2, BULK_SIZES
+    with tempfile.TemporaryDirectory() as scratch:
+        fixtures = args.fixtures or scratch
+        if not os.path.exists(os.path.join(fixtures, 'manifest.json')):
+            os.makedirs(fixtures, exist_ok = True)
+            if args.quick:
+                record_synthetic(fixtures, items = QUICK['items'], players = QUICK['players'])
+            else:
+                record_synthetic(fixtures)
+        source = manifest(fixtures)['source']
+        results = run(fixtures, repeat, bulk_sizes, args.only, lambda line: print(line, file = sys.stderr), min_time)
+
+    thresholds = None
+    if args.thresholds:
+        with open(args.thresholds, 'r') as f:
+            thresholds = json.load(f)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)['results']
+
+    report = {
+        'schema': SCHEMA,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'osrsbytes': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'fixtures': source,
+        'results': results,
+        'regressions': check(results, thresholds, baseline, args.tolerance),
+    }
+    text = json.dumps(report, indent = 1, sort_keys = True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    for regression in report['regressions']:
+        print("REGRESSION {name}: {median} us/op > {limit} ({against})".format(**regression), file = sys.stderr)
+    return 1 if report['regressions'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())